@@ -5,8 +5,12 @@ import importlib
 import time
 import math
 import uuid
-from typing import Optional
+import zlib
+from collections import Counter
+from types import MappingProxyType
+from typing import NamedTuple, Optional
 from datetime import datetime, timedelta
+from itertools import islice
 
 # 🔥 MAP KEY GENERATOR - Forces Plotly to destroy old figure
 def get_fresh_map_key(prefix: str = "map") -> str:
@@ -24,10 +28,16 @@ import streamlit as st
 # import plotly.express as px  # Deferred to chart rendering
 # import requests  # Deferred to geo functions
 
-# Light imports only
+# Kept eager on purpose: module-level tables below are built with NumPy/pandas,
+# and every tab body except the gated COO dashboard still runs on each rerun -
+# the Sender tab (the default) builds DataFrames - so a lazy import here would
+# only move the cost, not remove it.
 import pandas as pd
 import numpy as np
 
+# Static state list (plain Python data) - imported once here rather than inside per-shipment loops
+from app.core.india_states import INDIA_STATES
+
 # ==================================================
 # PERFORMANCE HELPER (Staff+ mandate: guarded reruns)
 # ==================================================
@@ -59,6 +69,7 @@ def quick_rerun():
 # LAZY IMPORT HELPERS (Staff+ mandate: defer heavy imports)
 # ==================================================
 _PLOTLY = None
+_PLOTLY_GO = None
 _PYDECK = None
 _REQUESTS = None
 
@@ -70,6 +81,14 @@ def get_plotly():
         _PLOTLY = px
     return _PLOTLY
 
+def get_plotly_go():
+    """Lazy import plotly.graph_objects - only when a raw trace is rendered"""
+    global _PLOTLY_GO
+    if _PLOTLY_GO is None:
+        import plotly.graph_objects as go
+        _PLOTLY_GO = go
+    return _PLOTLY_GO
+
 def get_pydeck():
     """Lazy import pydeck - only when map is rendered"""
     global _PYDECK
@@ -269,7 +288,8 @@ def get_event_sourcing():
             reconstruct_shipment_state,
             EventType,
             Actor,
-            get_audit_report
+            get_audit_report,
+            get_log_version
         )
         st.session_state.event_sourcing = {
             'generate_shipment_id': generate_shipment_id,
@@ -280,7 +300,8 @@ def get_event_sourcing():
             'reconstruct_shipment_state': reconstruct_shipment_state,
             'EventType': EventType,
             'Actor': Actor,
-            'get_audit_report': get_audit_report
+            'get_audit_report': get_audit_report,
+            'get_log_version': get_log_version
         }
     return st.session_state.event_sourcing
 
@@ -457,6 +478,7 @@ def transition_shipment(shipment_id: str, to_state, actor=None, **kwargs):
                 # Handle override reason
                 if kwargs.get("override_reason"):
                     ship["override_reason"] = kwargs.get("override_reason")
+                ShipmentFlowStore._bump_version()
     except Exception:
         # Don't fail the transition if flow store update fails
         pass
@@ -497,6 +519,9 @@ def clear_shipment_cache():
 def reconstruct_shipment_state(*args, **kwargs):
     return get_event_sourcing()['reconstruct_shipment_state'](*args, **kwargs)
 
+def get_event_log_version():
+    return get_event_sourcing()['get_log_version']()
+
 def get_audit_report(*args, **kwargs):
     return get_event_sourcing()['get_audit_report'](*args, **kwargs)
 
@@ -1114,6 +1139,10 @@ def compute_risk_fast(shipment_id, delivery_type="NORMAL", weight_kg=5.0, **kwar
 def get_daily_seed(*args, **kwargs):
     return get_fluctuation_functions()['get_daily_seed'](*args, **kwargs)
 
+def stable_hash(text: str) -> int:
+    '''Process-independent string hash for seeding - builtin hash() is salted per interpreter'''
+    return zlib.crc32(text.encode("utf-8"))
+
 def compute_risk_score_realistic(shipment_id="", base_risk=40, delivery_type="NORMAL", weight_kg=5.0, **kwargs):
     '''⚡ OPTIMIZED: Now uses fast heuristic instead of AI engine'''
     # Use fast path for display purposes
@@ -3561,6 +3590,35 @@ EVENT_TO_STAGE = {
 }
 
 
+
+# Flow store stages the COO dashboard folds into its in-transit / delivered KPIs
+FLOW_IN_TRANSIT_STAGES = ("SYSTEM_DISPATCH", "OUT_FOR_DELIVERY", "WAREHOUSE")
+FLOW_DELIVERED_STAGES = ("DELIVERED", "CUSTOMER_CONFIRMED")
+
+
+def sum_keys(counter: Counter, keys) -> int:
+    """Total of several Counter buckets - Counter returns 0 for missing keys, so no .get() default"""
+    return sum(counter[k] for k in keys)
+
+
+class FlowStoreSnapshot(NamedTuple):
+    """Flow store aggregates gathered in one pass - see ShipmentFlowStore.snapshot()"""
+    total: int
+    stage_counts: Counter
+    sla_counts: dict
+    high_risk_count: int
+    shipments: list  # (shipment_id, ship) sorted by last_updated DESC
+
+
+class FlowStoreArrays(NamedTuple):
+    """Flow store fields as parallel NumPy arrays - see ShipmentFlowStore.as_arrays()"""
+    shipment_ids: np.ndarray
+    stages: np.ndarray
+    risk_scores: np.ndarray  # float32
+    sla_statuses: np.ndarray
+    priorities: np.ndarray
+
+
 class ShipmentFlowStore:
     """
     Central shipment flow ledger.
@@ -3573,6 +3631,16 @@ class ShipmentFlowStore:
         if 'shipment_flow' not in st.session_state:
             st.session_state.shipment_flow = {}
     
+    @staticmethod
+    def version() -> int:
+        """Monotonic mutation counter - changes whenever the flow store is written"""
+        return st.session_state.get("shipment_flow_version", 0)
+    
+    @staticmethod
+    def _bump_version():
+        """Mark the flow store as changed so version-keyed caches rebuild"""
+        st.session_state.shipment_flow_version = st.session_state.get("shipment_flow_version", 0) + 1
+    
     @staticmethod
     def add_shipment(
         shipment_id: str,
@@ -3623,6 +3691,7 @@ class ShipmentFlowStore:
                 }
             ]
         }
+        ShipmentFlowStore._bump_version()
         
         return st.session_state.shipment_flow[shipment_id]
     
@@ -3675,6 +3744,7 @@ class ShipmentFlowStore:
             "role": actor_role or ship["current_role"],
             "override_reason": override_reason
         })
+        ShipmentFlowStore._bump_version()
         
         # 🔔 EMIT NOTIFICATIONS based on lifecycle stage
         # ═══════════════════════════════════════════════
@@ -3694,15 +3764,23 @@ class ShipmentFlowStore:
         """
         Get all shipments from the flow store.
         Returns list sorted by last_updated DESC by default.
+        The sorted order is cached per store version - only re-sorted after a write.
         """
         ShipmentFlowStore._ensure_initialized()
         
-        shipments = list(st.session_state.shipment_flow.items())
+        if not sorted_by_latest:
+            return list(st.session_state.shipment_flow.items())
         
-        if sorted_by_latest:
+        version = ShipmentFlowStore.version()
+        cached = st.session_state.get("_shipment_flow_sorted")
+        if cached is None or cached[0] != version:
+            shipments = list(st.session_state.shipment_flow.items())
             shipments.sort(key=lambda x: x[1].get("last_updated", ""), reverse=True)
+            cached = (version, shipments)
+            st.session_state._shipment_flow_sorted = cached
         
-        return shipments
+        # Callers get their own list - the cached order stays intact
+        return list(cached[1])
     
     @staticmethod
     def get_shipment(shipment_id: str) -> dict:
@@ -3731,11 +3809,11 @@ class ShipmentFlowStore:
         ]
     
     @staticmethod
-    def count_by_stage() -> dict:
-        """Count shipments at each lifecycle stage"""
+    def count_by_stage() -> Counter:
+        """Count shipments at each lifecycle stage (Counter - missing stages read as 0)"""
         ShipmentFlowStore._ensure_initialized()
         
-        counts = {stage: 0 for stage in SHIPMENT_LIFECYCLE_STAGES}
+        counts = Counter({stage: 0 for stage in SHIPMENT_LIFECYCLE_STAGES})
         for ship in st.session_state.shipment_flow.values():
             stage = ship.get("stage", "CREATED")
             if stage in counts:
@@ -3754,27 +3832,25 @@ class ShipmentFlowStore:
                 counts[status] += 1
         return counts
     
-    @staticmethod
-    def get_high_risk_shipments(threshold: int = 70) -> list:
-        """Get shipments with risk score above threshold"""
-        ShipmentFlowStore._ensure_initialized()
-        
-        return [
-            (sid, ship) for sid, ship in st.session_state.shipment_flow.items()
-            if ship.get("risk_score", 0) >= threshold
-        ]
-    
     @staticmethod
     def sync_from_event_log():
         """
         Sync shipment_flow store from the event log.
         Called once on initialization to populate existing shipments.
+        Skipped entirely while the event log version is unchanged.
         """
         ShipmentFlowStore._ensure_initialized()
         
+        # ⚡ Widget-only reruns don't touch the log - skip the full sync pass
+        log_version = get_event_log_version()
+        if st.session_state.get("_flow_sync_version") == log_version:
+            return
+        
         # Get all shipments from event log
         try:
-            all_shipments = get_all_shipments_by_state()
+            # Log advanced - read fresh state rather than a possibly stale cache entry
+            all_shipments = get_all_shipments_by_state(bypass_cache=True)
+            added = False
             
             for ship_state in all_shipments:
                 sid = ship_state['shipment_id']
@@ -3853,6 +3929,11 @@ class ShipmentFlowStore:
                     "last_updated": ship_state.get('last_updated', datetime.now().isoformat()),
                     "transitions": transitions if transitions else [{"from_stage": None, "to_stage": "CREATED", "timestamp": timestamps.get("created", ""), "role": "SENDER"}]
                 }
+                added = True
+            
+            if added:
+                ShipmentFlowStore._bump_version()
+            st.session_state._flow_sync_version = log_version
         except Exception as e:
             # Silently fail - flow store will be populated as shipments are created
             pass
@@ -3862,6 +3943,59 @@ class ShipmentFlowStore:
         """Get total number of shipments in flow store"""
         ShipmentFlowStore._ensure_initialized()
         return len(st.session_state.shipment_flow)
+    
+    @staticmethod
+    def snapshot(high_risk_threshold: int = 70) -> FlowStoreSnapshot:
+        """
+        Total, stage/SLA counts, high-risk count and the sorted shipment list in one call.
+        Same values as the individual getters; cached per store version.
+        """
+        ShipmentFlowStore._ensure_initialized()
+        
+        cache_key = (ShipmentFlowStore.version(), high_risk_threshold)
+        cached = st.session_state.get("_shipment_flow_snapshot")
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        
+        # ⚡ Counts are vectorized reductions over the version-cached column arrays
+        arrays = ShipmentFlowStore.as_arrays()
+        stage_counts = Counter({stage: int(np.count_nonzero(arrays.stages == stage)) for stage in SHIPMENT_LIFECYCLE_STAGES})
+        sla_counts = {status: int(np.count_nonzero(arrays.sla_statuses == status)) for status in ("ON_TRACK", "WATCH", "AT_RISK", "COMPLETED")}
+        
+        snap = FlowStoreSnapshot(
+            total=len(arrays.stages),
+            stage_counts=stage_counts,
+            sla_counts=sla_counts,
+            high_risk_count=int(np.count_nonzero(arrays.risk_scores >= high_risk_threshold)),
+            shipments=ShipmentFlowStore.get_all_shipments(sorted_by_latest=True),
+        )
+        st.session_state._shipment_flow_snapshot = (cache_key, snap)
+        return snap
+    
+    @staticmethod
+    def as_arrays() -> FlowStoreArrays:
+        """
+        Column (SoA) view of the flow store: one NumPy array per field, in store order.
+        Rebuilt only after a write - cached per store version.
+        """
+        ShipmentFlowStore._ensure_initialized()
+        
+        version = ShipmentFlowStore.version()
+        cached = st.session_state.get("_shipment_flow_arrays")
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        ships = st.session_state.shipment_flow
+        values = ships.values()
+        arrays = FlowStoreArrays(
+            shipment_ids=np.array(list(ships), dtype=str),
+            stages=np.array([ship.get("stage", "CREATED") for ship in values], dtype=str),
+            risk_scores=np.fromiter((ship.get("risk_score", 0) for ship in values), dtype=np.float32, count=len(ships)),
+            sla_statuses=np.array([ship.get("sla_status", "ON_TRACK") for ship in values], dtype=str),
+            priorities=np.array([ship.get("priority", "NORMAL") for ship in values], dtype=str),
+        )
+        st.session_state._shipment_flow_arrays = (version, arrays)
+        return arrays
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -4279,14 +4413,10 @@ class GlobalShipmentContext:
         if shipments is None:
             shipments = get_all_shipments_cached()
         
-        counts = {stage: 0 for stage in GlobalShipmentContext.LIFECYCLE_ORDER}
-        
-        for ship in shipments.values():
-            state = ship.get('current_state', 'CREATED')
-            if state in counts:
-                counts[state] += 1
-            else:
-                counts['CREATED'] += 1
+        # ⚡ Single C-level pass; unknown states fold into CREATED afterwards
+        raw = Counter(ship.get('current_state', 'CREATED') for ship in shipments.values())
+        counts = {stage: raw.pop(stage, 0) for stage in GlobalShipmentContext.LIFECYCLE_ORDER}
+        counts['CREATED'] += sum(raw.values())
         
         return counts
 
@@ -4530,6 +4660,299 @@ REALISTIC_ROUTE_PAIRS = [
     ("Assam", "West Bengal"),
 ]
 
+class ViewerTableRow(NamedTuple):
+    """One Executive Viewer table row - tuples ingest into pandas without per-row key lookups"""
+    shipment_id: str
+    source_state: str
+    destination_state: str
+    stage: str
+    sla: str
+    risk: int
+    priority: str
+    raw_state: str
+
+
+VIEWER_TABLE_COLUMNS = ["Shipment ID", "source_state", "destination_state", "Stage", "SLA", "Risk", "Priority", "raw_state"]
+
+# 📊 MANDATORY DISTRIBUTIONS shared by the Viewer table and COO snapshot
+# SLA: 40% At Risk, 20% Warning, 40% On Track | Priority: 40% EXPRESS, 60% NORMAL
+# Cumulative weights let random.choices skip rebuilding the CDF on every call
+SLA_OPTIONS = ("At Risk", "Warning", "On Track")
+SLA_CUM_WEIGHTS = (40, 60, 100)
+SLA_PROBS = (0.4, 0.2, 0.4)
+PRIORITY_OPTIONS = ("EXPRESS", "NORMAL")
+PRIORITY_CUM_WEIGHTS = (40, 100)
+PRIORITY_PROBS = (0.4, 0.6)
+
+# Lifecycle state -> friendly stage name (read-only module table, one definition site)
+VIEWER_STAGE_LABELS = MappingProxyType({
+    "CREATED": "Created",
+    "MANAGER_APPROVED": "Approved",
+    "SUPERVISOR_APPROVED": "Supervisor OK",
+    "IN_TRANSIT": "In Transit",
+    "WAREHOUSE_INTAKE": "At Warehouse",
+    "RECEIVER_ACKNOWLEDGED": "Acknowledged",
+    "OUT_FOR_DELIVERY": "Out for Delivery",
+    "DELIVERED": "Delivered",
+})
+COO_STAGE_LABELS = MappingProxyType({
+    "CREATED": "Created",
+    "MANAGER_APPROVED": "Approved",
+    "SUPERVISOR_APPROVED": "Approved",
+    "IN_TRANSIT": "In Transit",
+    "WAREHOUSE_INTAKE": "At Warehouse",
+    "OUT_FOR_DELIVERY": "Out for Delivery",
+    "DELIVERED": "Delivered",
+})
+# Viewer detail card shares the COO table - only the CREATED label is spelled out
+VIEWER_DETAIL_STAGE_LABELS = MappingProxyType({**COO_STAGE_LABELS, "CREATED": "Order Created"})
+CUSTOMER_STAGE_LABELS = MappingProxyType({
+    "CREATED": "Processing",
+    "MANAGER_APPROVED": "Confirmed",
+    "SUPERVISOR_APPROVED": "Confirmed",
+    "IN_TRANSIT": "On the way",
+    "WAREHOUSE_INTAKE": "Near you",
+    "OUT_FOR_DELIVERY": "Almost there",
+    "DELIVERED": "Delivered",
+})
+
+# Indexed by (count > 1) - keeps pluralization out of the template branches
+PLURAL_SUFFIX = ("", "s")
+
+# Executive Viewer insight cards - only the counts are substituted per rerun
+VIEWER_HIGH_RISK_CARD = (
+    '<div class="exec-insight-card" style="background: #FEF2F2; border-color: #FECACA;">'
+    '<div class="exec-insight-text" style="color: #991B1B;">⚠️ {n} shipment{s} currently at elevated SLA risk</div>'
+    '</div>'
+)
+# Static - emitted verbatim when no shipment is at elevated risk
+VIEWER_ALL_CLEAR_CARD = (
+    '<div class="exec-insight-card" style="background: #F0FDF4; border-color: #BBF7D0;">'
+    '<div class="exec-insight-text" style="color: #065F46;">✅ All shipments within acceptable SLA thresholds</div>'
+    '</div>'
+)
+VIEWER_ON_TRACK_CARD = (
+    '<div class="exec-insight-card">'
+    '<div class="exec-insight-text">📈 {pct}% of deliveries currently on track</div>'
+    '</div>'
+)
+VIEWER_IN_TRANSIT_CARD = (
+    '<div class="exec-insight-card">'
+    '<div class="exec-insight-text">🚚 {n} shipments actively in transit nationwide</div>'
+    '</div>'
+)
+
+# COO Executive Dashboard stylesheet - authoritative, calm, boardroom-ready
+COO_DASHBOARD_CSS = """
+<style>
+.coo-header {
+    background: #F5F3FF;
+    border-radius: 16px;
+    padding: 1.5rem 2rem;
+    margin-bottom: 1.5rem;
+    border: 1px solid #E9D5FF;
+}
+.coo-header h1 {
+    color: #5B21B6;
+    font-size: 1.75rem;
+    font-weight: 700;
+    margin: 0 0 0.25rem 0;
+}
+.coo-header p {
+    color: #7C3AED;
+    font-size: 0.95rem;
+    margin: 0;
+    opacity: 0.85;
+}
+.coo-kpi-card {
+    background: white;
+    border-radius: 14px;
+    padding: 1.5rem;
+    border: 1px solid #E5E7EB;
+    text-align: center;
+    height: 100%;
+}
+.coo-kpi-value {
+    font-size: 2.5rem;
+    font-weight: 700;
+    line-height: 1.1;
+    margin-bottom: 0.25rem;
+}
+.coo-kpi-value-primary { color: #5B21B6; }
+.coo-kpi-value-blue { color: #2563EB; }
+.coo-kpi-value-green { color: #059669; }
+.coo-kpi-value-amber { color: #D97706; }
+.coo-kpi-value-red { color: #DC2626; }
+.coo-kpi-label {
+    font-size: 0.85rem;
+    color: #6B7280;
+    font-weight: 500;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+.coo-health-card {
+    background: white;
+    border-radius: 14px;
+    padding: 1.5rem;
+    border: 1px solid #E5E7EB;
+}
+.coo-health-indicator {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    gap: 0.75rem;
+    padding: 1rem;
+    border-radius: 12px;
+    margin-bottom: 1rem;
+}
+.coo-health-good {
+    background: #F0FDF4;
+    border: 1px solid #BBF7D0;
+}
+.coo-health-caution {
+    background: #FFFBEB;
+    border: 1px solid #FDE68A;
+}
+.coo-health-critical {
+    background: #FEF2F2;
+    border: 1px solid #FECACA;
+}
+.coo-health-text {
+    font-size: 1.1rem;
+    font-weight: 600;
+}
+.coo-health-good .coo-health-text { color: #065F46; }
+.coo-health-caution .coo-health-text { color: #92400E; }
+.coo-health-critical .coo-health-text { color: #991B1B; }
+.coo-insight-card {
+    background: #F5F3FF;
+    border-radius: 12px;
+    padding: 1.25rem;
+    border: 1px solid #E9D5FF;
+    height: 100%;
+}
+.coo-insight-icon {
+    font-size: 1.5rem;
+    margin-bottom: 0.5rem;
+}
+.coo-insight-text {
+    color: #5B21B6;
+    font-size: 0.95rem;
+    font-weight: 500;
+    line-height: 1.4;
+}
+.coo-risk-bar {
+    height: 8px;
+    border-radius: 4px;
+    background: #E5E7EB;
+    overflow: hidden;
+    margin-top: 0.5rem;
+}
+.coo-risk-fill {
+    height: 100%;
+    border-radius: 4px;
+}
+.coo-risk-low { background: #10B981; }
+.coo-risk-medium { background: #F59E0B; }
+.coo-risk-high { background: #EF4444; }
+.coo-alert-card {
+    background: #FEF2F2;
+    border-radius: 12px;
+    padding: 1rem 1.25rem;
+    border: 1px solid #FECACA;
+    margin-bottom: 0.5rem;
+}
+.coo-alert-text {
+    color: #991B1B;
+    font-size: 0.9rem;
+    font-weight: 500;
+}
+.coo-snapshot-row {
+    background: white;
+    border-radius: 10px;
+    padding: 0.75rem 1rem;
+    border: 1px solid #E5E7EB;
+    margin-bottom: 0.5rem;
+}
+.coo-badge {
+    padding: 0.3rem 0.6rem;
+    border-radius: 12px;
+    font-size: 0.75rem;
+    font-weight: 600;
+}
+.coo-badge-green { background: #D1FAE5; color: #065F46; }
+.coo-badge-amber { background: #FEF3C7; color: #92400E; }
+.coo-badge-red { background: #FEE2E2; color: #991B1B; }
+.coo-badge-blue { background: #DBEAFE; color: #1E40AF; }
+.coo-badge-purple { background: #F3E8FF; color: #6D28D9; }
+.coo-section-title {
+    font-size: 1.1rem;
+    font-weight: 600;
+    color: #374151;
+    margin-bottom: 1rem;
+}
+.coo-read-only-badge {
+    background: #EFF6FF;
+    color: #1E40AF;
+    padding: 0.25rem 0.75rem;
+    border-radius: 12px;
+    font-size: 0.75rem;
+    font-weight: 600;
+    display: inline-block;
+    border: 1px solid #BFDBFE;
+}
+</style>
+"""
+
+# Shared read-only fallback for missing origin/destination blocks - no per-shipment {} allocation
+EMPTY_LOCATION = MappingProxyType({})
+
+# Lifecycle states the COO dashboard counts as "in transit"
+COO_TRANSIT_STATES = frozenset({"IN_TRANSIT", "OUT_FOR_DELIVERY", "WAREHOUSE_INTAKE"})
+
+# ⚡ Synthetic corridor axes defined next to the state list - helpers index these instead of calling len() or building an array per call.
+# Sorted: INDIA_STATES lists the union territories last, but the heatmap axes are alphabetical (as in the snapshot path)
+INDIA_STATE_LABELS = np.asarray(sorted(INDIA_STATES))
+N_INDIA_STATES = len(INDIA_STATES)
+
+# Salt for the synthetic corridor grid's seed - one module constant, stable across processes unlike hash()
+COO_CORRIDORS_SALT = stable_hash("coo_corridors")
+
+# ⚡ Static corridor heatmap styling - one definition site, splatted into the trace and layout each render
+# (outer mappings are read-only; Plotly's validators need the nested values as plain dicts)
+COO_HEATMAP_TRACE_STYLE = MappingProxyType({
+    "colorscale": "RdYlGn_r",
+    "zmin": 0,
+    "zmax": 1,
+    "zsmooth": False,
+    "hoverongaps": False,
+    "colorbar": {"title": "Risk"},
+})
+COO_HEATMAP_LAYOUT = MappingProxyType({
+    "xaxis_title": "Destination",
+    "yaxis": {"title": "Origin", "autorange": "reversed"},  # first origin on top, as imshow drew it
+    "height": 400,
+    "margin": {"l": 20, "r": 20, "t": 20, "b": 20},
+    "paper_bgcolor": "white",
+    "plot_bgcolor": "white",
+})
+
+
+def corridor_mean_grid(src_idx, dst_idx, values, n_src, n_dst):
+    '''Mean of values per (src, dst) cell as a float32 grid, trimmed to observed rows/cols - returns (grid, row_mask, col_mask)'''
+    # ⚡ Scatter-mean over flat cell codes: two bincounts replace the grouped pivot + reshape
+    flat = src_idx * n_dst + dst_idx
+    cells = n_src * n_dst
+    sums = np.bincount(flat, weights=values, minlength=cells).reshape(n_src, n_dst)
+    counts = np.bincount(flat, minlength=cells).reshape(n_src, n_dst)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        grid = np.where(counts > 0, sums / counts, np.nan).astype(np.float32)
+    
+    # Keep only observed origins/destinations (same grid the pandas pivot produced)
+    row_mask = counts.any(axis=1)
+    col_mask = counts.any(axis=0)
+    return grid[np.ix_(row_mask, col_mask)], row_mask, col_mask
+
 # High-risk corridor definitions for COO heatmap (expanded for bigger visualization)
 HIGH_RISK_CORRIDORS = [
     {"from": "Kolkata", "to": "Hyderabad", "risk": 67, "impact": "Weather Delays"},
@@ -4542,6 +4965,304 @@ HIGH_RISK_CORRIDORS = [
     {"from": "Surat", "to": "Rajkot", "risk": 38, "impact": "Low Capacity"},
 ]
 
+# ⚡ Static config - display name and risk colours are derived here, next to the data, so the render loop only reads them
+for _corridor in HIGH_RISK_CORRIDORS:
+    _corridor["name"] = f"{_corridor['from']} → {_corridor['to']}"
+    if _corridor["risk"] >= 70:
+        _corridor["badge_class"], _corridor["bar_color"] = "coo-badge-red", "#EF4444"
+    elif _corridor["risk"] >= 55:
+        _corridor["badge_class"], _corridor["bar_color"] = "coo-badge-amber", "#F59E0B"
+    else:
+        _corridor["badge_class"], _corridor["bar_color"] = "coo-badge-yellow", "#EAB308"
+del _corridor
+
+HIGH_RISK_CORRIDOR_NAMES = [c["name"] for c in HIGH_RISK_CORRIDORS]
+
+# Compliance & Audit Center stylesheet - formal, neutral, trustworthy
+COMPLIANCE_CSS = """
+<style>
+.compliance-header {
+    background: #F8FAFC;
+    border-radius: 16px;
+    padding: 1.5rem 2rem;
+    margin-bottom: 1.5rem;
+    border: 1px solid #E2E8F0;
+}
+.compliance-header h1 {
+    color: #334155;
+    font-size: 1.75rem;
+    font-weight: 700;
+    margin: 0 0 0.25rem 0;
+}
+.compliance-header p {
+    color: #64748B;
+    font-size: 0.95rem;
+    margin: 0;
+}
+.compliance-kpi-grid {
+    display: grid;
+    grid-template-columns: repeat(5, 1fr);
+    gap: 1rem;
+}
+.compliance-policy-grid {
+    display: grid;
+    grid-template-columns: repeat(3, 1fr);
+    gap: 1rem;
+}
+.compliance-kpi-card {
+    background: white;
+    border-radius: 12px;
+    padding: 1.25rem;
+    border: 1px solid #E2E8F0;
+    text-align: center;
+    height: 100%;
+}
+.compliance-kpi-value {
+    font-size: 2.25rem;
+    font-weight: 700;
+    line-height: 1.1;
+    color: #1E293B;
+}
+.compliance-kpi-value-neutral { color: #475569; }
+.compliance-kpi-value-green { color: #059669; }
+.compliance-kpi-value-amber { color: #D97706; }
+.compliance-kpi-value-red { color: #DC2626; }
+.compliance-kpi-label {
+    font-size: 0.8rem;
+    color: #64748B;
+    font-weight: 500;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    margin-top: 0.5rem;
+}
+.audit-log-container {
+    background: white;
+    border-radius: 12px;
+    padding: 1rem;
+    border: 1px solid #E2E8F0;
+}
+.audit-event-row {
+    background: #FAFAFA;
+    border-radius: 8px;
+    padding: 0.75rem 1rem;
+    margin-bottom: 0.5rem;
+    border: 1px solid #E5E7EB;
+    display: flex;
+    align-items: center;
+}
+.audit-timestamp {
+    font-family: 'SF Mono', 'Monaco', monospace;
+    font-size: 0.8rem;
+    color: #64748B;
+    min-width: 150px;
+}
+.audit-shipment-id {
+    font-family: 'SF Mono', 'Monaco', monospace;
+    font-weight: 600;
+    color: #5B21B6;
+    font-size: 0.85rem;
+    min-width: 140px;
+}
+.audit-event-badge {
+    padding: 0.25rem 0.6rem;
+    border-radius: 10px;
+    font-size: 0.75rem;
+    font-weight: 600;
+}
+.audit-badge-created { background: #EFF6FF; color: #1E40AF; }
+.audit-badge-approved { background: #F0FDF4; color: #065F46; }
+.audit-badge-transit { background: #FFFBEB; color: #92400E; }
+.audit-badge-delivered { background: #D1FAE5; color: #065F46; }
+.audit-badge-override { background: #FEF2F2; color: #991B1B; }
+.audit-role-badge {
+    background: #F5F3FF;
+    color: #6D28D9;
+    padding: 0.2rem 0.5rem;
+    border-radius: 8px;
+    font-size: 0.75rem;
+    font-weight: 500;
+}
+.timeline-card {
+    background: white;
+    border-radius: 12px;
+    padding: 1.25rem;
+    border: 1px solid #E2E8F0;
+}
+.timeline-event {
+    display: flex;
+    gap: 1rem;
+    padding: 0.75rem 0;
+    border-bottom: 1px solid #F1F5F9;
+}
+.timeline-event:last-child {
+    border-bottom: none;
+}
+.timeline-dot {
+    width: 12px;
+    height: 12px;
+    border-radius: 50%;
+    margin-top: 4px;
+    flex-shrink: 0;
+}
+.timeline-dot-complete { background: #10B981; }
+.timeline-dot-active { background: #3B82F6; }
+.timeline-dot-pending { background: #D1D5DB; }
+.timeline-content {
+    flex: 1;
+}
+.timeline-event-type {
+    font-weight: 600;
+    color: #1E293B;
+    font-size: 0.9rem;
+}
+.timeline-meta {
+    font-size: 0.8rem;
+    color: #64748B;
+    margin-top: 0.25rem;
+}
+.policy-card {
+    background: #F8FAFC;
+    border-radius: 12px;
+    padding: 1.25rem;
+    border: 1px solid #E2E8F0;
+    height: 100%;
+}
+.policy-icon {
+    font-size: 1.5rem;
+    margin-bottom: 0.5rem;
+}
+.policy-text {
+    color: #334155;
+    font-size: 0.9rem;
+    font-weight: 500;
+}
+.policy-status {
+    font-size: 0.8rem;
+    color: #64748B;
+    margin-top: 0.25rem;
+}
+.export-card {
+    background: #F5F3FF;
+    border-radius: 12px;
+    padding: 1.5rem;
+    border: 1px solid #E9D5FF;
+}
+.export-button {
+    background: white;
+    border: 2px solid #DDD6FE;
+    border-radius: 10px;
+    padding: 1rem 1.5rem;
+    text-align: center;
+    cursor: pointer;
+    transition: all 0.2s;
+}
+.export-button:hover {
+    border-color: #8B5CF6;
+    background: #FAF5FF;
+}
+.export-icon {
+    font-size: 1.5rem;
+    margin-bottom: 0.5rem;
+}
+.export-label {
+    font-weight: 600;
+    color: #5B21B6;
+    font-size: 0.9rem;
+}
+.immutable-badge {
+    background: #F0FDF4;
+    color: #065F46;
+    padding: 0.2rem 0.5rem;
+    border-radius: 8px;
+    font-size: 0.7rem;
+    font-weight: 600;
+    border: 1px solid #BBF7D0;
+}
+.compliance-read-only-badge {
+    background: #F1F5F9;
+    color: #475569;
+    padding: 0.25rem 0.75rem;
+    border-radius: 12px;
+    font-size: 0.75rem;
+    font-weight: 600;
+    display: inline-block;
+    border: 1px solid #CBD5E1;
+}
+.section-title {
+    font-size: 1rem;
+    font-weight: 600;
+    color: #334155;
+    margin-bottom: 1rem;
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+}
+</style>
+"""
+
+# ⚡ Compliance row templates - formatted per row and joined into one st.markdown per panel
+COMPLIANCE_OVERRIDE_ROW = (
+    '<div class="audit-event-row">'
+    '<span class="audit-timestamp">{ts}</span>'
+    '<span class="audit-shipment-id">{sid}</span>'
+    '<span class="audit-event-badge audit-badge-override">OVERRIDE</span>'
+    '<span style="margin-left: 0.5rem; color: #991B1B; font-size: 0.85rem;">{reason}</span>'
+    '</div>'
+)
+COMPLIANCE_ALERT_ROW = (
+    '<div style="background: #FEF2F2; border-radius: 8px; padding: 0.75rem; margin-bottom: 0.5rem; border: 1px solid #FECACA;">'
+    '<div style="font-size: 0.8rem; color: #991B1B; font-weight: 500;">{message}</div>'
+    '<div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">{ts}</div>'
+    '</div>'
+)
+COMPLIANCE_KPI_CARD = (
+    '<div class="compliance-kpi-card">'
+    '<div class="compliance-kpi-value {value_class}">{value}</div>'
+    '<div class="compliance-kpi-label">{label}</div>'
+    '</div>'
+)
+COMPLIANCE_POLICY_CARD = (
+    '<div class="policy-card"{card_style}>'
+    '<div class="policy-icon">{icon}</div>'
+    '<div class="policy-text"{text_style}>{text}</div>'
+    '<div class="policy-status">{status}</div>'
+    '</div>'
+)
+COMPLIANCE_POLICY_OK = ' style="background: #F0FDF4; border-color: #BBF7D0;"', ' style="color: #065F46;"'
+COMPLIANCE_POLICY_ALERT = ' style="background: #FEF2F2; border-color: #FECACA;"', ' style="color: #991B1B;"'
+COMPLIANCE_EXPORT_STATS = (
+    '<div class="export-card">'
+    '<p style="color: #5B21B6; margin: 0 0 1rem 0; font-weight: 500;">'
+    'Generate official compliance reports for audit and regulatory purposes'
+    '</p>'
+    '</div>'
+    '<div style="background: #F8FAFC; border-radius: 10px; padding: 1rem; margin: 1rem 0; border: 1px solid #E2E8F0;">'
+    '<div style="display: flex; justify-content: space-around; text-align: center;">'
+    '<div>'
+    '<div style="font-size: 1.25rem; font-weight: 700; color: #334155;">{records}</div>'
+    '<div style="font-size: 0.8rem; color: #64748B;">Records Available</div>'
+    '</div>'
+    '<div>'
+    '<div style="font-size: 1.25rem; font-weight: 700; color: #334155;">{events}</div>'
+    '<div style="font-size: 0.8rem; color: #64748B;">Total Events</div>'
+    '</div>'
+    '<div>'
+    '<div style="font-size: 1.25rem; font-weight: 700; color: #334155;">CSV / JSON</div>'
+    '<div style="font-size: 0.8rem; color: #64748B;">Export Formats</div>'
+    '</div>'
+    '</div>'
+    '</div>'
+)
+COMPLIANCE_TIMELINE_ROW = (
+    '<div class="timeline-event">'
+    '<div class="timeline-dot {dot_class}"></div>'
+    '<div class="timeline-content">'
+    '<div class="timeline-event-type">{event_type}</div>'
+    '<div class="timeline-meta">{ts} • {role} • {current} → {next_state}</div>'
+    '</div>'
+    '</div>'
+)
+
 # Compliance event templates
 COMPLIANCE_EVENT_TEMPLATES = [
     {"event": "SHIPMENT_CREATED", "role": "SENDER", "transition": ("Created", "Pending Approval")},
@@ -4557,6 +5278,73 @@ COMPLIANCE_EVENT_TEMPLATES = [
     {"event": "AUDIT_REVIEW", "role": "COMPLIANCE", "transition": ("Flagged", "Under Review")},
 ]
 
+# Audit log frame layout - display columns first, then the badge and sort-key helpers
+AUDIT_DISPLAY_COLUMNS = ["Timestamp", "Shipment ID", "Route", "Event", "Role", "Action"]
+AUDIT_LOG_COLUMNS = AUDIT_DISPLAY_COLUMNS + ["badge_class", "_sort_ts"]
+
+# Human-readable flow stage names for the audit "Action" column (read-only module table, one definition site)
+AUDIT_STAGE_NAMES = MappingProxyType({
+    "CREATED": "Created",
+    "SENDER_MANAGER": "Mgr Approved",
+    "SENDER_SUPERVISOR": "Sup Approved",
+    "SYSTEM_DISPATCH": "Dispatched",
+    "RECEIVER_MANAGER": "Recv Mgr",
+    "WAREHOUSE": "Warehouse",
+    "OUT_FOR_DELIVERY": "Out for Delivery",
+    "DELIVERED": "Delivered",
+    "CUSTOMER_CONFIRMED": "Confirmed",
+    "COMPLIANCE_LOGGED": "Logged",
+})
+
+# Ordered (pattern, badge) rules - first match wins, anything else is "created"
+FLOW_AUDIT_BADGE_RULES = (
+    ("CREATED", "audit-badge-created"),
+    ("APPROVED|MANAGER|SUPERVISOR", "audit-badge-approved"),
+    ("DISPATCH|TRANSIT", "audit-badge-transit"),
+    ("DELIVERED|CONFIRMED", "audit-badge-delivered"),
+    ("OVERRIDE|WAREHOUSE", "audit-badge-override"),
+)
+EVENT_AUDIT_BADGE_RULES = (
+    ("CREATED", "audit-badge-created"),
+    ("APPROVED", "audit-badge-approved"),
+    ("TRANSIT|DISPATCHED", "audit-badge-transit"),
+    ("DELIVERED", "audit-badge-delivered"),
+    ("OVERRIDE", "audit-badge-override"),
+)
+
+
+def format_audit_timestamps(ts: pd.Series, missing: str) -> pd.Series:
+    """Column-wise `ts[:19].replace("T", " ")` for audit timestamps; empty values become `missing`"""
+    text = ts.map(str)  # str() per value, like the old f-strings (astype(str) maps None to NaN on pandas 3)
+    head = text.str.slice(0, 19)
+    display = head.where(text.str.len() < 19, head.str.replace("T", " ", regex=False))
+    return display.mask(ts.isna() | (ts == ""), missing)
+
+
+def audit_stage_labels(stages: pd.Series) -> pd.Series:
+    """Human-readable stage names, falling back to the raw stage text like dict.get(stage, stage)"""
+    labels = stages.map(AUDIT_STAGE_NAMES)
+    return labels.where(labels.notna(), stages.map(str))
+
+
+def classify_audit_badges(events: pd.Series, rules) -> np.ndarray:
+    """Badge class per event - the substring rules run once per distinct stage, rows take from that table"""
+    # ⚡ A log has a handful of distinct stages; factorize, classify the uniques, then one take()
+    codes, uniques = pd.factorize(events)
+    unique_events = pd.Series(uniques, dtype=object)
+    badge_table = np.select(
+        [unique_events.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool) for pattern, _ in rules],
+        [badge for _, badge in rules],
+        default="audit-badge-created"
+    )
+    # Missing stages (code -1) fall through to the default, like the old if/elif chain's else
+    return np.append(badge_table, "audit-badge-created")[codes]
+
+
+def sort_audit_log(audit_df: pd.DataFrame) -> pd.DataFrame:
+    """Newest first - stable descending sort, matching list.sort(key=str(ts), reverse=True)"""
+    return audit_df.sort_values("_sort_ts", ascending=False, kind="mergesort", ignore_index=True)
+
 
 def get_realistic_route(shipment_id: str, seed_base: int = None) -> tuple:
     """
@@ -4565,9 +5353,8 @@ def get_realistic_route(shipment_id: str, seed_base: int = None) -> tuple:
     """
     if seed_base is None:
         seed_base = get_daily_seed()
-    rng = random.Random(hash(shipment_id) + seed_base)
-    route = rng.choice(REALISTIC_ROUTE_PAIRS)
-    return route
+    # ⚡ Index straight from a stable hash - no Mersenne Twister state allocated and seeded per call
+    return REALISTIC_ROUTE_PAIRS[stable_hash(f"{shipment_id}:{seed_base}") % len(REALISTIC_ROUTE_PAIRS)]
 
 
 def compute_dynamic_risk(shipment_id: str, stage: str, priority: str, seed_base: int = None) -> int:
@@ -4669,6 +5456,65 @@ def get_compliance_event_details(event_type: str, current_state: str = None) ->
     return {"role": "SYSTEM", "transition": ("Processing", "Updated")}
 
 
+# Synthetic audit padding lookup tables - one row per template event, indexed by a batch draw
+SYNTHETIC_AUDIT_EVENTS = np.array([t["event"] for t in COMPLIANCE_EVENT_TEMPLATES], dtype=object)
+SYNTHETIC_AUDIT_ROLES = np.array(
+    [get_compliance_event_details(e)["role"] for e in SYNTHETIC_AUDIT_EVENTS], dtype=object
+)
+SYNTHETIC_AUDIT_ACTIONS = np.array(
+    ["{} → {}".format(*get_compliance_event_details(e)["transition"]) for e in SYNTHETIC_AUDIT_EVENTS], dtype=object
+)
+SYNTHETIC_AUDIT_BADGES = classify_audit_badges(
+    pd.Series(SYNTHETIC_AUDIT_EVENTS), EVENT_AUDIT_BADGE_RULES[:-1] + (("OVERRIDE|ESCALAT", "audit-badge-override"),)
+).astype(object)
+
+
+# Compliance shipment export (CSV column order)
+EXPORT_SHIPMENT_COLUMNS = [
+    "Shipment_ID", "Current_State", "Source_State", "Destination_State",
+    "Weight_KG", "Delivery_Type", "Event_Count", "Created_At"
+]
+
+
+def synthetic_export_meta(shipment_id: str) -> tuple:
+    '''Placeholder (source_state, dest_state, weight_kg) for export rows missing them'''
+    # ⚡ One adler32 per shipment, sliced into three indices (was three salted hash() calls)
+    seed = zlib.adler32(shipment_id.encode("utf-8"))
+    src_idx = seed % N_INDIA_STATES
+    dst_idx = (seed >> 8) % N_INDIA_STATES
+    if dst_idx == src_idx:
+        dst_idx = (dst_idx + 1) % N_INDIA_STATES
+    weight_seed = (seed >> 16) % 1000
+    return INDIA_STATES[src_idx], INDIA_STATES[dst_idx], round(2.0 + (weight_seed / 1000.0) * 78.0, 1)
+
+
+@st.cache_data(ttl=300, max_entries=2, show_spinner=False)
+def synthetic_audit_rows(daily_seed: int) -> pd.DataFrame:
+    '''50-80 synthetic audit events used to pad a thin audit log - cached per daily seed.
+
+    st.cache_data rather than lru_cache: this script is re-executed on every rerun, so only
+    Streamlit's cache outlives a run. It is shared across sessions for at most 5 minutes (ttl),
+    so the "0.5-72h ago" timestamps stay anchored near now; each caller gets its own copy.
+    '''
+    # ⚡ One batch draw per column instead of ~4 Python RNG calls + a template scan per row
+    synthetic_rng = np.random.default_rng((daily_seed + stable_hash("audit_log_synthetic")) & 0xFFFFFFFF)
+    n_synthetic = int(synthetic_rng.integers(50, 81))
+    type_idx = synthetic_rng.integers(0, len(SYNTHETIC_AUDIT_EVENTS), n_synthetic)
+    hours_ago = synthetic_rng.uniform(0.5, 72, n_synthetic)
+    sid_nums = synthetic_rng.integers(1000, 10000, n_synthetic)
+    
+    synthetic_ts = pd.Timestamp.now() - pd.to_timedelta(hours_ago, unit="h")
+    return pd.DataFrame({
+        "Timestamp": synthetic_ts.strftime("%Y-%m-%d %H:%M:%S"),
+        "Shipment ID": np.char.add("SHIP-", sid_nums.astype(str)),
+        "Event": SYNTHETIC_AUDIT_EVENTS[type_idx],
+        "Role": SYNTHETIC_AUDIT_ROLES[type_idx],
+        "Action": SYNTHETIC_AUDIT_ACTIONS[type_idx],
+        "badge_class": SYNTHETIC_AUDIT_BADGES[type_idx],
+        "_sort_ts": synthetic_ts.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+    }, dtype=object).reindex(columns=AUDIT_LOG_COLUMNS)
+
+
 def get_fluctuating_kpi(base_value: float, variance_pct: float = 3.0, seed_offset: int = 0) -> float:
     """
     DEMO MODE – Get a value that fluctuates subtly over time
@@ -4902,7 +5748,24 @@ tab_names = [
     "📊 Compliance",
 ]
 
-main_tabs = st.tabs(tab_names)
+# ⚡ LAZY TABS: with tab state tracking, switching tabs reruns and only the selected tab's .open is True
+try:
+    main_tabs = st.tabs(tab_names, key="main_nav_tab", on_change="rerun")
+except TypeError:
+    # Older Streamlit without tab state tracking - every tab body runs as before
+    main_tabs = st.tabs(tab_names)
+
+def container_is_open(container) -> bool:
+    """True for the selected tab / expanded expander - and always when .open is unavailable"""
+    return getattr(container, "open", None) is not False
+
+def lazy_expander(label: str, key: str, expanded: bool = False):
+    """Expander that reruns on toggle so a collapsed body can be skipped via container_is_open()"""
+    try:
+        return st.expander(label, expanded=expanded, key=key, on_change="rerun")
+    except TypeError:
+        # Older Streamlit without expander state tracking - body always runs
+        return st.expander(label, expanded=expanded)
 
 # ⚡ PERFORMANCE: Helper function to track tab loading
 def track_tab_load(tab_name):
@@ -10245,16 +11108,7 @@ with main_tabs[2]:
             else:
                 eta_display = eta_date
             
-            stage_names = {
-                "CREATED": "Processing",
-                "MANAGER_APPROVED": "Confirmed",
-                "SUPERVISOR_APPROVED": "Confirmed",
-                "IN_TRANSIT": "On the way",
-                "WAREHOUSE_INTAKE": "Near you",
-                "OUT_FOR_DELIVERY": "Almost there",
-                "DELIVERED": "Delivered"
-            }
-            current_stage = stage_names.get(current_state, "In progress")
+            current_stage = CUSTOMER_STAGE_LABELS.get(current_state, "In progress")
             
             # On-time status
             on_time = "On Track" if current_state != "DELIVERED" else "On Time"
@@ -10636,57 +11490,75 @@ with main_tabs[3]:
         sorted_shipments = get_all_shipments_sorted_desc()
         return dict(sorted_shipments[:200])  # Limit to 200 for performance
     
-    # 🌐 MERGE: Get shipments from BOTH event log AND flow store
-    event_shipments = get_viewer_shipments()
-    flow_shipments = ShipmentFlowStore.get_all_shipments(sorted_by_latest=True)
-    
-    # Convert flow shipments to standard format and merge
-    shipments = {}
-    
-    # First add flow store shipments (these are always most recent)
-    for sid, ship in flow_shipments:
-        origin = ship.get("origin", {})
-        dest = ship.get("destination", {})
-        
-        shipments[sid] = {
-            "current_state": ship.get("stage", "CREATED"),
-            "source_state": origin.get("state", origin.get("full", "")),
-            "destination_state": dest.get("state", dest.get("full", "")),
-            "origin_full": origin.get("full", f"{origin.get('city', '')}, {origin.get('state', '')}"),
-            "destination_full": dest.get("full", f"{dest.get('city', '')}, {dest.get('state', '')}"),
-            "risk_score": ship.get("risk_score", 30),
-            "sla_status": ship.get("sla_status", "ON_TRACK"),
-            "priority": ship.get("priority", "NORMAL"),
-            "last_updated": ship.get("last_updated", ""),
-            "transitions": ship.get("transitions", []),
-            "history": [
-                {
-                    "timestamp": t.get("timestamp", ""),
-                    "event_type": t.get("to_stage", ""),
-                    "role": t.get("role", "SYSTEM"),
-                    "metadata": {"override_reason": t.get("override_reason")} if t.get("override_reason") else {}
-                }
-                for t in ship.get("transitions", [])
-            ]
-        }
+    def build_viewer_shipments():
+        """Merge flow store + event log shipments into the viewer record format"""
+        # 🌐 MERGE: Get shipments from BOTH event log AND flow store
+        event_shipments = get_viewer_shipments()
+        flow_shipments = ShipmentFlowStore.get_all_shipments(sorted_by_latest=True)
+        
+        # Convert flow shipments to standard format and merge
+        shipments = {}
+        
+        # First add flow store shipments (these are always most recent)
+        for sid, ship in flow_shipments:
+            origin = ship.get("origin", {})
+            dest = ship.get("destination", {})
+            
+            shipments[sid] = {
+                "current_state": ship.get("stage", "CREATED"),
+                "source_state": origin.get("state", origin.get("full", "")),
+                "destination_state": dest.get("state", dest.get("full", "")),
+                "origin_full": origin.get("full", f"{origin.get('city', '')}, {origin.get('state', '')}"),
+                "destination_full": dest.get("full", f"{dest.get('city', '')}, {dest.get('state', '')}"),
+                "risk_score": ship.get("risk_score", 30),
+                "sla_status": ship.get("sla_status", "ON_TRACK"),
+                "priority": ship.get("priority", "NORMAL"),
+                "last_updated": ship.get("last_updated", ""),
+                "transitions": ship.get("transitions", []),
+                "history": [
+                    {
+                        "timestamp": t.get("timestamp", ""),
+                        "event_type": t.get("to_stage", ""),
+                        "role": t.get("role", "SYSTEM"),
+                        "metadata": {"override_reason": t.get("override_reason")} if t.get("override_reason") else {}
+                    }
+                    for t in ship.get("transitions", [])
+                ]
+            }
+        
+        # Then merge event log shipments (don't overwrite flow store entries)
+        for sid, ship in event_shipments.items():
+            if sid not in shipments:
+                shipments[sid] = ship
+        
+        return shipments
     
-    # Then merge event log shipments (don't overwrite flow store entries)
-    for sid, ship in event_shipments.items():
-        if sid not in shipments:
-            shipments[sid] = ship
+    # ⚡ Rebuild the merge only when the flow store or event log changed (60s TTL, session-scoped)
+    merge_key = (ShipmentFlowStore.version(), get_event_log_version())
+    merge_cache = st.session_state.get("_viewer_merge_cache")
+    if merge_cache and merge_cache[0] == merge_key and time.time() - merge_cache[1] < 60:
+        shipments = merge_cache[2]
+    else:
+        shipments = build_viewer_shipments()
+        st.session_state._viewer_merge_cache = (merge_key, time.time(), shipments)
+    
+    # ⚡ One daily seed shared by every zone of this tab
+    daily_seed = get_daily_seed()
     
     # If still no shipments, generate synthetic data
     if not shipments:
-        daily_seed = get_daily_seed()
-        rng = random.Random(daily_seed + hash("viewer_shipments"))
-        from app.core.india_states import INDIA_STATES
+        shipments = {}  # Fresh dict - never mutate the cached merge
+        rng = random.Random(daily_seed + stable_hash("viewer_shipments"))
+        n_states = N_INDIA_STATES
         
         # Generate 5-10 synthetic shipments for viewer
         for i in range(rng.randint(5, 10)):
             synthetic_id = f"SHIP-{rng.randint(1000, 9999)}"
             
-            source_state = rng.choice(INDIA_STATES)
-            dest_state = rng.choice([s for s in INDIA_STATES if s != source_state])
+            # ⚡ Destination by modular offset - uniform over the other states, no per-row list rebuild
+            src_i = rng.randrange(n_states)
+            source_state = INDIA_STATES[src_i]
+            dest_state = INDIA_STATES[(src_i + rng.randrange(1, n_states)) % n_states]
             
             states = ["CREATED", "MANAGER_APPROVED", "IN_TRANSIT", "WAREHOUSE_INTAKE", "OUT_FOR_DELIVERY", "DELIVERED"]
             current_state = rng.choice(states)
@@ -10807,8 +11679,7 @@ with main_tabs[3]:
     
     # ✅ REALISTIC DISTRIBUTION: Ensure no stage shows 0
     # Real-world logistics always has shipments at every stage
-    daily_seed = get_daily_seed()
-    stage_rng = random.Random(daily_seed + hash("stage_distribution"))
+    stage_rng = random.Random(daily_seed + stable_hash("stage_distribution"))
     
     # Base distribution percentages for a healthy logistics operation
     # Created: 8-15%, Approved: 5-10%, Supervisor: 3-8%, In Transit: 15-25%,
@@ -10843,7 +11714,6 @@ with main_tabs[3]:
         stage_counts[stage] = max(min_count, int(stage_counts[stage] * (1 + fluctuation)))
     
     st.markdown("**📈 Lifecycle Stage Distribution**")
-    stage_cols = st.columns(len(stage_counts))
     stage_labels = {
         "CREATED": ("📝", "Created"),
         "MANAGER_APPROVED": ("✅", "Approved"),
@@ -10855,16 +11725,17 @@ with main_tabs[3]:
         "DELIVERED": ("🎉", "Delivered")
     }
     
-    for idx, (stage, count) in enumerate(stage_counts.items()):
-        icon, label = stage_labels.get(stage, ("•", stage))
-        with stage_cols[idx]:
-            st.markdown(f"""
-            <div style="text-align: center; padding: 0.5rem; background: #F9FAFB; border-radius: 8px; border: 1px solid #E5E7EB;">
-                <div style="font-size: 1.25rem;">{icon}</div>
-                <div style="font-size: 1.1rem; font-weight: 600; color: #1F2937;">{count}</div>
-                <div style="font-size: 0.65rem; color: #6B7280;">{label}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    # ⚡ Single flex row = one markdown delta instead of one per stage column
+    stage_cards = "".join(
+        f'<div style="flex: 1; text-align: center; padding: 0.5rem; background: #F9FAFB; border-radius: 8px; border: 1px solid #E5E7EB;">'
+        f'<div style="font-size: 1.25rem;">{icon}</div>'
+        f'<div style="font-size: 1.1rem; font-weight: 600; color: #1F2937;">{count}</div>'
+        f'<div style="font-size: 0.65rem; color: #6B7280;">{label}</div>'
+        f'</div>'
+        for stage, count in stage_counts.items()
+        for icon, label in (stage_labels.get(stage, ("•", stage)),)
+    )
+    st.markdown(f'<div style="display: flex; gap: 0.5rem;">{stage_cards}</div>', unsafe_allow_html=True)
     
     st.markdown("<div style='height: 1rem'></div>", unsafe_allow_html=True)
     
@@ -10886,49 +11757,31 @@ with main_tabs[3]:
     
     # 🌐 READ FROM GLOBAL SHIPMENT_FLOW STORE
     table_data = []
-    daily_seed = get_daily_seed()
-    table_rng = random.Random(daily_seed + hash("viewer_table_v2"))
-    
-    # 📊 MANDATORY DISTRIBUTIONS:
-    # SLA: 40% At Risk, 20% Warning, 40% On Track
-    # Risk: 20-80 range
-    # Priority: 40% EXPRESS, 60% NORMAL
-    SLA_OPTIONS = ["At Risk", "Warning", "On Track"]
-    SLA_WEIGHTS = [40, 20, 40]  # Exact 40/20/40 distribution
-    PRIORITY_OPTIONS = ["EXPRESS", "NORMAL"]
-    PRIORITY_WEIGHTS = [40, 60]  # Exact 40/60 distribution
-    
-    # Map state to friendly name
-    stage_map = {
-        "CREATED": "Created",
-        "MANAGER_APPROVED": "Approved",
-        "SUPERVISOR_APPROVED": "Supervisor OK",
-        "IN_TRANSIT": "In Transit",
-        "WAREHOUSE_INTAKE": "At Warehouse",
-        "RECEIVER_ACKNOWLEDGED": "Acknowledged",
-        "OUT_FOR_DELIVERY": "Out for Delivery",
-        "DELIVERED": "Delivered"
-    }
+    table_rng = random.Random(daily_seed + stable_hash("viewer_table_v2"))
+    
+    # 📊 MANDATORY DISTRIBUTIONS: module-level SLA_* / PRIORITY_* constants
+    # (SLA 40/20/40, Risk 20-80, Priority 40/60)
+    
+    # ⚡ Pre-bind bound methods used once per row
+    add_row = table_data.append
+    stage_label = VIEWER_STAGE_LABELS.get
     
     for idx, (sid, ship) in enumerate(shipments.items()):
         # ✅ READ actual state from shipment data
         state = ship.get("current_state", "CREATED")
-        stage = stage_map.get(state, state)
+        stage = stage_label(state, state)
         
         # 📊 EXACT PRIORITY DISTRIBUTION: 40% EXPRESS, 60% NORMAL
         # Use deterministic seed per shipment for consistency
-        ship_rng = random.Random(daily_seed + hash(sid) + idx)
-        priority = ship_rng.choices(PRIORITY_OPTIONS, weights=PRIORITY_WEIGHTS, k=1)[0]
+        ship_rng = random.Random(daily_seed + stable_hash(sid) + idx)
+        priority = ship_rng.choices(PRIORITY_OPTIONS, cum_weights=PRIORITY_CUM_WEIGHTS, k=1)[0]
         
         # ✅ REALISTIC ROUTES – Read from data or generate deterministically
         stored_source = ship.get("source_state")
         stored_dest = ship.get("destination_state")
         
-        if stored_source and stored_dest and stored_source != "N/A" and stored_dest != "N/A":
-            source_display = stored_source[:15]
-            dest_display = stored_dest[:15]
-        else:
-            source_display, dest_display = get_realistic_route(sid, daily_seed + idx)
+        if not (stored_source and stored_dest and stored_source != "N/A" and stored_dest != "N/A"):
+            stored_source, stored_dest = get_realistic_route(sid, daily_seed + idx)
         
         # 📊 EXACT RISK RANGE: 20-80 (uniform distribution)
         risk = ship_rng.randint(20, 80)
@@ -10938,77 +11791,70 @@ with main_tabs[3]:
         if state == "DELIVERED":
             sla_status = "Completed"
         else:
-            sla_status = ship_rng.choices(SLA_OPTIONS, weights=SLA_WEIGHTS, k=1)[0]
-        
-        table_data.append({
-            "Shipment ID": sid,
-            "Route": f"{source_display} → {dest_display}",
-            "Stage": stage,
-            "SLA": sla_status,
-            "Risk": risk,
-            "Priority": priority,
-            "raw_state": state
-        })
+            sla_status = ship_rng.choices(SLA_OPTIONS, cum_weights=SLA_CUM_WEIGHTS, k=1)[0]
+        
+        add_row(ViewerTableRow(sid, stored_source, stored_dest, stage, sla_status, risk, priority, state))
     
     # ✅ NO SORTING - Keep original order (newest shipments from flow store appear FIRST)
     # Flow store shipments are already sorted by latest first in the merge above
     
     # Display as styled dataframe
     if table_data:
-        df = pd.DataFrame(table_data)
+        n_total = len(table_data)  # > 0 inside this branch - no division guard needed
+        df = pd.DataFrame(table_data, columns=VIEWER_TABLE_COLUMNS)
+        # ⚡ Categorical Stage: comparisons/counts run on small int codes, not strings
+        df["Stage"] = df["Stage"].astype("category")
+        # ⚡ Route label built column-wise instead of one f-string per row
+        df["Route"] = df["source_state"].str.slice(0, 15) + " → " + df["destination_state"].str.slice(0, 15)
         
-        # Style function for the dataframe
-        def style_exec_table(row):
-            styles = [''] * len(row)
+        # Style function for the dataframe - whole-frame, one np.select per column
+        def style_exec_table(frame):
+            styles = pd.DataFrame('', index=frame.index, columns=frame.columns)
             
             # Stage column styling
-            stage = row['Stage']
-            if stage == 'Delivered':
-                styles[2] = 'background-color: #D1FAE5; color: #065F46;'
-            elif stage == 'In Transit':
-                styles[2] = 'background-color: #FEF3C7; color: #92400E;'
-            elif stage == 'Out for Delivery':
-                styles[2] = 'background-color: #DBEAFE; color: #1E40AF;'
-            elif stage == 'At Warehouse':
-                styles[2] = 'background-color: #FFF7ED; color: #9A3412;'
-            else:
-                styles[2] = 'background-color: #F5F3FF; color: #6D28D9;'
+            stage = frame['Stage'].to_numpy()
+            styles['Stage'] = np.select(
+                [stage == 'Delivered', stage == 'In Transit', stage == 'Out for Delivery', stage == 'At Warehouse'],
+                ['background-color: #D1FAE5; color: #065F46;',
+                 'background-color: #FEF3C7; color: #92400E;',
+                 'background-color: #DBEAFE; color: #1E40AF;',
+                 'background-color: #FFF7ED; color: #9A3412;'],
+                default='background-color: #F5F3FF; color: #6D28D9;'
+            )
             
             # SLA column styling
-            sla = row['SLA']
-            if sla == 'Completed':
-                styles[3] = 'background-color: #D1FAE5; color: #065F46;'
-            elif sla == 'At Risk':
-                styles[3] = 'background-color: #FEE2E2; color: #991B1B;'
-            elif sla == 'Warning':
-                styles[3] = 'background-color: #FEF3C7; color: #92400E;'
-            else:
-                styles[3] = 'background-color: #D1FAE5; color: #065F46;'
+            sla = frame['SLA'].to_numpy()
+            styles['SLA'] = np.select(
+                [sla == 'Completed', sla == 'At Risk', sla == 'Warning'],
+                ['background-color: #D1FAE5; color: #065F46;',
+                 'background-color: #FEE2E2; color: #991B1B;',
+                 'background-color: #FEF3C7; color: #92400E;'],
+                default='background-color: #D1FAE5; color: #065F46;'
+            )
             
             # Risk column styling with gradient feel
-            risk = row['Risk']
-            if risk >= 70:
-                styles[4] = 'background-color: #FEE2E2; color: #991B1B; font-weight: 600;'
-            elif risk >= 50:
-                styles[4] = 'background-color: #FFEDD5; color: #C2410C;'
-            elif risk >= 35:
-                styles[4] = 'background-color: #FEF3C7; color: #92400E;'
-            else:
-                styles[4] = 'background-color: #D1FAE5; color: #065F46;'
+            risk = frame['Risk'].to_numpy()
+            styles['Risk'] = np.select(
+                [risk >= 70, risk >= 50, risk >= 35],
+                ['background-color: #FEE2E2; color: #991B1B; font-weight: 600;',
+                 'background-color: #FFEDD5; color: #C2410C;',
+                 'background-color: #FEF3C7; color: #92400E;'],
+                default='background-color: #D1FAE5; color: #065F46;'
+            )
             
             # Priority column styling
-            priority = row.get('Priority', 'NORMAL')
-            if priority == 'EXPRESS':
-                styles[5] = 'background-color: #FEE2E2; color: #B91C1C; font-weight: 600;'
-            else:
-                styles[5] = 'background-color: #F3F4F6; color: #374151;'
+            styles['Priority'] = np.where(
+                frame['Priority'].to_numpy() == 'EXPRESS',
+                'background-color: #FEE2E2; color: #B91C1C; font-weight: 600;',
+                'background-color: #F3F4F6; color: #374151;'
+            )
             
             return styles
         
         # Display with Priority column
         display_df = df[["Shipment ID", "Route", "Stage", "SLA", "Risk", "Priority"]]
         
-        styled_df = display_df.style.apply(style_exec_table, axis=1)
+        styled_df = display_df.style.apply(style_exec_table, axis=None)
         
         st.dataframe(
             styled_df,
@@ -11032,134 +11878,94 @@ with main_tabs[3]:
         # ───────────────────────────────────────────────────────────────────────────
         st.markdown("#### 🔍 Shipment Detail View")
         
-        # Shipment selector for detail view
-        selected_id = st.selectbox(
-            "Select shipment for detailed view:",
-            [d["Shipment ID"] for d in table_data],
-            key="exec_viewer_detail_select",
-            label_visibility="collapsed"
-        )
-        
-        if selected_id and selected_id in shipments:
-            ship = shipments[selected_id]
-            state = ship.get("current_state", "CREATED")
-            history = ship.get("history", [])
-            
-            # Get metadata from first event
-            metadata = history[0].get("metadata", {}) if history else {}
-            delivery_type = metadata.get("delivery_type", "NORMAL")
-            weight = metadata.get("weight_kg", round(random.Random(daily_seed + hash(selected_id)).uniform(2.5, 45.0), 1))
-            
-            # ✅ REALISTIC ROUTES for detail view
-            stored_source = ship.get("source_state")
-            stored_dest = ship.get("destination_state")
-            if stored_source and stored_dest and stored_source != "N/A" and stored_dest != "N/A":
-                source = stored_source
-                dest = stored_dest
-            else:
-                source, dest = get_realistic_route(selected_id, daily_seed)
-            
-            # ✅ DYNAMIC RISK for detail view
-            risk = compute_dynamic_risk(selected_id, state, delivery_type, daily_seed)
-            risk_color, risk_label = get_risk_display(risk)
-            
-            # Determine risk level class
-            if risk >= 70:
-                risk_class = "exec-risk-high"
-            elif risk >= 40:
-                risk_class = "exec-risk-medium"
-            else:
-                risk_class = "exec-risk-low"
-            
-            # ✅ STAGE-AWARE SLA status
-            sla_label = get_sla_status_by_stage(state, risk, daily_seed + hash(selected_id))
-            if sla_label == "Completed":
-                sla_class = "exec-sla-on-track"
-            elif sla_label == "At Risk":
-                sla_class = "exec-sla-at-risk"
-            elif sla_label == "Warning":
-                sla_class = "exec-sla-warning"
-            else:
-                sla_class = "exec-sla-on-track"
-            
-            # Stage name
-            stage_map = {
-                "CREATED": "Order Created",
-                "MANAGER_APPROVED": "Approved",
-                "SUPERVISOR_APPROVED": "Approved",
-                "IN_TRANSIT": "In Transit",
-                "WAREHOUSE_INTAKE": "At Warehouse",
-                "OUT_FOR_DELIVERY": "Out for Delivery",
-                "DELIVERED": "Delivered"
-            }
-            stage_name = stage_map.get(state, state)
-            
-            detail_cols = st.columns(3, gap="medium")
-            
-            # Row 1: Shipment ID, Route
-            with detail_cols[0]:
-                st.markdown(f"""
-                <div class="exec-detail-card">
-                    <div class="exec-detail-label">📦 Shipment ID</div>
-                    <div class="exec-detail-value" style="color: #5B21B6; font-size: 0.8rem; font-family: monospace;">{selected_id}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with detail_cols[1]:
-                st.markdown(f"""
-                <div class="exec-detail-card">
-                    <div class="exec-detail-label">📍 Route</div>
-                    <div class="exec-detail-value" style="font-size: 0.8rem;">{(source or 'N/A')[:10]} → {(dest or 'N/A')[:10]}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with detail_cols[2]:
-                st.markdown(f"""
-                <div class="exec-detail-card">
-                    <div class="exec-detail-label">🎯 Stage</div>
-                    <div class="exec-detail-value" style="font-size: 0.8rem;">{stage_name}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Row 2: Risk, SLA, Priority (with better sizing)
-            detail_cols2 = st.columns(3, gap="medium")
-            
-            with detail_cols2[0]:
-                st.markdown(f"""
-                <div class="exec-detail-card">
-                    <div class="exec-detail-label">⚠️ Risk Score</div>
-                    <div class="exec-detail-value" style="font-size: 1rem; color: {risk_color};">{risk}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with detail_cols2[1]:
-                st.markdown(f"""
-                <div class="exec-detail-card">
-                    <div class="exec-detail-label">📋 SLA Status</div>
-                    <div class="exec-detail-value"><span class="exec-badge {sla_class}" style="font-size: 0.7rem;">{sla_label}</span></div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with detail_cols2[2]:
-                st.markdown(f"""
-                <div class="exec-detail-card">
-                    <div class="exec-detail-label">⚡ Priority</div>
-                    <div class="exec-detail-value" style="font-size: 0.8rem;">{'⚡ EXPRESS' if delivery_type == 'EXPRESS' else '📦 NORMAL'}</div>
-                </div>
-                """, unsafe_allow_html=True)
+        # ⚡ Fragment: changing the selected shipment reruns only this panel, not the whole app
+        @st.fragment
+        def render_viewer_detail_panel(shipments, shipment_ids, daily_seed):
+            '''Shipment detail cards for the selected row'''
+            # Shipment selector for detail view
+            selected_id = st.selectbox(
+                "Select shipment for detailed view:",
+                shipment_ids,
+                key="exec_viewer_detail_select",
+                label_visibility="collapsed"
+            )
             
-            # Row 3: Weight (optional)
-            detail_cols3 = st.columns(3, gap="medium")
-            with detail_cols3[0]:
+            if selected_id and selected_id in shipments:
+                ship = shipments[selected_id]
+                state = ship.get("current_state", "CREATED")
+                history = ship.get("history", [])
+                
+                # Get metadata from first event
+                metadata = history[0].get("metadata", {}) if history else {}
+                delivery_type = metadata.get("delivery_type", "NORMAL")
+                weight = metadata.get("weight_kg", round(random.Random(daily_seed + stable_hash(selected_id)).uniform(2.5, 45.0), 1))
+                
+                # ✅ REALISTIC ROUTES for detail view
+                stored_source = ship.get("source_state")
+                stored_dest = ship.get("destination_state")
+                if stored_source and stored_dest and stored_source != "N/A" and stored_dest != "N/A":
+                    source = stored_source
+                    dest = stored_dest
+                else:
+                    source, dest = get_realistic_route(selected_id, daily_seed)
+                
+                # ✅ DYNAMIC RISK for detail view
+                risk = compute_dynamic_risk(selected_id, state, delivery_type, daily_seed)
+                risk_color, risk_label = get_risk_display(risk)
+                
+                # ✅ STAGE-AWARE SLA status
+                sla_label = get_sla_status_by_stage(state, risk, daily_seed + stable_hash(selected_id))
+                if sla_label == "Completed":
+                    sla_class = "exec-sla-on-track"
+                elif sla_label == "At Risk":
+                    sla_class = "exec-sla-at-risk"
+                elif sla_label == "Warning":
+                    sla_class = "exec-sla-warning"
+                else:
+                    sla_class = "exec-sla-on-track"
+                
+                # Stage name
+                stage_name = VIEWER_DETAIL_STAGE_LABELS.get(state, state)
+                
+                # ⚡ All detail cards in one CSS grid = one markdown delta instead of 7 + 3 column rows
+                priority_display = '⚡ EXPRESS' if delivery_type == 'EXPRESS' else '📦 NORMAL'
                 st.markdown(f"""
-                <div class="exec-detail-card">
-                    <div class="exec-detail-label">📦 Weight</div>
-                    <div class="exec-detail-value" style="font-size: 0.8rem;">{weight:.1f} kg</div>
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">
+                    <div class="exec-detail-card">
+                        <div class="exec-detail-label">📦 Shipment ID</div>
+                        <div class="exec-detail-value" style="color: #5B21B6; font-size: 0.8rem; font-family: monospace;">{selected_id}</div>
+                    </div>
+                    <div class="exec-detail-card">
+                        <div class="exec-detail-label">📍 Route</div>
+                        <div class="exec-detail-value" style="font-size: 0.8rem;">{(source or 'N/A')[:10]} → {(dest or 'N/A')[:10]}</div>
+                    </div>
+                    <div class="exec-detail-card">
+                        <div class="exec-detail-label">🎯 Stage</div>
+                        <div class="exec-detail-value" style="font-size: 0.8rem;">{stage_name}</div>
+                    </div>
+                    <div class="exec-detail-card">
+                        <div class="exec-detail-label">⚠️ Risk Score</div>
+                        <div class="exec-detail-value" style="font-size: 1rem; color: {risk_color};">{risk}</div>
+                    </div>
+                    <div class="exec-detail-card">
+                        <div class="exec-detail-label">📋 SLA Status</div>
+                        <div class="exec-detail-value"><span class="exec-badge {sla_class}" style="font-size: 0.7rem;">{sla_label}</span></div>
+                    </div>
+                    <div class="exec-detail-card">
+                        <div class="exec-detail-label">⚡ Priority</div>
+                        <div class="exec-detail-value" style="font-size: 0.8rem;">{priority_display}</div>
+                    </div>
+                    <div class="exec-detail-card">
+                        <div class="exec-detail-label">📦 Weight</div>
+                        <div class="exec-detail-value" style="font-size: 0.8rem;">{weight:.1f} kg</div>
+                    </div>
                 </div>
                 """, unsafe_allow_html=True)
-            
-            # Event count info
-            st.caption(f"📊 {len(history)} events recorded for this shipment")
+                
+                # Event count info
+                st.caption(f"📊 {len(history)} events recorded for this shipment")
+        
+        render_viewer_detail_panel(shipments, [d.shipment_id for d in table_data], daily_seed)
         
         st.markdown("<div style='height: 1.5rem'></div>", unsafe_allow_html=True)
         
@@ -11168,49 +11974,41 @@ with main_tabs[3]:
         # ───────────────────────────────────────────────────────────────────────────
         st.markdown("#### 💡 Operational Insights")
         
-        # Generate insights
-        high_risk_ships = [d["Shipment ID"] for d in table_data if d["Risk"] >= 70]
-        in_transit_ships = [d for d in table_data if d["Stage"] == "In Transit"]
-        delivered_ships = [d for d in table_data if d["Stage"] == "Delivered"]
+        # Generate insights - vectorized over contiguous Stage/Risk arrays, counts only
+        @st.cache_data(ttl=60, show_spinner=False)
+        def compute_viewer_insights(stage_codes, risks, in_transit_code, delivered_code):
+            '''Insight counts over SoA arrays - reruns with unchanged data are a cache hit'''
+            return (
+                int(np.count_nonzero(risks >= 70)),
+                int(np.count_nonzero(risks < 60)),
+                int(np.count_nonzero(stage_codes == in_transit_code)),
+                int(np.count_nonzero(stage_codes == delivered_code)),
+            )
         
-        insight_cols = st.columns(3)
+        # ⚡ SoA: Stage category codes + float32 instead of per-row record lookups.
+        # A label absent from this frame maps to -2, which no code (NaN is -1) can equal
+        stage_codes = {label: code for code, label in enumerate(df["Stage"].cat.categories)}
+        insight_stages = df["Stage"].cat.codes.to_numpy()
+        insight_risks = df["Risk"].to_numpy(dtype=np.float32)
+        n_high_risk, n_low_risk, n_in_transit, n_delivered = compute_viewer_insights(
+            insight_stages, insight_risks, stage_codes.get("In Transit", -2), stage_codes.get("Delivered", -2)
+        )
         
-        with insight_cols[0]:
-            if high_risk_ships:
-                st.markdown(f"""
-                <div class="exec-insight-card" style="background: #FEF2F2; border-color: #FECACA;">
-                    <div class="exec-insight-text" style="color: #991B1B;">
-                        ⚠️ {len(high_risk_ships)} shipment{'s' if len(high_risk_ships) > 1 else ''} currently at elevated SLA risk
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div class="exec-insight-card" style="background: #F0FDF4; border-color: #BBF7D0;">
-                    <div class="exec-insight-text" style="color: #065F46;">
-                        ✅ All shipments within acceptable SLA thresholds
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        with insight_cols[1]:
-            pct_on_track = round((len(delivered_ships) + len([d for d in table_data if d["Risk"] < 60])) / max(len(table_data), 1) * 100, 1)
-            st.markdown(f"""
-            <div class="exec-insight-card">
-                <div class="exec-insight-text">
-                    📈 {pct_on_track}% of deliveries currently on track
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with insight_cols[2]:
-            st.markdown(f"""
-            <div class="exec-insight-card">
-                <div class="exec-insight-text">
-                    🚚 {len(in_transit_ships)} shipments actively in transit nationwide
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        if n_high_risk:
+            risk_card = VIEWER_HIGH_RISK_CARD.format(n=n_high_risk, s=PLURAL_SUFFIX[n_high_risk > 1])
+        else:
+            risk_card = VIEWER_ALL_CLEAR_CARD
+        pct_on_track = round((n_delivered + n_low_risk) * 100.0 / n_total, 1)
+        
+        # ⚡ Three insight cards in one grid = one markdown delta instead of 3 column cells
+        st.markdown(
+            '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">'
+            f'{risk_card}'
+            f'{VIEWER_ON_TRACK_CARD.format(pct=pct_on_track)}'
+            f'{VIEWER_IN_TRANSIT_CARD.format(n=n_in_transit)}'
+            '</div>',
+            unsafe_allow_html=True
+        )
     
     else:
         st.info("📭 No shipment data available for viewing.")
@@ -11220,978 +12018,608 @@ with main_tabs[3]:
 # 🧠 COO EXECUTIVE DASHBOARD - Best-in-Class Strategic View
 # ==================================================
 with main_tabs[4]:
-    # ═══════════════════════════════════════════════════════════════════════════════
-    # 🧠 COO EXECUTIVE DASHBOARD - Boardroom-Grade Command Center
-    # ═══════════════════════════════════════════════════════════════════════════════
-    
-    # Executive Dashboard CSS - Authoritative, calm, boardroom-ready
-    st.markdown("""
-    <style>
-    .coo-header {
-        background: #F5F3FF;
-        border-radius: 16px;
-        padding: 1.5rem 2rem;
-        margin-bottom: 1.5rem;
-        border: 1px solid #E9D5FF;
-    }
-    .coo-header h1 {
-        color: #5B21B6;
-        font-size: 1.75rem;
-        font-weight: 700;
-        margin: 0 0 0.25rem 0;
-    }
-    .coo-header p {
-        color: #7C3AED;
-        font-size: 0.95rem;
-        margin: 0;
-        opacity: 0.85;
-    }
-    .coo-kpi-card {
-        background: white;
-        border-radius: 14px;
-        padding: 1.5rem;
-        border: 1px solid #E5E7EB;
-        text-align: center;
-        height: 100%;
-    }
-    .coo-kpi-value {
-        font-size: 2.5rem;
-        font-weight: 700;
-        line-height: 1.1;
-        margin-bottom: 0.25rem;
-    }
-    .coo-kpi-value-primary { color: #5B21B6; }
-    .coo-kpi-value-blue { color: #2563EB; }
-    .coo-kpi-value-green { color: #059669; }
-    .coo-kpi-value-amber { color: #D97706; }
-    .coo-kpi-value-red { color: #DC2626; }
-    .coo-kpi-label {
-        font-size: 0.85rem;
-        color: #6B7280;
-        font-weight: 500;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    .coo-health-card {
-        background: white;
-        border-radius: 14px;
-        padding: 1.5rem;
-        border: 1px solid #E5E7EB;
-    }
-    .coo-health-indicator {
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        gap: 0.75rem;
-        padding: 1rem;
-        border-radius: 12px;
-        margin-bottom: 1rem;
-    }
-    .coo-health-good {
-        background: #F0FDF4;
-        border: 1px solid #BBF7D0;
-    }
-    .coo-health-caution {
-        background: #FFFBEB;
-        border: 1px solid #FDE68A;
-    }
-    .coo-health-critical {
-        background: #FEF2F2;
-        border: 1px solid #FECACA;
-    }
-    .coo-health-text {
-        font-size: 1.1rem;
-        font-weight: 600;
-    }
-    .coo-health-good .coo-health-text { color: #065F46; }
-    .coo-health-caution .coo-health-text { color: #92400E; }
-    .coo-health-critical .coo-health-text { color: #991B1B; }
-    .coo-insight-card {
-        background: #F5F3FF;
-        border-radius: 12px;
-        padding: 1.25rem;
-        border: 1px solid #E9D5FF;
-        height: 100%;
-    }
-    .coo-insight-icon {
-        font-size: 1.5rem;
-        margin-bottom: 0.5rem;
-    }
-    .coo-insight-text {
-        color: #5B21B6;
-        font-size: 0.95rem;
-        font-weight: 500;
-        line-height: 1.4;
-    }
-    .coo-risk-bar {
-        height: 8px;
-        border-radius: 4px;
-        background: #E5E7EB;
-        overflow: hidden;
-        margin-top: 0.5rem;
-    }
-    .coo-risk-fill {
-        height: 100%;
-        border-radius: 4px;
-    }
-    .coo-risk-low { background: #10B981; }
-    .coo-risk-medium { background: #F59E0B; }
-    .coo-risk-high { background: #EF4444; }
-    .coo-alert-card {
-        background: #FEF2F2;
-        border-radius: 12px;
-        padding: 1rem 1.25rem;
-        border: 1px solid #FECACA;
-        margin-bottom: 0.5rem;
-    }
-    .coo-alert-text {
-        color: #991B1B;
-        font-size: 0.9rem;
-        font-weight: 500;
-    }
-    .coo-snapshot-row {
-        background: white;
-        border-radius: 10px;
-        padding: 0.75rem 1rem;
-        border: 1px solid #E5E7EB;
-        margin-bottom: 0.5rem;
-    }
-    .coo-badge {
-        padding: 0.3rem 0.6rem;
-        border-radius: 12px;
-        font-size: 0.75rem;
-        font-weight: 600;
-    }
-    .coo-badge-green { background: #D1FAE5; color: #065F46; }
-    .coo-badge-amber { background: #FEF3C7; color: #92400E; }
-    .coo-badge-red { background: #FEE2E2; color: #991B1B; }
-    .coo-badge-blue { background: #DBEAFE; color: #1E40AF; }
-    .coo-badge-purple { background: #F3E8FF; color: #6D28D9; }
-    .coo-section-title {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #374151;
-        margin-bottom: 1rem;
-    }
-    .coo-read-only-badge {
-        background: #EFF6FF;
-        color: #1E40AF;
-        padding: 0.25rem 0.75rem;
-        border-radius: 12px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        display: inline-block;
-        border: 1px solid #BFDBFE;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    # ───────────────────────────────────────────────────────────────────────────
-    # ZONE 1: Executive Header
-    # ───────────────────────────────────────────────────────────────────────────
-    st.markdown("""
-    <div class="role-page-header">
-        <div class="role-header-left">
-            <div class="role-header-icon">🧠</div>
-            <div class="role-header-text">
-                <h2>COO Executive Dashboard</h2>
-                <p>National logistics performance and risk overview</p>
-            </div>
-        </div>
-        <div class="role-header-status">
-            <span class="role-status-badge role-status-badge-view">🔒 STRATEGIC VIEW</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # 🌐 SYNC FLOW STORE FROM EVENT LOG (ensures latest shipments appear)
-    ShipmentFlowStore.sync_from_event_log()
-    
-    # ⚡ STAFF+ MANDATE: Heavy computation behind cache (300s TTL) with STABLE KEY
-    @st.cache_data(ttl=300, show_spinner=False)
-    def compute_coo_metrics(shipments_hash):
-        """Cache COO dashboard metrics for 5 minutes - STABLE KEY"""
-        all_shipments = get_all_shipments_cached()
-        total_count = len(all_shipments)
-        
-        if total_count == 0:
-            return None
-        
-        in_transit = sum(1 for s in all_shipments.values() if s.get("current_state") in ["IN_TRANSIT", "OUT_FOR_DELIVERY", "WAREHOUSE_INTAKE"])
-        delivered = sum(1 for s in all_shipments.values() if s.get("current_state") == "DELIVERED")
-        high_risk = sum(1 for s in all_shipments.values() if compute_risk_score(s.get("history", [])) >= 70)
-        medium_risk = sum(1 for s in all_shipments.values() if 40 <= compute_risk_score(s.get("history", [])) < 70)
-        low_risk = total_count - high_risk - medium_risk
-        
-        # Calculate on-time rate
-        on_time_rate = round((delivered / max(total_count, 1)) * 100 + random.Random(get_daily_seed()).uniform(10, 20), 1)
-        on_time_rate = min(on_time_rate, 97.5)
-        
-        return {
-            'total_count': total_count,
-            'in_transit': in_transit,
-            'delivered': delivered,
-            'high_risk': high_risk,
-            'medium_risk': medium_risk,
-            'low_risk': low_risk,
-            'on_time_rate': on_time_rate,
-            'sla_breach_risk': round((high_risk / max(total_count, 1)) * 100, 1)
-        }
-    
-    # DEMO MODE – Use synchronized demo state for consistent metrics across all views
-    demo_state = get_synchronized_metrics()
-    
-    # 🌐 GET DATA FROM FLOW STORE (primary) + Event Log (backup)
-    flow_count = ShipmentFlowStore.get_total_count()
-    flow_stage_counts = ShipmentFlowStore.count_by_stage()
-    flow_sla_counts = ShipmentFlowStore.count_by_sla_status()
-    flow_high_risk = len(ShipmentFlowStore.get_high_risk_shipments(70))
-    
-    # Load data from event log
-    event_log_shipments = get_all_shipments_cached()
-    
-    # 🌐 MERGE: Flow store shipments FIRST (newest), then event log
-    # This ensures newly created shipments appear at TOP
-    all_shipments = {}
-    
-    # First add flow store shipments (these are always most recent)
-    flow_shipments = ShipmentFlowStore.get_all_shipments(sorted_by_latest=True)
-    for sid, ship in flow_shipments:
-        origin = ship.get("origin", {})
-        dest = ship.get("destination", {})
-        all_shipments[sid] = {
-            "current_state": ship.get("stage", "CREATED"),
-            "source_state": origin.get("state", origin.get("full", "")),
-            "destination_state": dest.get("state", dest.get("full", "")),
-            "priority": ship.get("priority", "NORMAL"),
-            "risk_score": ship.get("risk_score", 30),
-            "sla_status": ship.get("sla_status", "ON_TRACK"),
-            "last_updated": ship.get("last_updated", ""),
-            "history": []
-        }
-    
-    # Then merge event log shipments (don't overwrite flow store entries)
-    for sid, ship in event_log_shipments.items():
-        if sid not in all_shipments:
-            all_shipments[sid] = ship
-    
-    shipments_hash = hash(tuple(sorted(all_shipments.keys()))) + flow_count  # Include flow count in hash
-    metrics = compute_coo_metrics(shipments_hash)
-    
-    # 🌐 MERGE FLOW STORE DATA into metrics
-    if flow_count > 0:
-        # Use flow store data which is always most current
-        if metrics:
-            metrics['total_count'] = max(metrics['total_count'], flow_count)
-            metrics['high_risk'] = max(metrics['high_risk'], flow_high_risk)
-            metrics['in_transit'] = max(metrics['in_transit'], 
-                flow_stage_counts.get("SYSTEM_DISPATCH", 0) + 
-                flow_stage_counts.get("OUT_FOR_DELIVERY", 0) + 
-                flow_stage_counts.get("WAREHOUSE", 0))
-            metrics['delivered'] = max(metrics['delivered'], 
-                flow_stage_counts.get("DELIVERED", 0) + 
-                flow_stage_counts.get("CUSTOMER_CONFIRMED", 0))
-    
-    # DEMO MODE – Merge with synchronized demo state for visual consistency
-    if not metrics:
-        metrics = {
-            'total_count': demo_state['total_shipments'],
-            'in_transit': demo_state['in_transit'],
-            'delivered': demo_state['delivered_today'],
-            'high_risk': demo_state['high_risk_count'],
-            'medium_risk': int(demo_state['total_shipments'] * 0.25),
-            'low_risk': int(demo_state['total_shipments'] * 0.55),
-            'on_time_rate': demo_state['on_time_delivery_rate'],
-            'sla_breach_risk': demo_state['at_risk_percentage']
-        }
-    else:
-        # DEMO MODE – Override with synchronized values for demo consistency
-        metrics['total_count'] = demo_state['total_shipments']
-        metrics['high_risk'] = demo_state['high_risk_count']
-        metrics['on_time_rate'] = demo_state['on_time_delivery_rate']
-        metrics['sla_breach_risk'] = demo_state['at_risk_percentage']
-    
-    # ───────────────────────────────────────────────────────────────────────────
-    # ZONE 2: Executive KPI Strip (ENHANCED with fluctuating KPIs)
-    # ───────────────────────────────────────────────────────────────────────────
-    st.markdown('<div class="coo-section-title">📊 Key Performance Indicators</div>', unsafe_allow_html=True)
-    
-    # ✅ FLUCTUATING KPIs – Subtle time-based variations
-    daily_seed = get_daily_seed()
-    active_shipments_kpi = int(get_fluctuating_kpi(metrics['total_count'], 3, daily_seed))
-    on_time_rate_kpi = get_fluctuating_kpi(metrics['on_time_rate'], 1.5, daily_seed + 1)
-    sla_breach_kpi = get_fluctuating_kpi(metrics['sla_breach_risk'], 5, daily_seed + 2)
-    delivered_kpi = int(get_fluctuating_kpi(metrics['delivered'], 8, daily_seed + 3))
-    
-    kpi_cols = st.columns(5)
-    
-    with kpi_cols[0]:
-        st.markdown(f"""
-        <div class="coo-kpi-card">
-            <div class="coo-kpi-value coo-kpi-value-primary">{active_shipments_kpi:,}</div>
-            <div class="coo-kpi-label">Active Shipments</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_cols[1]:
-        st.markdown(f"""
-        <div class="coo-kpi-card">
-            <div class="coo-kpi-value coo-kpi-value-green">{on_time_rate_kpi:.1f}%</div>
-            <div class="coo-kpi-label">On-Time Rate</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_cols[2]:
-        st.markdown(f"""
-        <div class="coo-kpi-card">
-            <div class="coo-kpi-value coo-kpi-value-amber">{sla_breach_kpi:.1f}%</div>
-            <div class="coo-kpi-label">SLA Breach Risk</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_cols[3]:
-        # ✅ HIGH-RISK CORRIDORS from predefined data
-        high_risk_corridors = len(HIGH_RISK_CORRIDORS)
-        
-        st.markdown(f"""
-        <div class="coo-kpi-card">
-            <div class="coo-kpi-value coo-kpi-value-red">{high_risk_corridors}</div>
-            <div class="coo-kpi-label">High-Risk Corridors</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_cols[4]:
-        st.markdown(f"""
-        <div class="coo-kpi-card">
-            <div class="coo-kpi-value coo-kpi-value-blue">{delivered_kpi}</div>
-            <div class="coo-kpi-label">Delivered Today</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("<div style='height: 1rem'></div>", unsafe_allow_html=True)
-    
-    # ─────────────────────────────────────────────────────────────────────────────
-    # ZONE 2.5: COO NOTIFICATIONS & AUDIT FEED (PART 6 – GlobalShipmentContext sync)
-    # ─────────────────────────────────────────────────────────────────────────────
-    coo_notifications = NotificationBus.get_notifications_for_role("COO", limit=5)
-    
-    if coo_notifications:
-        st.markdown('<div class="coo-section-title">🔔 Executive Alerts</div>', unsafe_allow_html=True)
-        
-        alert_cols = st.columns([2, 1])
-        
-        with alert_cols[0]:
-            for notif in coo_notifications[:3]:
-                event_icon = "✅" if "DELIVERED" in notif['event_type'] else "⚠️" if "OVERRIDE" in notif['event_type'] else "📋"
-                st.markdown(f"""
-                <div class="coo-alert-card" style="background: {'#D1FAE5' if 'DELIVERED' in notif['event_type'] else '#FEF2F2'}; border-color: {'#A7F3D0' if 'DELIVERED' in notif['event_type'] else '#FECACA'};">
-                    <div class="coo-alert-text" style="color: {'#065F46' if 'DELIVERED' in notif['event_type'] else '#991B1B'};">
-                        {event_icon} {notif['message'][:100]}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+    # ⚡ Lazy tab: skip the whole dashboard body unless the COO tab is the selected one
+    if container_is_open(main_tabs[4]):
+        # ═══════════════════════════════════════════════════════════════════════════════
+        # 🧠 COO EXECUTIVE DASHBOARD - Boardroom-Grade Command Center
+        # ═══════════════════════════════════════════════════════════════════════════════
         
-        with alert_cols[1]:
-            # Show override summary
-            overrides_today = DailyOpsCalculator.get_overrides_today()
-            st.markdown(f"""
-            <div style="background: #FEF3C7; border-radius: 12px; padding: 1rem; border: 1px solid #FDE68A;">
-                <div style="font-weight: 600; color: #92400E; font-size: 0.9rem;">⚠️ Overrides Today</div>
-                <div style="font-size: 1.5rem; font-weight: 700; color: #D97706;">{len(overrides_today)}</div>
-                <div style="font-size: 0.75rem; color: #B45309;">Requires compliance review</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    st.markdown("<div style='height: 1rem'></div>", unsafe_allow_html=True)
-    
-    # ───────────────────────────────────────────────────────────────────────────
-    # ZONE 3: National Health Overview (ENHANCED with realistic distribution)
-    # ───────────────────────────────────────────────────────────────────────────
-    health_col, risk_col = st.columns([1, 1.5])  # Wider heatmap column
-    
-    with health_col:
-        st.markdown('<div class="coo-section-title">🏥 National Logistics Health</div>', unsafe_allow_html=True)
-        
-        # ✅ REALISTIC RISK DISTRIBUTION: 60-70% low, 20-30% medium, 5-12% high
-        total = metrics['total_count']
-        rng = random.Random(daily_seed + hash("health_dist"))
-        
-        high_pct = rng.uniform(5, 12)
-        medium_pct = rng.uniform(20, 30)
-        low_pct = 100 - high_pct - medium_pct
-        
-        low_risk_count = int(total * low_pct / 100)
-        medium_risk_count = int(total * medium_pct / 100)
-        high_risk_count = total - low_risk_count - medium_risk_count
-        
-        # Ensure non-zero values
-        if high_risk_count < 1:
-            high_risk_count = max(1, int(total * 0.05))
-        if medium_risk_count < 2:
-            medium_risk_count = max(2, int(total * 0.2))
-        
-        # Determine overall health status
-        if high_pct < 8 and sla_breach_kpi < 15:
-            health_class = "coo-health-good"
-            health_icon = "✅"
-            health_text = "System Operating Normally"
-        elif high_pct < 10 or sla_breach_kpi < 20:
-            health_class = "coo-health-caution"
-            health_icon = "⚠️"
-            health_text = "Moderate Risk — Monitoring Required"
-        else:
-            health_class = "coo-health-critical"
-            health_icon = "🔴"
-            health_text = "Elevated Risk — Attention Needed"
+        # Executive Dashboard CSS - Authoritative, calm, boardroom-ready
+        # Stylesheet lives in one module-level constant (single definition site).
+        # Emitted on every rerun of the open tab - Streamlit drops elements a rerun does not re-send.
+        st.markdown(COO_DASHBOARD_CSS, unsafe_allow_html=True)
         
-        st.markdown(f"""
-        <div class="coo-health-card">
-            <div class="coo-health-indicator {health_class}">
-                <span style="font-size: 1.5rem;">{health_icon}</span>
-                <span class="coo-health-text">{health_text}</span>
-            </div>
-            <div style="padding: 0 0.5rem;">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.75rem;">
-                    <span style="color: #6B7280; font-size: 0.85rem;">Low Risk</span>
-                    <span style="color: #059669; font-weight: 600;">{low_risk_count} shipments ({low_pct:.0f}%)</span>
-                </div>
-                <div class="coo-risk-bar">
-                    <div class="coo-risk-fill coo-risk-low" style="width: {low_pct}%; transition: width 0.5s ease;"></div>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin: 0.75rem 0;">
-                    <span style="color: #6B7280; font-size: 0.85rem;">Medium Risk</span>
-                    <span style="color: #D97706; font-weight: 600;">{medium_risk_count} shipments ({medium_pct:.0f}%)</span>
-                </div>
-                <div class="coo-risk-bar">
-                    <div class="coo-risk-fill coo-risk-medium" style="width: {medium_pct}%; transition: width 0.5s ease;"></div>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin: 0.75rem 0;">
-                    <span style="color: #6B7280; font-size: 0.85rem;">High Risk</span>
-                    <span style="color: #DC2626; font-weight: 600;">{high_risk_count} shipments ({high_pct:.0f}%)</span>
-                </div>
-                <div class="coo-risk-bar">
-                    <div class="coo-risk-fill coo-risk-high" style="width: {high_pct}%; transition: width 0.5s ease;"></div>
+        # ───────────────────────────────────────────────────────────────────────────
+        # ZONE 1: Executive Header
+        # ───────────────────────────────────────────────────────────────────────────
+        st.markdown("""
+        <div class="role-page-header">
+            <div class="role-header-left">
+                <div class="role-header-icon">🧠</div>
+                <div class="role-header-text">
+                    <h2>COO Executive Dashboard</h2>
+                    <p>National logistics performance and risk overview</p>
                 </div>
             </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with risk_col:
-        st.markdown('<div class="coo-section-title">🚨 High-Risk Corridor Heatmap</div>', unsafe_allow_html=True)
-        
-        # ✅ EXPANDED HEATMAP using HIGH_RISK_CORRIDORS
-        for corridor_data in HIGH_RISK_CORRIDORS:
-            corridor_name = f"{corridor_data['from']} → {corridor_data['to']}"
-            risk_pct = corridor_data["risk"]
-            impact = corridor_data["impact"]
-            
-            # Color based on risk level
-            if risk_pct >= 70:
-                badge_class = "coo-badge-red"
-                bar_color = "#EF4444"
-            elif risk_pct >= 55:
-                badge_class = "coo-badge-amber"
-                bar_color = "#F59E0B"
-            else:
-                badge_class = "coo-badge-yellow"
-                bar_color = "#EAB308"
-            
-            st.markdown(f"""
-            <div class="coo-alert-card" style="margin-bottom: 0.75rem;">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                    <div class="coo-alert-text">🚛 {corridor_name}</div>
-                    <span class="{badge_class}" style="padding: 0.2rem 0.5rem; border-radius: 8px; font-size: 0.75rem; font-weight: 600;">{risk_pct}%</span>
-                </div>
-                <div style="display: flex; align-items: center; gap: 0.5rem;">
-                    <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 6px; overflow: hidden;">
-                        <div style="width: {risk_pct}%; height: 100%; background: {bar_color}; transition: width 0.3s ease;"></div>
-                    </div>
-                    <span style="color: #6B7280; font-size: 0.7rem; min-width: 60px;">{impact}</span>
-                </div>
+            <div class="role-header-status">
+                <span class="role-status-badge role-status-badge-view">🔒 STRATEGIC VIEW</span>
             </div>
-            """, unsafe_allow_html=True)
-    
-    st.markdown("<div style='height: 1.5rem'></div>", unsafe_allow_html=True)
-    
-    # ───────────────────────────────────────────────────────────────────────────
-    # ZONE 4: Trend & Performance Insights (ENHANCED with corridor data)
-    # ───────────────────────────────────────────────────────────────────────────
-    st.markdown('<div class="coo-section-title">💡 Performance Insights</div>', unsafe_allow_html=True)
-    
-    # Generate insights based on metrics
-    rng = random.Random(daily_seed + hash("coo_insights"))
-    
-    insight_cols = st.columns(4)
-    
-    with insight_cols[0]:
-        trend_direction = "improving" if on_time_rate_kpi > 92 else ("stable" if on_time_rate_kpi > 88 else "needs attention")
-        trend_icon = "📈" if trend_direction == "improving" else ("➡️" if trend_direction == "stable" else "📉")
-        trend_color = "#059669" if trend_direction == "improving" else ("#6B7280" if trend_direction == "stable" else "#DC2626")
-        st.markdown(f"""
-        <div class="coo-insight-card">
-            <div class="coo-insight-icon">{trend_icon}</div>
-            <div class="coo-insight-text">SLA performance <span style="color: {trend_color}; font-weight: 600;">{trend_direction}</span> over the past week</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with insight_cols[1]:
-        # Top performing regions from our route pairs
-        top_regions = ["Maharashtra", "Karnataka", "Tamil Nadu", "Gujarat", "Delhi"]
-        rng.shuffle(top_regions)
-        st.markdown(f"""
-        <div class="coo-insight-card">
-            <div class="coo-insight-icon">🏆</div>
-            <div class="coo-insight-text">Top regions: <strong>{top_regions[0]}</strong>, <strong>{top_regions[1]}</strong> by volume</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with insight_cols[2]:
-        # Use actual HIGH_RISK_CORRIDORS for emerging risk
-        corridor_names = [f"{c['from']} → {c['to']}" for c in HIGH_RISK_CORRIDORS]
-        emerging_corridor = rng.choice(corridor_names)
-        st.markdown(f"""
-        <div class="coo-insight-card">
-            <div class="coo-insight-icon">🔍</div>
-            <div class="coo-insight-text">Emerging risk: <strong>{emerging_corridor}</strong> corridor</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with insight_cols[3]:
-        capacity_pct = int(get_fluctuating_kpi(75, 8, daily_seed + 10))
-        capacity_status = "within target" if capacity_pct < 85 else "nearing capacity"
-        st.markdown(f"""
-        <div class="coo-insight-card">
-            <div class="coo-insight-icon">📦</div>
-            <div class="coo-insight-text">Operational capacity at <strong>{capacity_pct}%</strong> — {capacity_status}</div>
         </div>
         """, unsafe_allow_html=True)
-    
-    st.markdown("<div style='height: 1.5rem'></div>", unsafe_allow_html=True)
-    
-    # ───────────────────────────────────────────────────────────────────────────
-    # ZONE 5: Strategic Shipment Snapshot (READ-ONLY from shipment_flow)
-    # 🎯 MANDATORY: Read ONLY from st.session_state["shipment_flow"]
-    # 📊 EXACT DISTRIBUTIONS: SLA 40/20/40, Risk 20-80, Priority 40/60
-    # ───────────────────────────────────────────────────────────────────────────
-    st.markdown('<div class="coo-section-title">📦 Strategic Shipment Snapshot</div>', unsafe_allow_html=True)
-    
-    # 📊 MANDATORY DISTRIBUTIONS (same as Viewer for consistency):
-    # SLA: 40% At Risk, 20% Warning, 40% On Track
-    # Risk: 20-80 range
-    # Priority: 40% EXPRESS, 60% NORMAL
-    SLA_OPTIONS = ["At Risk", "Warning", "On Track"]
-    SLA_WEIGHTS = [40, 20, 40]  # Exact 40/20/40 distribution
-    PRIORITY_OPTIONS = ["EXPRESS", "NORMAL"]
-    PRIORITY_WEIGHTS = [40, 60]  # Exact 40/60 distribution
-    
-    # Map state to friendly name
-    stage_map = {
-        "CREATED": "Created",
-        "MANAGER_APPROVED": "Approved",
-        "SUPERVISOR_APPROVED": "Approved",
-        "IN_TRANSIT": "In Transit",
-        "WAREHOUSE_INTAKE": "At Warehouse",
-        "OUT_FOR_DELIVERY": "Out for Delivery",
-        "DELIVERED": "Delivered"
-    }
-    
-    # 🌐 READ FROM GLOBAL SHIPMENT_FLOW STORE
-    snapshot_data = []
-    for idx, (sid, ship) in enumerate(list(all_shipments.items())[:15]):  # Limit to 15 for executive view
-        # ✅ READ actual state from shipment data
-        state = ship.get("current_state", "CREATED")
-        stage = stage_map.get(state, state)
-        
-        # ✅ REALISTIC ROUTES
-        stored_source = ship.get("source_state")
-        stored_dest = ship.get("destination_state")
-        if stored_source and stored_dest and stored_source != "N/A" and stored_dest != "N/A":
-            source = stored_source[:12]
-            dest = stored_dest[:12]
-        else:
-            source, dest = get_realistic_route(sid, daily_seed + idx)
-            source = source[:12]
-            dest = dest[:12]
-        
-        # 📊 EXACT PRIORITY DISTRIBUTION: 40% EXPRESS, 60% NORMAL
-        ship_rng = random.Random(daily_seed + hash(sid) + idx)
-        priority = ship_rng.choices(PRIORITY_OPTIONS, weights=PRIORITY_WEIGHTS, k=1)[0]
-        
-        # 📊 EXACT RISK RANGE: 20-80 (uniform distribution)
-        risk = ship_rng.randint(20, 80)
-        
-        # 📊 EXACT SLA DISTRIBUTION: 40% At Risk, 20% Warning, 40% On Track
-        # Special case: DELIVERED stage shows "Completed"
-        if state == "DELIVERED":
-            sla = "Completed"
-        else:
-            sla = ship_rng.choices(SLA_OPTIONS, weights=SLA_WEIGHTS, k=1)[0]
-        
-        snapshot_data.append({
-            "Shipment ID": sid,
-            "Route": f"{source} → {dest}",
-            "Stage": stage,
-            "SLA": sla,
-            "Risk": risk,
-            "Priority": priority
-        })
-    
-    # 🚫 NO SYNTHETIC FALLBACK – If no data, show empty state message
-    if not snapshot_data:
-        st.info("📭 No shipments in the system yet. Create shipments from the Sender dashboard to see them here.")
-    
-    if snapshot_data:
-        # ✅ NO SORTING - Keep original order (newest shipments from flow store appear FIRST)
-        # Flow store shipments are merged first above, so newest appear at top
-        pass
         
-        df = pd.DataFrame(snapshot_data)
+        # 🌐 SYNC FLOW STORE FROM EVENT LOG (ensures latest shipments appear)
+        ShipmentFlowStore.sync_from_event_log()
         
-        # Style function (6 columns: ID, Route, Stage, SLA, Risk, Priority)
-        def style_coo_table(row):
-            styles = [''] * len(row)
+        # ⚡ STAFF+ MANDATE: Heavy computation behind cache (300s TTL) with STABLE KEY
+        @st.cache_data(ttl=300, show_spinner=False)
+        def compute_coo_metrics(event_store_version, _event_log_shipments):
+            """Cache COO dashboard metrics for 5 minutes - keyed on the event-store version (_event_log_shipments is excluded from hashing)"""
+            total_count = len(_event_log_shipments)
             
-            # Stage styling (index 2)
-            stage = row['Stage']
-            if stage == 'Delivered':
-                styles[2] = 'background-color: #D1FAE5; color: #065F46;'
-            elif stage == 'In Transit':
-                styles[2] = 'background-color: #FEF3C7; color: #92400E;'
-            elif stage == 'Out for Delivery':
-                styles[2] = 'background-color: #DBEAFE; color: #1E40AF;'
-            else:
-                styles[2] = 'background-color: #F5F3FF; color: #6D28D9;'
-            
-            # SLA styling (index 3)
-            sla = row['SLA']
-            if sla == 'Completed':
-                styles[3] = 'background-color: #D1FAE5; color: #065F46;'
-            elif sla == 'At Risk':
-                styles[3] = 'background-color: #FEE2E2; color: #991B1B;'
-            elif sla == 'Warning':
-                styles[3] = 'background-color: #FEF3C7; color: #92400E;'
-            else:
-                styles[3] = 'background-color: #D1FAE5; color: #065F46;'
+            if total_count == 0:
+                return None
             
-            # Risk styling (index 4)
-            risk = row['Risk']
-            if risk >= 70:
-                styles[4] = 'background-color: #FEE2E2; color: #991B1B; font-weight: 600;'
-            elif risk >= 40:
-                styles[4] = 'background-color: #FEF3C7; color: #92400E;'
-            else:
-                styles[4] = 'background-color: #D1FAE5; color: #065F46;'
+            # ⚡ Each shipment is scored once into a preallocated array; the counts are vectorized reductions
+            shipment_values = _event_log_shipments.values()
+            scores = np.fromiter(
+                (compute_risk_score(s.get("history", ())) for s in shipment_values),
+                dtype=np.int16, count=total_count
+            )
+            states = np.array([s.get("current_state") or "" for s in shipment_values])
+            high_risk = int(np.count_nonzero(scores >= 70))
+            medium_risk = int(np.count_nonzero((scores >= 40) & (scores < 70)))
+            in_transit = int(np.count_nonzero(np.isin(states, list(COO_TRANSIT_STATES))))
+            delivered = int(np.count_nonzero(states == "DELIVERED"))
+            low_risk = total_count - high_risk - medium_risk
             
-            # Priority styling (index 5)
-            priority = row.get('Priority', 'NORMAL')
-            if priority == 'EXPRESS':
-                styles[5] = 'background-color: #FEE2E2; color: #B91C1C; font-weight: 600;'
-            else:
-                styles[5] = 'background-color: #F3F4F6; color: #374151;'
+            # Calculate on-time rate
+            on_time_rate = round((delivered / max(total_count, 1)) * 100 + random.Random(get_daily_seed()).uniform(10, 20), 1)
+            on_time_rate = min(on_time_rate, 97.5)
             
-            return styles
+            return {
+                'total_count': total_count,
+                'in_transit': in_transit,
+                'delivered': delivered,
+                'high_risk': high_risk,
+                'medium_risk': medium_risk,
+                'low_risk': low_risk,
+                'on_time_rate': on_time_rate,
+                'sla_breach_risk': round((high_risk / max(total_count, 1)) * 100, 1)
+            }
         
-        styled_df = df.style.apply(style_coo_table, axis=1)
+        # DEMO MODE – Use synchronized demo state for consistent metrics across all views
+        demo_state = get_synchronized_metrics()
         
-        st.dataframe(
-            styled_df,
-            use_container_width=True,
-            height=350,
-            hide_index=True,
-            column_config={
-                "Shipment ID": st.column_config.TextColumn("Shipment ID", width="medium"),
-                "Route": st.column_config.TextColumn("Route", width="large"),
-                "Stage": st.column_config.TextColumn("Stage", width="medium"),
-                "SLA": st.column_config.TextColumn("SLA Status", width="small"),
-                "Risk": st.column_config.NumberColumn("Risk", width="small", format="%d"),
-                "Priority": st.column_config.TextColumn("Priority", width="small")
+        # 🌐 GET DATA FROM FLOW STORE (primary) + Event Log (backup)
+        # ⚡ One fused traversal instead of five separate store scans
+        flow_snapshot = ShipmentFlowStore.snapshot(70)
+        flow_count = flow_snapshot.total
+        flow_stage_counts = flow_snapshot.stage_counts
+        flow_sla_counts = flow_snapshot.sla_counts
+        flow_high_risk = flow_snapshot.high_risk_count
+        
+        # Load data from event log
+        event_log_shipments = get_all_shipments_cached()
+        
+        def build_coo_shipments():
+            """Merge flow store + event log shipments into the COO record format"""
+            # 🌐 MERGE: Flow store shipments FIRST (newest), then event log
+            # This ensures newly created shipments appear at TOP
+            merged = {}
+            
+            # First add flow store shipments (these are always most recent)
+            for sid, ship in flow_snapshot.shipments:
+                origin = ship.get("origin") or EMPTY_LOCATION
+                dest = ship.get("destination") or EMPTY_LOCATION
+                merged[sid] = {
+                    "current_state": ship.get("stage", "CREATED"),
+                    "source_state": origin.get("state", origin.get("full", "")),
+                    "destination_state": dest.get("state", dest.get("full", "")),
+                    "priority": ship.get("priority", "NORMAL"),
+                    "risk_score": ship.get("risk_score", 30),
+                    "sla_status": ship.get("sla_status", "ON_TRACK"),
+                    "last_updated": ship.get("last_updated", ""),
+                    "history": []
+                }
+            
+            # Then merge event log shipments (don't overwrite flow store entries)
+            # ⚡ setdefault: one hash probe per key instead of `in` + store
+            merge_event = merged.setdefault
+            for sid, ship in event_log_shipments.items():
+                merge_event(sid, ship)
+            return merged
+        
+        # ⚡ Rebuild the merge only when the flow store, event log or read-model dict changed (session-scoped -
+        # the flow store is per session, so a process-wide cache_resource would leak across users)
+        coo_merge_key = (ShipmentFlowStore.version(), get_event_log_version())
+        coo_merge_cache = st.session_state.get("_coo_merge_cache")
+        if flow_count == 0:
+            # ⚡ Empty flow store - the event log already is the merged view, no copy needed
+            all_shipments = event_log_shipments
+        elif coo_merge_cache and coo_merge_cache[0] == coo_merge_key and coo_merge_cache[1] is event_log_shipments:
+            all_shipments = coo_merge_cache[2]
+        else:
+            all_shipments = build_coo_shipments()
+            st.session_state._coo_merge_cache = (coo_merge_key, event_log_shipments, all_shipments)
+        
+        # ⚡ Keyed on the file behind the read model the metrics read (event_store.jsonl), not the merged view or flow count
+        from app.storage.event_store import get_store_version
+        metrics = compute_coo_metrics(get_store_version(), event_log_shipments)
+        
+        # 🌐 MERGE FLOW STORE DATA into metrics
+        if flow_count > 0:
+            # Use flow store data which is always most current
+            if metrics:
+                metrics['total_count'] = max(metrics['total_count'], flow_count)
+                metrics['high_risk'] = max(metrics['high_risk'], flow_high_risk)
+                metrics['in_transit'] = max(metrics['in_transit'], sum_keys(flow_stage_counts, FLOW_IN_TRANSIT_STAGES))
+                metrics['delivered'] = max(metrics['delivered'], sum_keys(flow_stage_counts, FLOW_DELIVERED_STAGES))
+        
+        # DEMO MODE – Merge with synchronized demo state for visual consistency
+        if not metrics:
+            metrics = {
+                'total_count': demo_state['total_shipments'],
+                'in_transit': demo_state['in_transit'],
+                'delivered': demo_state['delivered_today'],
+                'high_risk': demo_state['high_risk_count'],
+                'medium_risk': int(demo_state['total_shipments'] * 0.25),
+                'low_risk': int(demo_state['total_shipments'] * 0.55),
+                'on_time_rate': demo_state['on_time_delivery_rate'],
+                'sla_breach_risk': demo_state['at_risk_percentage']
             }
-        )
-    
-    st.markdown("<div style='height: 1.5rem'></div>", unsafe_allow_html=True)
-    
-    # ───────────────────────────────────────────────────────────────────────────
-    # ZONE 6: Corridor Heatmap (Simplified for Executive View)
-    # ───────────────────────────────────────────────────────────────────────────
-    with st.expander("🗺️ Corridor Risk Heatmap", expanded=False):
-        corridor_snapshot = read_snapshot(CORRIDOR_SNAPSHOT) or {}
-        corridor_data = corridor_snapshot.get("data", corridor_snapshot) if corridor_snapshot and isinstance(corridor_snapshot, dict) else None
+        else:
+            # DEMO MODE – Override with synchronized values for demo consistency
+            metrics['total_count'] = demo_state['total_shipments']
+            metrics['high_risk'] = demo_state['high_risk_count']
+            metrics['on_time_rate'] = demo_state['on_time_delivery_rate']
+            metrics['sla_breach_risk'] = demo_state['at_risk_percentage']
         
-        # Generate synthetic corridor data if needed
-        if not corridor_data or not isinstance(corridor_data, list) or len(corridor_data) == 0:
-            daily_seed = get_daily_seed()
-            rng = random.Random(daily_seed + hash("coo_corridors"))
-            from app.core.india_states import INDIA_STATES
-            
-            corridor_data = []
-            for _ in range(rng.randint(20, 30)):
-                source = rng.choice(INDIA_STATES)
-                dest = rng.choice([s for s in INDIA_STATES if s != source])
-                
-                corridor_data.append({
-                    "corridor": f"{source} → {dest}",
-                    "source_state": source,
-                    "destination_state": dest,
-                    "shipments": rng.randint(5, 25),
-                    "avg_eta_hours": rng.uniform(24, 120),
-                    "avg_breach_probability": rng.uniform(0.05, 0.75)
-                })
+        # ───────────────────────────────────────────────────────────────────────────
+        # ZONE 2: Executive KPI Strip (ENHANCED with fluctuating KPIs)
+        # ───────────────────────────────────────────────────────────────────────────
+        st.markdown('<div class="coo-section-title">📊 Key Performance Indicators</div>', unsafe_allow_html=True)
         
-        if corridor_data and isinstance(corridor_data, list) and len(corridor_data) > 0:
-            try:
-                import plotly.express as px
-                
-                df_corridor = pd.DataFrame(corridor_data)
-                
-                df_aggregated = df_corridor.groupby(['source_state', 'destination_state']).agg({
-                    'avg_breach_probability': 'mean',
-                    'shipments': 'sum'
-                }).reset_index()
-                
-                pivot_table = df_aggregated.pivot(
-                    index="source_state",
-                    columns="destination_state",
-                    values="avg_breach_probability"
-                )
-                
-                fig = px.imshow(
-                    pivot_table,
-                    color_continuous_scale="RdYlGn_r",
-                    title="",
-                    labels=dict(x="Destination", y="Origin", color="Risk")
-                )
-                
-                fig.update_layout(
-                    height=400,
-                    margin=dict(l=20, r=20, t=20, b=20),
-                    paper_bgcolor='white',
-                    plot_bgcolor='white'
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-            except Exception as e:
-                st.info("Heatmap visualization unavailable")
-
-
-# ==================================================
-# 📊 COMPLIANCE & AUDIT CENTER - Best-in-Class Regulator-Ready Console
-# ==================================================
-with main_tabs[5]:
-    # ═══════════════════════════════════════════════════════════════════════════════
-    # 📊 COMPLIANCE & AUDIT CENTER - Regulator-Ready Audit Console
-    # ═══════════════════════════════════════════════════════════════════════════════
-    
-    # Compliance Center CSS - Formal, neutral, trustworthy
-    st.markdown("""
-    <style>
-    .compliance-header {
-        background: #F8FAFC;
-        border-radius: 16px;
-        padding: 1.5rem 2rem;
-        margin-bottom: 1.5rem;
-        border: 1px solid #E2E8F0;
-    }
-    .compliance-header h1 {
-        color: #334155;
-        font-size: 1.75rem;
-        font-weight: 700;
-        margin: 0 0 0.25rem 0;
-    }
-    .compliance-header p {
-        color: #64748B;
-        font-size: 0.95rem;
-        margin: 0;
-    }
-    .compliance-kpi-card {
-        background: white;
-        border-radius: 12px;
-        padding: 1.25rem;
-        border: 1px solid #E2E8F0;
-        text-align: center;
-        height: 100%;
-    }
-    .compliance-kpi-value {
-        font-size: 2.25rem;
-        font-weight: 700;
-        line-height: 1.1;
-        color: #1E293B;
-    }
-    .compliance-kpi-value-neutral { color: #475569; }
-    .compliance-kpi-value-green { color: #059669; }
-    .compliance-kpi-value-amber { color: #D97706; }
-    .compliance-kpi-value-red { color: #DC2626; }
-    .compliance-kpi-label {
-        font-size: 0.8rem;
-        color: #64748B;
-        font-weight: 500;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        margin-top: 0.5rem;
-    }
-    .audit-log-container {
-        background: white;
-        border-radius: 12px;
-        padding: 1rem;
-        border: 1px solid #E2E8F0;
-    }
-    .audit-event-row {
-        background: #FAFAFA;
-        border-radius: 8px;
-        padding: 0.75rem 1rem;
-        margin-bottom: 0.5rem;
-        border: 1px solid #E5E7EB;
-        display: flex;
-        align-items: center;
-    }
-    .audit-timestamp {
-        font-family: 'SF Mono', 'Monaco', monospace;
-        font-size: 0.8rem;
-        color: #64748B;
-        min-width: 150px;
-    }
-    .audit-shipment-id {
-        font-family: 'SF Mono', 'Monaco', monospace;
-        font-weight: 600;
-        color: #5B21B6;
-        font-size: 0.85rem;
-        min-width: 140px;
-    }
-    .audit-event-badge {
-        padding: 0.25rem 0.6rem;
-        border-radius: 10px;
-        font-size: 0.75rem;
-        font-weight: 600;
-    }
-    .audit-badge-created { background: #EFF6FF; color: #1E40AF; }
-    .audit-badge-approved { background: #F0FDF4; color: #065F46; }
-    .audit-badge-transit { background: #FFFBEB; color: #92400E; }
-    .audit-badge-delivered { background: #D1FAE5; color: #065F46; }
-    .audit-badge-override { background: #FEF2F2; color: #991B1B; }
-    .audit-role-badge {
-        background: #F5F3FF;
-        color: #6D28D9;
-        padding: 0.2rem 0.5rem;
-        border-radius: 8px;
-        font-size: 0.75rem;
-        font-weight: 500;
-    }
-    .timeline-card {
-        background: white;
-        border-radius: 12px;
-        padding: 1.25rem;
-        border: 1px solid #E2E8F0;
-    }
-    .timeline-event {
-        display: flex;
-        gap: 1rem;
-        padding: 0.75rem 0;
-        border-bottom: 1px solid #F1F5F9;
-    }
-    .timeline-event:last-child {
-        border-bottom: none;
-    }
-    .timeline-dot {
-        width: 12px;
-        height: 12px;
-        border-radius: 50%;
-        margin-top: 4px;
-        flex-shrink: 0;
-    }
-    .timeline-dot-complete { background: #10B981; }
-    .timeline-dot-active { background: #3B82F6; }
-    .timeline-dot-pending { background: #D1D5DB; }
-    .timeline-content {
-        flex: 1;
-    }
-    .timeline-event-type {
-        font-weight: 600;
-        color: #1E293B;
-        font-size: 0.9rem;
-    }
-    .timeline-meta {
-        font-size: 0.8rem;
-        color: #64748B;
-        margin-top: 0.25rem;
-    }
-    .policy-card {
-        background: #F8FAFC;
-        border-radius: 12px;
-        padding: 1.25rem;
-        border: 1px solid #E2E8F0;
-        height: 100%;
-    }
-    .policy-icon {
-        font-size: 1.5rem;
-        margin-bottom: 0.5rem;
-    }
-    .policy-text {
-        color: #334155;
-        font-size: 0.9rem;
-        font-weight: 500;
-    }
-    .policy-status {
-        font-size: 0.8rem;
-        color: #64748B;
-        margin-top: 0.25rem;
-    }
-    .export-card {
-        background: #F5F3FF;
-        border-radius: 12px;
-        padding: 1.5rem;
-        border: 1px solid #E9D5FF;
-    }
-    .export-button {
-        background: white;
-        border: 2px solid #DDD6FE;
-        border-radius: 10px;
-        padding: 1rem 1.5rem;
-        text-align: center;
-        cursor: pointer;
-        transition: all 0.2s;
-    }
-    .export-button:hover {
-        border-color: #8B5CF6;
-        background: #FAF5FF;
-    }
-    .export-icon {
-        font-size: 1.5rem;
-        margin-bottom: 0.5rem;
-    }
-    .export-label {
-        font-weight: 600;
-        color: #5B21B6;
-        font-size: 0.9rem;
-    }
-    .immutable-badge {
-        background: #F0FDF4;
-        color: #065F46;
-        padding: 0.2rem 0.5rem;
-        border-radius: 8px;
-        font-size: 0.7rem;
-        font-weight: 600;
-        border: 1px solid #BBF7D0;
-    }
-    .compliance-read-only-badge {
-        background: #F1F5F9;
-        color: #475569;
-        padding: 0.25rem 0.75rem;
-        border-radius: 12px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        display: inline-block;
-        border: 1px solid #CBD5E1;
-    }
-    .section-title {
-        font-size: 1rem;
-        font-weight: 600;
-        color: #334155;
-        margin-bottom: 1rem;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+        # ✅ FLUCTUATING KPIs – Subtle time-based variations
+        daily_seed = get_daily_seed()
+        active_shipments_kpi = int(get_fluctuating_kpi(metrics['total_count'], 3, daily_seed))
+        on_time_rate_kpi = get_fluctuating_kpi(metrics['on_time_rate'], 1.5, daily_seed + 1)
+        sla_breach_kpi = get_fluctuating_kpi(metrics['sla_breach_risk'], 5, daily_seed + 2)
+        delivered_kpi = int(get_fluctuating_kpi(metrics['delivered'], 8, daily_seed + 3))
+        
+        # ✅ HIGH-RISK CORRIDORS from predefined data
+        high_risk_corridors = len(HIGH_RISK_CORRIDORS)
+        
+        # ⚡ Five KPI cards in one grid = one markdown delta instead of 5 column cells
+        st.markdown(f"""
+        <div style="display: grid; grid-template-columns: repeat(5, 1fr); gap: 1rem;">
+            <div class="coo-kpi-card">
+                <div class="coo-kpi-value coo-kpi-value-primary">{active_shipments_kpi:,}</div>
+                <div class="coo-kpi-label">Active Shipments</div>
+            </div>
+            <div class="coo-kpi-card">
+                <div class="coo-kpi-value coo-kpi-value-green">{on_time_rate_kpi:.1f}%</div>
+                <div class="coo-kpi-label">On-Time Rate</div>
+            </div>
+            <div class="coo-kpi-card">
+                <div class="coo-kpi-value coo-kpi-value-amber">{sla_breach_kpi:.1f}%</div>
+                <div class="coo-kpi-label">SLA Breach Risk</div>
+            </div>
+            <div class="coo-kpi-card">
+                <div class="coo-kpi-value coo-kpi-value-red">{high_risk_corridors}</div>
+                <div class="coo-kpi-label">High-Risk Corridors</div>
+            </div>
+            <div class="coo-kpi-card">
+                <div class="coo-kpi-value coo-kpi-value-blue">{delivered_kpi}</div>
+                <div class="coo-kpi-label">Delivered Today</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("<div style='height: 1rem'></div>", unsafe_allow_html=True)
+        
+        # ─────────────────────────────────────────────────────────────────────────────
+        # ZONE 2.5: COO NOTIFICATIONS & AUDIT FEED (PART 6 – GlobalShipmentContext sync)
+        # ─────────────────────────────────────────────────────────────────────────────
+        coo_notifications = NotificationBus.get_notifications_for_role("COO", limit=5)
+        
+        if coo_notifications:
+            st.markdown('<div class="coo-section-title">🔔 Executive Alerts</div>', unsafe_allow_html=True)
+            
+            alert_cols = st.columns([2, 1])
+            
+            with alert_cols[0]:
+                # ⚡ Alerts concatenated and emitted as one markdown call
+                alert_parts = []
+                for notif in coo_notifications[:3]:
+                    delivered = "DELIVERED" in notif['event_type']
+                    event_icon = "✅" if delivered else "⚠️" if "OVERRIDE" in notif['event_type'] else "📋"
+                    alert_parts.append(
+                        f'<div class="coo-alert-card" style="background: {"#D1FAE5" if delivered else "#FEF2F2"}; border-color: {"#A7F3D0" if delivered else "#FECACA"};">'
+                        f'<div class="coo-alert-text" style="color: {"#065F46" if delivered else "#991B1B"};">{event_icon} {notif["message"][:100]}</div>'
+                        '</div>'
+                    )
+                st.markdown("".join(alert_parts), unsafe_allow_html=True)
+            
+            with alert_cols[1]:
+                # Show override summary
+                overrides_today = DailyOpsCalculator.get_overrides_today()
+                st.markdown(f"""
+                <div style="background: #FEF3C7; border-radius: 12px; padding: 1rem; border: 1px solid #FDE68A;">
+                    <div style="font-weight: 600; color: #92400E; font-size: 0.9rem;">⚠️ Overrides Today</div>
+                    <div style="font-size: 1.5rem; font-weight: 700; color: #D97706;">{len(overrides_today)}</div>
+                    <div style="font-size: 0.75rem; color: #B45309;">Requires compliance review</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown("<div style='height: 1rem'></div>", unsafe_allow_html=True)
+        
+        # ───────────────────────────────────────────────────────────────────────────
+        # ZONE 3: National Health Overview (ENHANCED with realistic distribution)
+        # ───────────────────────────────────────────────────────────────────────────
+        health_col, risk_col = st.columns([1, 1.5])  # Wider heatmap column
+        
+        with health_col:
+            st.markdown('<div class="coo-section-title">🏥 National Logistics Health</div>', unsafe_allow_html=True)
+            
+            # ✅ REALISTIC RISK DISTRIBUTION: 60-70% low, 20-30% medium, 5-12% high
+            total = metrics['total_count']
+            rng = random.Random(daily_seed + hash("health_dist"))
+            
+            high_pct = rng.uniform(5, 12)
+            medium_pct = rng.uniform(20, 30)
+            low_pct = 100 - high_pct - medium_pct
+            
+            low_risk_count = int(total * low_pct / 100)
+            medium_risk_count = int(total * medium_pct / 100)
+            high_risk_count = total - low_risk_count - medium_risk_count
+            
+            # Ensure non-zero values
+            if high_risk_count < 1:
+                high_risk_count = max(1, int(total * 0.05))
+            if medium_risk_count < 2:
+                medium_risk_count = max(2, int(total * 0.2))
+            
+            # Determine overall health status
+            if high_pct < 8 and sla_breach_kpi < 15:
+                health_class = "coo-health-good"
+                health_icon = "✅"
+                health_text = "System Operating Normally"
+            elif high_pct < 10 or sla_breach_kpi < 20:
+                health_class = "coo-health-caution"
+                health_icon = "⚠️"
+                health_text = "Moderate Risk — Monitoring Required"
+            else:
+                health_class = "coo-health-critical"
+                health_icon = "🔴"
+                health_text = "Elevated Risk — Attention Needed"
+            
+            st.markdown(f"""
+            <div class="coo-health-card">
+                <div class="coo-health-indicator {health_class}">
+                    <span style="font-size: 1.5rem;">{health_icon}</span>
+                    <span class="coo-health-text">{health_text}</span>
+                </div>
+                <div style="padding: 0 0.5rem;">
+                    <div style="display: flex; justify-content: space-between; margin-bottom: 0.75rem;">
+                        <span style="color: #6B7280; font-size: 0.85rem;">Low Risk</span>
+                        <span style="color: #059669; font-weight: 600;">{low_risk_count} shipments ({low_pct:.0f}%)</span>
+                    </div>
+                    <div class="coo-risk-bar">
+                        <div class="coo-risk-fill coo-risk-low" style="width: {low_pct}%; transition: width 0.5s ease;"></div>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; margin: 0.75rem 0;">
+                        <span style="color: #6B7280; font-size: 0.85rem;">Medium Risk</span>
+                        <span style="color: #D97706; font-weight: 600;">{medium_risk_count} shipments ({medium_pct:.0f}%)</span>
+                    </div>
+                    <div class="coo-risk-bar">
+                        <div class="coo-risk-fill coo-risk-medium" style="width: {medium_pct}%; transition: width 0.5s ease;"></div>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; margin: 0.75rem 0;">
+                        <span style="color: #6B7280; font-size: 0.85rem;">High Risk</span>
+                        <span style="color: #DC2626; font-weight: 600;">{high_risk_count} shipments ({high_pct:.0f}%)</span>
+                    </div>
+                    <div class="coo-risk-bar">
+                        <div class="coo-risk-fill coo-risk-high" style="width: {high_pct}%; transition: width 0.5s ease;"></div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with risk_col:
+            st.markdown('<div class="coo-section-title">🚨 High-Risk Corridor Heatmap</div>', unsafe_allow_html=True)
+            
+            # ✅ EXPANDED HEATMAP using HIGH_RISK_CORRIDORS
+            # ⚡ All corridor cards concatenated and emitted as one markdown call
+            corridor_parts = []
+            for corridor_data in HIGH_RISK_CORRIDORS:
+                risk_pct = corridor_data["risk"]
+                corridor_parts.append(
+                    '<div class="coo-alert-card" style="margin-bottom: 0.75rem;">'
+                    '<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">'
+                    f'<div class="coo-alert-text">🚛 {corridor_data["name"]}</div>'
+                    f'<span class="{corridor_data["badge_class"]}" style="padding: 0.2rem 0.5rem; border-radius: 8px; font-size: 0.75rem; font-weight: 600;">{risk_pct}%</span>'
+                    '</div>'
+                    '<div style="display: flex; align-items: center; gap: 0.5rem;">'
+                    '<div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 6px; overflow: hidden;">'
+                    f'<div style="width: {risk_pct}%; height: 100%; background: {corridor_data["bar_color"]}; transition: width 0.3s ease;"></div>'
+                    '</div>'
+                    f'<span style="color: #6B7280; font-size: 0.7rem; min-width: 60px;">{corridor_data["impact"]}</span>'
+                    '</div>'
+                    '</div>'
+                )
+            st.markdown("".join(corridor_parts), unsafe_allow_html=True)
+        
+        st.markdown("<div style='height: 1.5rem'></div>", unsafe_allow_html=True)
+        
+        # ───────────────────────────────────────────────────────────────────────────
+        # ZONE 4: Trend & Performance Insights (ENHANCED with corridor data)
+        # ───────────────────────────────────────────────────────────────────────────
+        st.markdown('<div class="coo-section-title">💡 Performance Insights</div>', unsafe_allow_html=True)
+        
+        # Generate insights based on metrics
+        rng = random.Random(daily_seed + hash("coo_insights"))
+        
+        insight_cols = st.columns(4)
+        
+        with insight_cols[0]:
+            trend_direction = "improving" if on_time_rate_kpi > 92 else ("stable" if on_time_rate_kpi > 88 else "needs attention")
+            trend_icon = "📈" if trend_direction == "improving" else ("➡️" if trend_direction == "stable" else "📉")
+            trend_color = "#059669" if trend_direction == "improving" else ("#6B7280" if trend_direction == "stable" else "#DC2626")
+            st.markdown(f"""
+            <div class="coo-insight-card">
+                <div class="coo-insight-icon">{trend_icon}</div>
+                <div class="coo-insight-text">SLA performance <span style="color: {trend_color}; font-weight: 600;">{trend_direction}</span> over the past week</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with insight_cols[1]:
+            # Top performing regions from our route pairs
+            top_regions = ["Maharashtra", "Karnataka", "Tamil Nadu", "Gujarat", "Delhi"]
+            rng.shuffle(top_regions)
+            st.markdown(f"""
+            <div class="coo-insight-card">
+                <div class="coo-insight-icon">🏆</div>
+                <div class="coo-insight-text">Top regions: <strong>{top_regions[0]}</strong>, <strong>{top_regions[1]}</strong> by volume</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with insight_cols[2]:
+            # Use actual HIGH_RISK_CORRIDORS for emerging risk
+            emerging_corridor = rng.choice(HIGH_RISK_CORRIDOR_NAMES)
+            st.markdown(f"""
+            <div class="coo-insight-card">
+                <div class="coo-insight-icon">🔍</div>
+                <div class="coo-insight-text">Emerging risk: <strong>{emerging_corridor}</strong> corridor</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with insight_cols[3]:
+            capacity_pct = int(get_fluctuating_kpi(75, 8, daily_seed + 10))
+            capacity_status = "within target" if capacity_pct < 85 else "nearing capacity"
+            st.markdown(f"""
+            <div class="coo-insight-card">
+                <div class="coo-insight-icon">📦</div>
+                <div class="coo-insight-text">Operational capacity at <strong>{capacity_pct}%</strong> — {capacity_status}</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown("<div style='height: 1.5rem'></div>", unsafe_allow_html=True)
+        
+        # ───────────────────────────────────────────────────────────────────────────
+        # ZONE 5: Strategic Shipment Snapshot (READ-ONLY from shipment_flow)
+        # 🎯 MANDATORY: Read ONLY from st.session_state["shipment_flow"]
+        # 📊 EXACT DISTRIBUTIONS: SLA 40/20/40, Risk 20-80, Priority 40/60
+        # ───────────────────────────────────────────────────────────────────────────
+        st.markdown('<div class="coo-section-title">📦 Strategic Shipment Snapshot</div>', unsafe_allow_html=True)
+        
+        # 📊 MANDATORY DISTRIBUTIONS (same module constants as Viewer for consistency):
+        # SLA 40/20/40, Risk 20-80, Priority 40/60
+        
+        # 🌐 READ FROM GLOBAL SHIPMENT_FLOW STORE - columnar lists, one DataFrame build at the end
+        snapshot_ids, snapshot_routes, snapshot_stages, snapshot_states = [], [], [], []
+        for idx, (sid, ship) in enumerate(islice(all_shipments.items(), 15)):  # Limit to 15 for executive view
+            # ✅ READ actual state from shipment data
+            state = ship.get("current_state", "CREATED")
+            
+            # ✅ REALISTIC ROUTES
+            stored_source = ship.get("source_state")
+            stored_dest = ship.get("destination_state")
+            if not (stored_source and stored_dest and stored_source != "N/A" and stored_dest != "N/A"):
+                stored_source, stored_dest = get_realistic_route(sid, daily_seed + idx)
+            
+            snapshot_ids.append(sid)
+            snapshot_routes.append(f"{stored_source[:12]} → {stored_dest[:12]}")
+            snapshot_stages.append(COO_STAGE_LABELS.get(state, state))
+            snapshot_states.append(state)
+        
+        # 🚫 NO SYNTHETIC FALLBACK – If no data, show empty state message
+        if not snapshot_ids:
+            st.info("📭 No shipments in the system yet. Create shipments from the Sender dashboard to see them here.")
+        
+        if snapshot_ids:
+            # ✅ NO SORTING - Keep original order (newest shipments from flow store appear FIRST)
+            # Flow store shipments are merged first above, so newest appear at top
+            n_rows = len(snapshot_ids)
+            
+            # ⚡ One seeded generator, one vectorized draw per column (deterministic per day)
+            snapshot_rng = np.random.default_rng(daily_seed)
+            # 📊 EXACT PRIORITY DISTRIBUTION: 40% EXPRESS, 60% NORMAL
+            priorities = snapshot_rng.choice(PRIORITY_OPTIONS, size=n_rows, p=PRIORITY_PROBS)
+            # 📊 EXACT RISK RANGE: 20-80 (uniform distribution)
+            risks = snapshot_rng.integers(20, 81, size=n_rows)
+            # 📊 EXACT SLA DISTRIBUTION: 40% At Risk, 20% Warning, 40% On Track
+            # Special case: DELIVERED stage shows "Completed"
+            slas = np.where(
+                np.asarray(snapshot_states) == "DELIVERED",
+                "Completed",
+                snapshot_rng.choice(SLA_OPTIONS, size=n_rows, p=SLA_PROBS)
+            )
+            
+            df = pd.DataFrame({
+                "Shipment ID": snapshot_ids,
+                "Route": snapshot_routes,
+                "Stage": snapshot_stages,
+                "SLA": slas,
+                "Risk": risks,
+                "Priority": priorities
+            })
+            
+            # Column stylers - each styles one column in a single vectorized np.select (axis=0)
+            def style_coo_stage(col):
+                return np.select(
+                    [col == 'Delivered', col == 'In Transit', col == 'Out for Delivery'],
+                    ['background-color: #D1FAE5; color: #065F46;',
+                     'background-color: #FEF3C7; color: #92400E;',
+                     'background-color: #DBEAFE; color: #1E40AF;'],
+                    default='background-color: #F5F3FF; color: #6D28D9;'
+                )
+            
+            def style_coo_sla(col):
+                return np.select(
+                    [col == 'At Risk', col == 'Warning'],
+                    ['background-color: #FEE2E2; color: #991B1B;',
+                     'background-color: #FEF3C7; color: #92400E;'],
+                    default='background-color: #D1FAE5; color: #065F46;'  # Completed / On Track
+                )
+            
+            def style_coo_risk(col):
+                return np.select(
+                    [col >= 70, col >= 40],
+                    ['background-color: #FEE2E2; color: #991B1B; font-weight: 600;',
+                     'background-color: #FEF3C7; color: #92400E;'],
+                    default='background-color: #D1FAE5; color: #065F46;'
+                )
+            
+            def style_coo_priority(col):
+                return np.where(
+                    col == 'EXPRESS',
+                    'background-color: #FEE2E2; color: #B91C1C; font-weight: 600;',
+                    'background-color: #F3F4F6; color: #374151;'
+                )
+            
+            styled_df = (
+                df.style
+                .apply(style_coo_stage, subset=['Stage'])
+                .apply(style_coo_sla, subset=['SLA'])
+                .apply(style_coo_risk, subset=['Risk'])
+                .apply(style_coo_priority, subset=['Priority'])
+            )
+            
+            st.dataframe(
+                styled_df,
+                use_container_width=True,
+                height=350,
+                hide_index=True,
+                column_config={
+                    "Shipment ID": st.column_config.TextColumn("Shipment ID", width="medium"),
+                    "Route": st.column_config.TextColumn("Route", width="large"),
+                    "Stage": st.column_config.TextColumn("Stage", width="medium"),
+                    "SLA": st.column_config.TextColumn("SLA Status", width="small"),
+                    "Risk": st.column_config.NumberColumn("Risk", width="small", format="%d"),
+                    "Priority": st.column_config.TextColumn("Priority", width="small")
+                }
+            )
+        
+        st.markdown("<div style='height: 1.5rem'></div>", unsafe_allow_html=True)
+        
+        # ───────────────────────────────────────────────────────────────────────────
+        # ZONE 6: Corridor Heatmap (Simplified for Executive View)
+        # ───────────────────────────────────────────────────────────────────────────
+        # ⚡ Lazy body: the snapshot read and heatmap build run only while the expander is open
+        corridor_expander = lazy_expander("🗺️ Corridor Risk Heatmap", key="coo_corridor_expander")
+        with corridor_expander:
+            if container_is_open(corridor_expander):
+                # ⚡ Synthetic fill + aggregation + pivot cached across reruns - a hit is a dict lookup
+                @st.cache_data(ttl=3600, show_spinner=False)
+                def build_corridor_pivot(daily_seed, snapshot_key, _corridor_data):
+                    """Corridor breach-risk pivot as (values, row labels, column labels) - keyed on day + snapshot contents"""
+                    corridor_data = _corridor_data
+                    
+                    # Generate synthetic corridor data if needed
+                    if not corridor_data:
+                        # ⚡ One batch draw per column instead of ~6 Python RNG calls per row. The Generator is
+                        # seeded from daily_seed on each cache miss so every (daily_seed) entry holds the same
+                        # deterministic grid, whichever session builds it; seeding costs ~10µs
+                        rng = np.random.default_rng((daily_seed + COO_CORRIDORS_SALT) & 0xFFFFFFFF)
+                        n_states = N_INDIA_STATES
+                        n_pairs = n_states * (n_states - 1)
+                        n_rows = min(int(rng.integers(20, 31)), n_pairs)
+                        # ⚡ Distinct (source, destination) pairs drawn without replacement from the S×(S-1)
+                        # off-diagonal cells - no duplicate corridors, so every cell's mean is its single draw
+                        pair_ids = rng.choice(n_pairs, size=n_rows, replace=False)
+                        src_idx, dst_idx = np.divmod(pair_ids, n_states - 1)
+                        dst_idx += dst_idx >= src_idx  # skip the diagonal: source != destination
+                        # float32 throughout - plenty for a colour scale, half the bytes in the Plotly payload
+                        breach = rng.uniform(0.05, 0.75, n_rows).astype(np.float32)
+                        
+                        # ⚡ Unique cells - direct assignment into the S×S grid, no scatter-mean needed
+                        grid = np.full((n_states, n_states), np.nan, dtype=np.float32)
+                        grid[src_idx, dst_idx] = breach
+                        row_mask = np.zeros(n_states, dtype=bool)
+                        col_mask = np.zeros(n_states, dtype=bool)
+                        row_mask[src_idx] = True
+                        col_mask[dst_idx] = True
+                        return (
+                            grid[np.ix_(row_mask, col_mask)],
+                            INDIA_STATE_LABELS[row_mask].tolist(),
+                            INDIA_STATE_LABELS[col_mask].tolist(),
+                        )
+                    
+                    # ⚡ Factorize the state columns once (categories come back sorted, like the pivot's axes)
+                    # and scatter-mean over the codes instead of a DataFrame pivot_table
+                    src = pd.Categorical([d.get("source_state") for d in corridor_data])
+                    dst = pd.Categorical([d.get("destination_state") for d in corridor_data])
+                    breach = np.array([d.get("avg_breach_probability") for d in corridor_data], dtype=np.float32)
+                    
+                    # pivot_table's mean skips missing keys and NaN values - mask them out of the scatter
+                    valid = (src.codes >= 0) & (dst.codes >= 0) & ~np.isnan(breach)
+                    pivot, row_mask, col_mask = corridor_mean_grid(
+                        src.codes[valid].astype(np.intp), dst.codes[valid].astype(np.intp), breach[valid],
+                        len(src.categories), len(dst.categories)
+                    )
+                    return pivot, src.categories[row_mask].tolist(), dst.categories[col_mask].tolist()
+                
+                corridor_snapshot = read_snapshot(CORRIDOR_SNAPSHOT) or {}
+                corridor_data = corridor_snapshot.get("data", corridor_snapshot) if corridor_snapshot and isinstance(corridor_snapshot, dict) else None
+                if not corridor_data or not isinstance(corridor_data, list):
+                    corridor_data = None
+                
+                try:
+                    go = get_plotly_go()  # ⚡ Shared lazy handle - plotly is imported only when the heatmap renders
+                    
+                    # Cache key over the fields the pivot reads - the rows themselves are not hashed (_corridor_data)
+                    snapshot_key = None if corridor_data is None else tuple(
+                        (d.get("source_state"), d.get("destination_state"), d.get("avg_breach_probability"))
+                        for d in corridor_data
+                    )
+                    
+                    pivot_values, row_labels, col_labels = build_corridor_pivot(daily_seed, snapshot_key, corridor_data)
+                    
+                    # ⚡ No figure build for an empty grid - trimmed rows/cols always hold a value, so size is the test
+                    if pivot_values.size == 0:
+                        st.info("Insufficient corridor data")
+                    else:
+                        # ⚡ Bare Heatmap trace instead of px.imshow - no image-mode wrapping, and no hover
+                        # payload for the (mostly) NaN cells
+                        fig = go.Figure(go.Heatmap(z=pivot_values, x=col_labels, y=row_labels, **COO_HEATMAP_TRACE_STYLE))
+                        fig.update_layout(**COO_HEATMAP_LAYOUT)
+                        
+                        st.plotly_chart(fig, use_container_width=True)
+                except (ImportError, ValueError, KeyError, TypeError, AttributeError):
+                    # Missing plotly or malformed snapshot rows (incl. non-dict rows) only - anything else is a bug and should surface
+                    st.info("Heatmap visualization unavailable")
+
+
+# ==================================================
+# 📊 COMPLIANCE & AUDIT CENTER - Best-in-Class Regulator-Ready Console
+# ==================================================
+with main_tabs[5]:
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # 📊 COMPLIANCE & AUDIT CENTER - Regulator-Ready Audit Console
+    # ═══════════════════════════════════════════════════════════════════════════════
+    
+    # Compliance Center CSS - Formal, neutral, trustworthy
+    st.markdown(COMPLIANCE_CSS, unsafe_allow_html=True)
     
     # ───────────────────────────────────────────────────────────────────────────
     # ZONE 1: Formal Header
@@ -12224,77 +12652,145 @@ with main_tabs[5]:
     
     # ✅ ENHANCED COMPLIANCE METRICS with non-zero values
     daily_seed = get_daily_seed()
-    rng = random.Random(daily_seed + hash("compliance_metrics"))
+    # ⚡ All demo compliance counters in one vectorized draw (inclusive ranges, as randint had them):
+    # overrides 3-9, access violations 1-4, pending reviews 4-12, role-based denials 0-5.
+    # stable_hash keeps them identical across server processes, unlike the salted builtin hash()
+    metrics_rng = np.random.default_rng((daily_seed + stable_hash("compliance_metrics")) & 0xFFFFFFFF)
+    override_count, access_violations, pending_reviews, role_denials = (
+        metrics_rng.integers([3, 1, 4, 0], [10, 5, 13, 6]).tolist()
+    )
     
     total_shipments = demo_state['total_shipments']
     
-    # Count all audit events
-    total_audit_events = sum(len(s.get("history", [])) for s in shipments.values())
+    def build_compliance_view():
+        """History event count, event-backed audit log (as a sorted DataFrame) and its display slice, export rows and
+        shipment ids - derived from the flow store, event log and daily seed only, so it is rebuilt
+        only when they change"""
+        export_records = []
+        
+        # ✅ BUILD AUDIT LOG FROM GLOBAL SHIPMENT_FLOW STORE (single source of truth)
+        # ⚡ Flatten to plain tuples; formatting, badges and labels are done column-wise below
+        # (object frames keep raw values - None stays None, as the old per-row f-strings saw it)
+        # flow_shipments is list of (shipment_id, ship_dict) tuples
+        flow_records = []
+        for sid, flow_ship in flow_shipments:
+            origin = flow_ship.get("origin", {})
+            destination = flow_ship.get("destination", {})
+            route = f"{origin.get('city', 'Unknown')}, {origin.get('state', '')} → {destination.get('city', 'Unknown')}, {destination.get('state', '')}"
+            flow_records.extend(
+                (sid, route, t.get("from_stage", "CREATED"), t.get("to_stage", "CREATED"), t.get("triggered_by", "SYSTEM"), t.get("timestamp", ""))
+                for t in flow_ship.get("transitions", [])
+            )
+        flow_df = pd.DataFrame(
+            flow_records, columns=["Shipment ID", "Route", "from_stage", "to_stage", "Role", "ts"], dtype=object
+        )
+        flow_df["Timestamp"] = format_audit_timestamps(flow_df["ts"], datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        flow_df["_sort_ts"] = flow_df["ts"].map(str)
+        flow_df["Event"] = "STAGE_" + flow_df["to_stage"].map(str)
+        flow_df["Action"] = audit_stage_labels(flow_df["from_stage"]) + " → " + audit_stage_labels(flow_df["to_stage"])
+        flow_df["badge_class"] = classify_audit_badges(flow_df["to_stage"], FLOW_AUDIT_BADGE_RULES)
+        
+        # Fallback: Also include events from legacy shipments history (same pass builds the export rows;
+        # one record per history event, so len(history_records) is the history event count)
+        history_records = []
+        for sid, s in shipments.items():
+            history = s.get("history", [])
+            history_records.extend(
+                (sid, e.get("event_type", "UNKNOWN"), e.get("role", "SYSTEM"), e.get("current_state", "N/A"), e.get("next_state", "N/A"), e.get("timestamp", "N/A"))
+                for e in history
+            )
+            
+            # Prepare export data - same pass over the shipment (raw values; filled column-wise below)
+            if history:
+                first_event = history[0]
+                metadata = first_event.get("metadata", {})
+                export_records.append((
+                    sid, s.get("current_state", "UNKNOWN"), s.get("source_state"), s.get("destination_state"),
+                    metadata.get("weight_kg", 0), metadata.get("delivery_type", "NORMAL"), len(history),
+                    str(first_event.get("timestamp", "1970-01-01T00:00:00"))  # sort key normalized once, here
+                ))
+        
+        history_df = pd.DataFrame(
+            history_records, columns=["Shipment ID", "Event", "Role", "current", "next_state", "ts"], dtype=object
+        )
+        history_df["Timestamp"] = format_audit_timestamps(history_df["ts"], "N/A")
+        history_df["_sort_ts"] = history_df["ts"].map(str)
+        history_df["Action"] = history_df["current"].map(str) + " → " + history_df["next_state"].map(str)
+        history_df["badge_class"] = classify_audit_badges(history_df["Event"], EVENT_AUDIT_BADGE_RULES)
+        
+        audit_df = pd.concat(
+            [flow_df.reindex(columns=AUDIT_LOG_COLUMNS), history_df.reindex(columns=AUDIT_LOG_COLUMNS)],
+            ignore_index=True
+        )
+        
+        # Sort by timestamp descending (thin logs are padded at display time, not here - see ZONE 3)
+        audit_df = sort_audit_log(audit_df)
+        
+        # ⚡ Shipment export as one frame - placeholders only for rows missing route/weight
+        export_df = pd.DataFrame(export_records, columns=EXPORT_SHIPMENT_COLUMNS, dtype=object)
+        present = export_df[["Source_State", "Destination_State", "Weight_KG"]].astype(bool)
+        needs_meta = ~present.all(axis=1)
+        if needs_meta.any():
+            synth = pd.DataFrame(
+                export_df.loc[needs_meta, "Shipment_ID"].map(synthetic_export_meta).tolist(),
+                index=export_df.index[needs_meta], columns=["source", "dest", "weight"], dtype=object
+            )
+            source = export_df["Source_State"].where(present["Source_State"], synth["source"])
+            # A placeholder destination must not repeat the (possibly real) source
+            synth_dest = synth["dest"].where(synth["dest"] != source.reindex(synth.index), synth["source"])
+            export_df["Source_State"] = source
+            export_df["Destination_State"] = export_df["Destination_State"].where(present["Destination_State"], synth_dest)
+            export_df["Weight_KG"] = export_df["Weight_KG"].where(present["Weight_KG"], synth["weight"])
+        delivery_type = export_df["Delivery_Type"]
+        export_df["Delivery_Type"] = delivery_type.where(
+            delivery_type.map(bool) & (delivery_type != "N/A"), "NORMAL"
+        ).str.upper()
+        export_df = export_df.infer_objects().sort_values(
+            "Created_At", ascending=False, kind="mergesort", ignore_index=True
+        )
+        
+        # Display columns only, Route early; Route is dropped when no shown row has one
+        audit_display_df = audit_df.head(100)[AUDIT_DISPLAY_COLUMNS].dropna(axis=1, how="all")
+        
+        return len(history_records), audit_df, audit_display_df, export_df, tuple(shipments)
+    
+    # ⚡ Rebuild the compliance view only when the flow store, event log or daily seed changed (session-scoped -
+    # the flow store is per session, so a process-wide cache would leak across users)
+    compliance_view_key = (ShipmentFlowStore.version(), get_event_log_version(), daily_seed)
+    compliance_view_cache = st.session_state.get("_compliance_view_cache")
+    if compliance_view_cache and compliance_view_cache[0] == compliance_view_key and compliance_view_cache[1] is shipments:
+        compliance_view = compliance_view_cache[2]
+    else:
+        compliance_view = build_compliance_view()
+        st.session_state._compliance_view_cache = (compliance_view_key, shipments, compliance_view)
+    history_event_count, compliance_audit_df, compliance_audit_display_df, compliance_export_df, compliance_shipment_ids = compliance_view
+    
+    # Count all audit events - ⚡ counted with the cached view, from the same shipments the tab shows and exports
+    total_audit_events = history_event_count
     # DEMO MODE – Ensure realistic minimum events
     total_audit_events = max(total_audit_events, total_shipments * 4)
     total_audit_events = int(get_fluctuating_kpi(total_audit_events, 3, daily_seed))
     
-    # ✅ OVERRIDES: 3-9 range (realistic for active logistics)
-    override_count = rng.randint(3, 9)
-    
     # ✅ SLA BREACHES: 10-40 range based on demo state
     sla_breach_count = max(10, min(40, int(get_fluctuating_kpi(demo_state['high_risk_count'] * 2, 15, daily_seed + 1))))
     
-    # ✅ ACCESS VIOLATIONS: 1-4 range (low but non-zero)
-    access_violations = rng.randint(1, 4)
-    
-    # ✅ PENDING REVIEWS: 4-12 range
-    pending_reviews = rng.randint(4, 12)
-    
     # ───────────────────────────────────────────────────────────────────────────
     # ZONE 2: Compliance KPI Summary (ENHANCED with non-zero KPIs)
     # ───────────────────────────────────────────────────────────────────────────
     st.markdown('<div class="section-title">📈 Compliance Overview</div>', unsafe_allow_html=True)
     
-    kpi_cols = st.columns(5)
-    
-    with kpi_cols[0]:
-        st.markdown(f"""
-        <div class="compliance-kpi-card">
-            <div class="compliance-kpi-value compliance-kpi-value-neutral">{total_audit_events:,}</div>
-            <div class="compliance-kpi-label">Audit Events Logged</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_cols[1]:
-        override_color = "compliance-kpi-value-amber" if override_count > 5 else "compliance-kpi-value-green"
-        st.markdown(f"""
-        <div class="compliance-kpi-card">
-            <div class="compliance-kpi-value {override_color}">{override_count}</div>
-            <div class="compliance-kpi-label">Overrides Recorded</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_cols[2]:
-        breach_color = "compliance-kpi-value-red" if sla_breach_count > 25 else ("compliance-kpi-value-amber" if sla_breach_count > 15 else "compliance-kpi-value-green")
-        st.markdown(f"""
-        <div class="compliance-kpi-card">
-            <div class="compliance-kpi-value {breach_color}">{sla_breach_count}</div>
-            <div class="compliance-kpi-label">SLA Breach Incidents</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_cols[3]:
-        violation_color = "compliance-kpi-value-red" if access_violations > 2 else "compliance-kpi-value-amber"
-        st.markdown(f"""
-        <div class="compliance-kpi-card">
-            <div class="compliance-kpi-value {violation_color}">{access_violations}</div>
-            <div class="compliance-kpi-label">Access Violations</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with kpi_cols[4]:
-        st.markdown(f"""
-        <div class="compliance-kpi-card">
-            <div class="compliance-kpi-value compliance-kpi-value-amber">{pending_reviews}</div>
-            <div class="compliance-kpi-label">Pending Reviews</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # ⚡ All five cards in one grid block - a single markdown element instead of 5 columns + 5 elements
+    override_color = "compliance-kpi-value-amber" if override_count > 5 else "compliance-kpi-value-green"
+    breach_color = "compliance-kpi-value-red" if sla_breach_count > 25 else ("compliance-kpi-value-amber" if sla_breach_count > 15 else "compliance-kpi-value-green")
+    violation_color = "compliance-kpi-value-red" if access_violations > 2 else "compliance-kpi-value-amber"
+    kpi_cards = "".join([
+        COMPLIANCE_KPI_CARD.format(value_class="compliance-kpi-value-neutral", value=f"{total_audit_events:,}", label="Audit Events Logged"),
+        COMPLIANCE_KPI_CARD.format(value_class=override_color, value=override_count, label="Overrides Recorded"),
+        COMPLIANCE_KPI_CARD.format(value_class=breach_color, value=sla_breach_count, label="SLA Breach Incidents"),
+        COMPLIANCE_KPI_CARD.format(value_class=violation_color, value=access_violations, label="Access Violations"),
+        COMPLIANCE_KPI_CARD.format(value_class="compliance-kpi-value-amber", value=pending_reviews, label="Pending Reviews"),
+    ])
+    st.markdown(f'<div class="compliance-kpi-grid">{kpi_cards}</div>', unsafe_allow_html=True)
     
     st.markdown("<div style='height: 1rem'></div>", unsafe_allow_html=True)
     
@@ -12310,16 +12806,16 @@ with main_tabs[5]:
         st.markdown('<div class="section-title">⚠️ Override Audit Trail</div>', unsafe_allow_html=True)
         
         if overrides_today:
+            # ⚡ One markdown element for all rows instead of one websocket delta per override
+            override_rows = []
             for override in overrides_today[:5]:
                 reason = override.get('reason', 'No reason provided')
-                st.markdown(f"""
-                <div class="audit-event-row">
-                    <span class="audit-timestamp">{override['timestamp'][:16].replace('T', ' ')}</span>
-                    <span class="audit-shipment-id">{override['shipment_id']}</span>
-                    <span class="audit-event-badge audit-badge-override">OVERRIDE</span>
-                    <span style="margin-left: 0.5rem; color: #991B1B; font-size: 0.85rem;">{reason[:50]}{'...' if len(reason) > 50 else ''}</span>
-                </div>
-                """, unsafe_allow_html=True)
+                override_rows.append(COMPLIANCE_OVERRIDE_ROW.format(
+                    ts=override['timestamp'][:16].replace('T', ' '),
+                    sid=override['shipment_id'],
+                    reason=reason[:50] + ('...' if len(reason) > 50 else '')
+                ))
+            st.markdown("".join(override_rows), unsafe_allow_html=True)
         else:
             # Generate sample overrides from notification bus
             st.info("No overrides recorded today. All shipments following standard flow.")
@@ -12328,13 +12824,13 @@ with main_tabs[5]:
         st.markdown('<div class="section-title">🔔 Compliance Alerts</div>', unsafe_allow_html=True)
         
         if compliance_notifications:
-            for notif in compliance_notifications[:3]:
-                st.markdown(f"""
-                <div style="background: #FEF2F2; border-radius: 8px; padding: 0.75rem; margin-bottom: 0.5rem; border: 1px solid #FECACA;">
-                    <div style="font-size: 0.8rem; color: #991B1B; font-weight: 500;">{notif['message'][:80]}{'...' if len(notif['message']) > 80 else ''}</div>
-                    <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">{notif['timestamp'][:16].replace('T', ' ')}</div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown("".join(
+                COMPLIANCE_ALERT_ROW.format(
+                    message=notif['message'][:80] + ('...' if len(notif['message']) > 80 else ''),
+                    ts=notif['timestamp'][:16].replace('T', ' ')
+                )
+                for notif in compliance_notifications[:3]
+            ), unsafe_allow_html=True)
         else:
             st.markdown("""
             <div style="background: #F0FDF4; border-radius: 8px; padding: 0.75rem; border: 1px solid #BBF7D0;">
@@ -12349,170 +12845,20 @@ with main_tabs[5]:
     # ───────────────────────────────────────────────────────────────────────────
     st.markdown('<div class="section-title">📋 Audit Event Log</div>', unsafe_allow_html=True)
     
-    # ✅ BUILD AUDIT LOG FROM GLOBAL SHIPMENT_FLOW STORE (single source of truth)
-    audit_log = []
-    
-    # First: Add transitions from the flow store (authoritative source)
-    # flow_shipments is list of (shipment_id, ship_dict) tuples
-    for sid, flow_ship in flow_shipments:
-        origin = flow_ship.get("origin", {})
-        destination = flow_ship.get("destination", {})
-        route = f"{origin.get('city', 'Unknown')}, {origin.get('state', '')} → {destination.get('city', 'Unknown')}, {destination.get('state', '')}"
-        
-        for transition in flow_ship.get("transitions", []):
-            from_stage = transition.get("from_stage", "CREATED")
-            to_stage = transition.get("to_stage", "CREATED")
-            ts = transition.get("timestamp", "")
-            role = transition.get("triggered_by", "SYSTEM")
-            
-            # Format timestamp
-            if isinstance(ts, str) and len(ts) >= 19:
-                ts_display = ts[:19].replace("T", " ")
-            else:
-                ts_display = str(ts)[:19] if ts else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Determine badge class based on stage
-            if "CREATED" in to_stage:
-                badge_class = "audit-badge-created"
-            elif "APPROVED" in to_stage or "MANAGER" in to_stage or "SUPERVISOR" in to_stage:
-                badge_class = "audit-badge-approved"
-            elif "DISPATCH" in to_stage or "TRANSIT" in to_stage:
-                badge_class = "audit-badge-transit"
-            elif "DELIVERED" in to_stage or "CONFIRMED" in to_stage:
-                badge_class = "audit-badge-delivered"
-            elif "OVERRIDE" in to_stage or "WAREHOUSE" in to_stage:
-                badge_class = "audit-badge-override"
-            else:
-                badge_class = "audit-badge-created"
-            
-            # Human-readable stage names
-            stage_names = {
-                "CREATED": "Created",
-                "SENDER_MANAGER": "Mgr Approved",
-                "SENDER_SUPERVISOR": "Sup Approved",
-                "SYSTEM_DISPATCH": "Dispatched",
-                "RECEIVER_MANAGER": "Recv Mgr",
-                "WAREHOUSE": "Warehouse",
-                "OUT_FOR_DELIVERY": "Out for Delivery",
-                "DELIVERED": "Delivered",
-                "CUSTOMER_CONFIRMED": "Confirmed",
-                "COMPLIANCE_LOGGED": "Logged"
-            }
-            
-            from_name = stage_names.get(from_stage, from_stage)
-            to_name = stage_names.get(to_stage, to_stage)
-            
-            audit_log.append({
-                "Timestamp": ts_display,
-                "Shipment ID": sid,
-                "Route": route,
-                "Event": f"STAGE_{to_stage}",
-                "Role": role,
-                "Action": f"{from_name} → {to_name}",
-                "badge_class": badge_class,
-                "_sort_ts": ts
-            })
-    
-    # Fallback: Also include events from legacy shipments history
-    for sid, s in shipments.items():
-        for event in s.get("history", []):
-            event_type = event.get("event_type", "UNKNOWN")
-            timestamp = event.get("timestamp", "N/A")
-            role = event.get("role", "SYSTEM")
-            
-            # Format timestamp
-            if isinstance(timestamp, str) and len(timestamp) >= 19:
-                ts_display = timestamp[:19].replace("T", " ")
-            else:
-                ts_display = str(timestamp)[:19] if timestamp else "N/A"
-            
-            # Determine event badge class
-            if "CREATED" in event_type:
-                badge_class = "audit-badge-created"
-            elif "APPROVED" in event_type:
-                badge_class = "audit-badge-approved"
-            elif "TRANSIT" in event_type or "DISPATCHED" in event_type:
-                badge_class = "audit-badge-transit"
-            elif "DELIVERED" in event_type:
-                badge_class = "audit-badge-delivered"
-            elif "OVERRIDE" in event_type:
-                badge_class = "audit-badge-override"
-            else:
-                badge_class = "audit-badge-created"
-            
-            # Action summary
-            current = event.get("current_state", "N/A")
-            next_state = event.get("next_state", "N/A")
-            action = f"{current} → {next_state}"
-            
-            audit_log.append({
-                "Timestamp": ts_display,
-                "Shipment ID": sid,
-                "Event": event_type,
-                "Role": role,
-                "Action": action,
-                "badge_class": badge_class,
-                "_sort_ts": timestamp
-            })
-    
-    # ✅ GENERATE DIVERSE SYNTHETIC EVENTS if not enough data
-    if len(audit_log) < 50:
-        event_types = [t["event"] for t in COMPLIANCE_EVENT_TEMPLATES]
-        rng = random.Random(daily_seed + hash("audit_log_synthetic"))
-        
-        # Generate 50-80 synthetic audit events
-        for i in range(rng.randint(50, 80)):
-            event_type = rng.choice(event_types)
-            
-            # Get event details from template
-            details = get_compliance_event_details(event_type, None)
-            
-            # Generate realistic timestamp (past 72 hours)
-            hours_ago = rng.uniform(0.5, 72)
-            ts = datetime.now() - timedelta(hours=hours_ago)
-            ts_display = ts.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Generate shipment ID
-            sid = f"SHIP-{rng.randint(1000, 9999)}"
-            
-            # Determine badge class
-            if "CREATED" in event_type:
-                badge_class = "audit-badge-created"
-            elif "APPROVED" in event_type:
-                badge_class = "audit-badge-approved"
-            elif "TRANSIT" in event_type or "DISPATCHED" in event_type:
-                badge_class = "audit-badge-transit"
-            elif "DELIVERED" in event_type:
-                badge_class = "audit-badge-delivered"
-            elif "OVERRIDE" in event_type or "ESCALAT" in event_type:
-                badge_class = "audit-badge-override"
-            else:
-                badge_class = "audit-badge-created"
-            
-            audit_log.append({
-                "Timestamp": ts_display,
-                "Shipment ID": sid,
-                "Event": event_type,
-                "Role": details["role"],
-                "Action": f"{details['transition'][0]} → {details['transition'][1]}",
-                "badge_class": badge_class,
-                "_sort_ts": ts.isoformat()
-            })
+    # ⚡ Sorted rows come from the cached compliance view - never mutated here
+    audit_log = compliance_audit_df
+    # ⚡ Top-100 display projection is prebuilt with the cached view - no per-rerun slice/select/dropna
+    df_log = compliance_audit_display_df
     
-    # Sort by timestamp descending
-    audit_log.sort(key=lambda x: str(x.get("_sort_ts", "")), reverse=True)
+    # ✅ GENERATE DIVERSE SYNTHETIC EVENTS if not enough data - only here, where the log is shown, and
+    # outside the session-cached view so the padding's "hours ago" timestamps follow its 5-minute cache
+    audit_log_padded = len(audit_log) < 50
+    if audit_log_padded:
+        audit_log = sort_audit_log(pd.concat([audit_log, synthetic_audit_rows(daily_seed)], ignore_index=True))
+        df_log = audit_log.head(100)[AUDIT_DISPLAY_COLUMNS].dropna(axis=1, how="all")
     
     # Display as dataframe
-    if audit_log:
-        # Create display dataframe - include Route column for full visibility
-        display_log = [{k: v for k, v in item.items() if not k.startswith("_") and k != "badge_class"} for item in audit_log[:100]]
-        df_log = pd.DataFrame(display_log)
-        
-        # Ensure column order puts Route early
-        column_order = ["Timestamp", "Shipment ID", "Route", "Event", "Role", "Action"]
-        existing_cols = [c for c in column_order if c in df_log.columns]
-        df_log = df_log[existing_cols]
-        
+    if not audit_log.empty:
         st.dataframe(
             df_log,
             use_container_width=True,
@@ -12537,68 +12883,56 @@ with main_tabs[5]:
     # ───────────────────────────────────────────────────────────────────────────
     st.markdown('<div class="section-title">🔍 Shipment Audit Trail</div>', unsafe_allow_html=True)
     
-    shipment_list = list(shipments.keys())
-    
-    if shipment_list:
-        selected_shipment = st.selectbox(
-            "Select shipment to view full audit trail:",
-            shipment_list,
-            key="compliance_audit_trail_select",
-            label_visibility="collapsed"
-        )
-        
-        if selected_shipment and selected_shipment in shipments:
-            ship = shipments[selected_shipment]
-            history = ship.get("history", [])
-            
-            # Display immutable badge
-            st.markdown(f"""
-            <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1rem;">
-                <span style="font-weight: 600; color: #334155;">Shipment: {selected_shipment}</span>
-                <span class="immutable-badge">🔒 IMMUTABLE RECORD</span>
-            </div>
-            """, unsafe_allow_html=True)
+    # ⚡ Fragment: picking another shipment reruns only this viewer, not the KPIs, audit log and exports
+    @st.fragment
+    def render_audit_trail_viewer(shipments, shipment_ids):
+        '''Immutable event timeline for the selected shipment'''
+        if shipment_ids:
+            selected_shipment = st.selectbox(
+                "Select shipment to view full audit trail:",
+                shipment_ids,
+                key="compliance_audit_trail_select",
+                label_visibility="collapsed"
+            )
             
-            if history:
-                # Build timeline
-                timeline_html = '<div class="timeline-card">'
-                for idx, event in enumerate(history):
-                    event_type = event.get("event_type", "UNKNOWN")
-                    timestamp = event.get("timestamp", "N/A")
-                    role = event.get("role", "SYSTEM")
-                    current = event.get("current_state", "N/A")
-                    next_state = event.get("next_state", "N/A")
-                    
-                    # Format timestamp
-                    if isinstance(timestamp, str) and len(timestamp) >= 19:
-                        ts_display = timestamp[:19].replace("T", " ")
-                    else:
-                        ts_display = str(timestamp)[:19] if timestamp else "N/A"
-                    
-                    # Determine dot color
-                    if idx == len(history) - 1:
-                        dot_class = "timeline-dot-active"
-                    else:
-                        dot_class = "timeline-dot-complete"
-                    
-                    timeline_html += f'''
-                    <div class="timeline-event">
-                        <div class="timeline-dot {dot_class}"></div>
-                        <div class="timeline-content">
-                            <div class="timeline-event-type">{event_type}</div>
-                            <div class="timeline-meta">
-                                {ts_display} • {role} • {current} → {next_state}
-                            </div>
-                        </div>
-                    </div>
-                    '''
+            if selected_shipment and selected_shipment in shipments:
+                ship = shipments[selected_shipment]
+                history = ship.get("history", [])
                 
-                timeline_html += '</div>'
-                st.markdown(timeline_html, unsafe_allow_html=True)
-            else:
-                st.info("No events recorded for this shipment")
-    else:
-        st.info("No shipments available for audit trail viewing")
+                # Display immutable badge
+                st.markdown(f"""
+                <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1rem;">
+                    <span style="font-weight: 600; color: #334155;">Shipment: {selected_shipment}</span>
+                    <span class="immutable-badge">🔒 IMMUTABLE RECORD</span>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                if history:
+                    # ⚡ Build timeline as one join over a prebuilt row template - no repeated string +=
+                    # (timestamps formatted column-wise by the same helper as the audit log table)
+                    last_idx = len(history) - 1
+                    ts_display = format_audit_timestamps(
+                        pd.Series([event.get("timestamp", "N/A") for event in history], dtype=object), "N/A"
+                    ).tolist()
+                    timeline_rows = ['<div class="timeline-card">']
+                    for idx, event in enumerate(history):
+                        timeline_rows.append(COMPLIANCE_TIMELINE_ROW.format(
+                            dot_class="timeline-dot-active" if idx == last_idx else "timeline-dot-complete",
+                            event_type=event.get("event_type", "UNKNOWN"),
+                            ts=ts_display[idx],
+                            role=event.get("role", "SYSTEM"),
+                            current=event.get("current_state", "N/A"),
+                            next_state=event.get("next_state", "N/A")
+                        ))
+                    timeline_rows.append('</div>')
+                    st.markdown("".join(timeline_rows), unsafe_allow_html=True)
+                else:
+                    st.info("No events recorded for this shipment")
+        else:
+            st.info("No shipments available for audit trail viewing")
+    
+    # ⚡ Selector options come from the cached compliance view - no per-rerun key list
+    render_audit_trail_viewer(shipments, compliance_shipment_ids)
     
     st.markdown("<div style='height: 1.5rem'></div>", unsafe_allow_html=True)
     
@@ -12607,44 +12941,29 @@ with main_tabs[5]:
     # ───────────────────────────────────────────────────────────────────────────
     st.markdown('<div class="section-title">🛡️ Policy Compliance Status</div>', unsafe_allow_html=True)
     
-    policy_cols = st.columns(3)
-    
-    with policy_cols[0]:
-        if access_violations == 0:
-            st.markdown("""
-            <div class="policy-card" style="background: #F0FDF4; border-color: #BBF7D0;">
-                <div class="policy-icon">✅</div>
-                <div class="policy-text" style="color: #065F46;">No unauthorized access detected today</div>
-                <div class="policy-status">All role-based controls functioning</div>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="policy-card" style="background: #FEF2F2; border-color: #FECACA;">
-                <div class="policy-icon">⚠️</div>
-                <div class="policy-text" style="color: #991B1B;">{access_violations} access anomalies detected</div>
-                <div class="policy-status">Review required</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with policy_cols[1]:
-        role_denials = rng.randint(0, 5)
-        st.markdown(f"""
-        <div class="policy-card">
-            <div class="policy-icon">🔐</div>
-            <div class="policy-text">{role_denials} role-based access denials recorded</div>
-            <div class="policy-status">Access control operating normally</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with policy_cols[2]:
-        st.markdown(f"""
-        <div class="policy-card" style="background: #F0FDF4; border-color: #BBF7D0;">
-            <div class="policy-icon">📝</div>
-            <div class="policy-text" style="color: #065F46;">All override actions documented</div>
-            <div class="policy-status">{override_count} overrides with full audit trail</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # ⚡ Three policy cards as one grid block from a shared template - one markdown element, not 3 columns + 3
+    if access_violations == 0:
+        access_card = COMPLIANCE_POLICY_CARD.format(
+            card_style=COMPLIANCE_POLICY_OK[0], text_style=COMPLIANCE_POLICY_OK[1], icon="✅",
+            text="No unauthorized access detected today", status="All role-based controls functioning"
+        )
+    else:
+        access_card = COMPLIANCE_POLICY_CARD.format(
+            card_style=COMPLIANCE_POLICY_ALERT[0], text_style=COMPLIANCE_POLICY_ALERT[1], icon="⚠️",
+            text=f"{access_violations} access anomalies detected", status="Review required"
+        )
+    denials_card = COMPLIANCE_POLICY_CARD.format(
+        card_style="", text_style="", icon="🔐",
+        text=f"{role_denials} role-based access denials recorded", status="Access control operating normally"
+    )
+    overrides_card = COMPLIANCE_POLICY_CARD.format(
+        card_style=COMPLIANCE_POLICY_OK[0], text_style=COMPLIANCE_POLICY_OK[1], icon="📝",
+        text="All override actions documented", status=f"{override_count} overrides with full audit trail"
+    )
+    st.markdown(
+        f'<div class="compliance-policy-grid">{access_card}{denials_card}{overrides_card}</div>',
+        unsafe_allow_html=True
+    )
     
     st.markdown("<div style='height: 1.5rem'></div>", unsafe_allow_html=True)
     
@@ -12653,86 +12972,33 @@ with main_tabs[5]:
     # ───────────────────────────────────────────────────────────────────────────
     st.markdown('<div class="section-title">📥 Export & Evidence</div>', unsafe_allow_html=True)
     
-    st.markdown("""
-    <div class="export-card">
-        <p style="color: #5B21B6; margin: 0 0 1rem 0; font-weight: 500;">
-            Generate official compliance reports for audit and regulatory purposes
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Prepare export data
-    export_data_list = []
-    for sid, s in shipments.items():
-        if s.get("history"):
-            first_event = s["history"][0]
-            metadata = first_event.get("metadata", {})
-            
-            from app.core.india_states import INDIA_STATES
-            
-            source_state = s.get("source_state")
-            dest_state = s.get("destination_state")
-            
-            if not source_state:
-                state_seed = hash(sid + "source") % len(INDIA_STATES)
-                source_state = INDIA_STATES[state_seed]
-            if not dest_state:
-                state_seed = hash(sid + "dest") % len(INDIA_STATES)
-                dest_state = INDIA_STATES[state_seed]
-                if dest_state == source_state:
-                    dest_state = INDIA_STATES[(state_seed + 1) % len(INDIA_STATES)]
-            
-            weight = metadata.get("weight_kg", 0)
-            if not weight:
-                weight_seed = hash(sid + "weight") % 1000
-                weight = round(2.0 + (weight_seed / 1000.0) * 78.0, 1)
-            
-            delivery_type = metadata.get("delivery_type", "NORMAL")
-            if not delivery_type or delivery_type == "N/A":
-                delivery_type = "NORMAL"
-            
-            timestamp_value = first_event.get("timestamp", "1970-01-01T00:00:00")
-            
-            export_data_list.append({
-                "Shipment_ID": sid,
-                "Current_State": s.get("current_state", "UNKNOWN"),
-                "Source_State": source_state,
-                "Destination_State": dest_state,
-                "Weight_KG": weight,
-                "Delivery_Type": delivery_type.upper(),
-                "Event_Count": len(s.get("history", [])),
-                "Created_At": timestamp_value
-            })
+    # ⚡ Export rows come from the cached compliance view - no per-rerun shipment walk
+    export_df = compliance_export_df
     
-    export_data_list.sort(key=lambda x: str(x.get("Created_At", "")), reverse=True)
+    # Export intro + statistics in one markdown element
+    st.markdown(
+        COMPLIANCE_EXPORT_STATS.format(records=len(export_df), events=total_audit_events),
+        unsafe_allow_html=True
+    )
     
-    # Export statistics
-    st.markdown(f"""
-    <div style="background: #F8FAFC; border-radius: 10px; padding: 1rem; margin: 1rem 0; border: 1px solid #E2E8F0;">
-        <div style="display: flex; justify-content: space-around; text-align: center;">
-            <div>
-                <div style="font-size: 1.25rem; font-weight: 700; color: #334155;">{len(export_data_list)}</div>
-                <div style="font-size: 0.8rem; color: #64748B;">Records Available</div>
-            </div>
-            <div>
-                <div style="font-size: 1.25rem; font-weight: 700; color: #334155;">{total_audit_events}</div>
-                <div style="font-size: 0.8rem; color: #64748B;">Total Events</div>
-            </div>
-            <div>
-                <div style="font-size: 1.25rem; font-weight: 700; color: #334155;">CSV / JSON</div>
-                <div style="font-size: 0.8rem; color: #64748B;">Export Formats</div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    def compliance_view_csv(name, build_frame):
+        '''CSV text for a frame of the cached compliance view - projected and serialized at most once per view'''
+        csv_cache = st.session_state.get("_compliance_csv_cache")
+        if not csv_cache or csv_cache[0] is not compliance_view:
+            csv_cache = (compliance_view, {})
+            st.session_state._compliance_csv_cache = csv_cache
+        if name not in csv_cache[1]:
+            csv_cache[1][name] = build_frame().to_csv(index=False)
+        return csv_cache[1][name]
     
     export_cols = st.columns(3)
     
     with export_cols[0]:
         if st.button("📋 Export Audit Log", use_container_width=True, type="primary"):
-            if audit_log:
-                export_audit = [{k: v for k, v in item.items() if not k.startswith("_") and k != "badge_class"} for item in audit_log]
-                csv_data = pd.DataFrame(export_audit).to_csv(index=False)
+            if not audit_log.empty:
+                build_audit_frame = lambda: audit_log[AUDIT_DISPLAY_COLUMNS].dropna(axis=1, how="all")
+                # A padded log (<130 rows) is serialized fresh - its padding is not part of the cached view
+                csv_data = build_audit_frame().to_csv(index=False) if audit_log_padded else compliance_view_csv("audit", build_audit_frame)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 st.download_button(
                     label="⬇️ Download Audit Log (CSV)",
@@ -12746,8 +13012,8 @@ with main_tabs[5]:
     
     with export_cols[1]:
         if st.button("📦 Export Shipment Data", use_container_width=True):
-            if export_data_list:
-                csv_data = pd.DataFrame(export_data_list).to_csv(index=False)
+            if not export_df.empty:
+                csv_data = compliance_view_csv("shipments", lambda: export_df)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 st.download_button(
                     label="⬇️ Download Shipments (CSV)",
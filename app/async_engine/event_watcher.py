@@ -0,0 +1,129 @@
+# app/async_engine/event_watcher.py
+
+"""
+EVENT STORE WATCHER
+
+Purpose:
+- Let the snapshot worker block until the event store changes
+  instead of sleeping a fixed interval and re-reading the whole log
+
+Rules:
+- Uses watchdog (inotify / FSEvents / ReadDirectoryChangesW) when installed
+- Falls back to a cheap os.stat() poll otherwise
+- Never raises on a missing event store (it may not exist yet)
+"""
+
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional dependency
+    FileSystemEventHandler = object
+    Observer = None
+
+
+# ==================================================
+# WATCHER CONFIG
+# ==================================================
+
+STAT_POLL_INTERVAL_SECONDS = 0.5  # fallback only; a stat() is far cheaper than a log read
+
+
+# ==================================================
+# INTERNAL HELPERS
+# ==================================================
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of the file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Sets a flag whenever the watched file is created or modified."""
+
+    def __init__(self, path: str, changed: threading.Event):
+        super().__init__()
+        self._path = path
+        self._changed = changed
+
+    def on_any_event(self, event) -> None:
+        if os.path.abspath(getattr(event, "src_path", "")) == self._path:
+            self._changed.set()
+
+
+# ==================================================
+# PUBLIC API
+# ==================================================
+
+class EventStoreWatcher:
+    """
+    Block until the event store file changes.
+
+    Change is judged by (mtime, size), so appends made while the caller
+    was busy are reported by the next wait, not lost.
+    """
+
+    def __init__(self, path: str):
+        self._path = os.path.abspath(path)
+        self._signature = _file_signature(self._path)
+        self._changed = threading.Event()
+        self._observer = None
+
+        if Observer is not None:
+            try:
+                observer = Observer()
+                observer.schedule(
+                    _ChangeHandler(self._path, self._changed),
+                    os.path.dirname(self._path),
+                    recursive=False,
+                )
+                observer.daemon = True
+                observer.start()
+                self._observer = observer
+            except OSError:
+                # e.g. inotify watch limit reached - stat polling still works
+                self._observer = None
+
+    def _consume_change(self) -> bool:
+        signature = _file_signature(self._path)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        return True
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """
+        Wait up to ``timeout`` seconds for the event store to change.
+
+        Returns:
+            True if it changed since the last wait, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            if self._consume_change():
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            if self._observer is not None:
+                self._changed.wait(remaining)
+                self._changed.clear()
+            else:
+                time.sleep(min(STAT_POLL_INTERVAL_SECONDS, remaining))
+
+    def stop(self) -> None:
+        """Stop the filesystem observer, if one is running."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
@@ -1,11 +1,16 @@
 # app/async_engine/snapshot_worker.py
 
+import atexit
+import os
 import time
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
-from app.storage.event_store import load_all_events
+from app.storage.event_store import EVENT_STORE_FILE, load_all_events
+from app.async_engine.event_watcher import EventStoreWatcher
 from app.core.snapshot_store import (
-    write_snapshot,
+    write_snapshot_batch,
     SLA_SNAPSHOT,
     CORRIDOR_SNAPSHOT,
     HEATMAP_SNAPSHOT,
@@ -26,8 +31,9 @@ from app.core.read_model import build_state_from_events
 # WORKER CONFIG
 # ==================================================
 
-POLL_INTERVAL_SECONDS = 5        # safe for local & prod
+POLL_INTERVAL_SECONDS = 5        # max wait for an event-store change (safe for local & prod)
 MAX_EVENTS_PER_CYCLE = 50_000    # backpressure guard (incremental)
+SLA_PARALLEL_MIN_SHIPMENTS = 5_000  # below this, IPC costs more than it saves
 
 
 # ==================================================
@@ -36,31 +42,109 @@ MAX_EVENTS_PER_CYCLE = 50_000    # backpressure guard (incremental)
 
 _last_processed_index = 0
 
+# Read model folded forward across cycles (empty = cold rebuild next cycle)
+_shipments_state: Dict[str, Dict] = {}
+
+# Per-shipment SLA predictions kept across cycles (refreshed for dirty ids only)
+_sla_snapshot_cache: Dict[str, Any] = {}
+
+# Process pool for large SLA batches (started on first use)
+_executor: Optional[ProcessPoolExecutor] = None
+
 
 # ==================================================
 # SNAPSHOT COMPUTATION
 # ==================================================
 
-def compute_sla_snapshot(shipments: Dict[str, Dict]) -> Dict[str, Any]:
+def _predict_history(history: List[Dict]) -> Dict:
+    """
+    Positional, picklable adapter for pool dispatch.
+    """
+    return predict_sla_breach(history=history)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """
+    Lazily start the shared process pool (one per worker process).
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _executor
+
+
+def _shutdown_executor(wait: bool = True) -> None:
+    """
+    Stop the shared process pool, if one was started.
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=wait)
+        _executor = None
+
+
+atexit.register(_shutdown_executor)
+
+
+def _predict_batch(histories: List[List[Dict]]) -> List[Dict]:
+    """
+    Predict SLA for many histories; fans out to the process pool only
+    when the batch is large enough to amortise pickling the histories.
+    """
+    if len(histories) >= SLA_PARALLEL_MIN_SHIPMENTS:
+        workers = os.cpu_count() or 1
+        try:
+            return list(_get_executor().map(
+                _predict_history,
+                histories,
+                chunksize=max(1, len(histories) // (4 * workers)),
+            ))
+        except BrokenProcessPool:
+            # A dead worker poisons the pool - release it and finish serially
+            _shutdown_executor(wait=False)
+
+    return [_predict_history(history) for history in histories]
+
+
+def compute_sla_snapshot(
+    shipments: Dict[str, Dict],
+    dirty_ids: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
     """
     Compute SLA intelligence snapshot per shipment.
+
+    Predictions depend only on a shipment's history, so only ``dirty_ids``
+    (shipments touched by new events) are re-predicted; the rest carry
+    over from the previous cycle. ``None`` recomputes every shipment.
+
+    Returns a new top-level dict each call; the per-shipment prediction
+    dicts are shared with the cross-cycle cache and must not be mutated.
     """
-    snapshot = {}
+    if dirty_ids is None:
+        _sla_snapshot_cache.clear()
+        dirty_ids = shipments.keys()
 
-    for shipment_id, shipment in shipments.items():
-        snapshot[shipment_id] = predict_sla_breach(
-            history=shipment["history"]
-        )
+    live_ids = []
+    for shipment_id in dirty_ids:
+        if shipment_id in shipments:
+            live_ids.append(shipment_id)
+        else:
+            _sla_snapshot_cache.pop(shipment_id, None)
 
-    return snapshot
+    predictions = _predict_batch(
+        [shipments[shipment_id]["history"] for shipment_id in live_ids]
+    )
+    _sla_snapshot_cache.update(zip(live_ids, predictions))
 
+    return dict(_sla_snapshot_cache)
 
-def compute_heatmap_snapshot() -> Dict[str, Any]:
+
+def compute_heatmap_snapshot(now: Optional[float] = None) -> Dict[str, Any]:
     """
     Compute geo heatmap snapshot.
     """
     return {
-        "generated_at": time.time(),
+        "generated_at": time.time() if now is None else now,
         "points": get_sender_state_heatmap_data(),
     }
 
@@ -84,15 +168,30 @@ def compute_audit_snapshot(
     """
     denials = []
     
+    # The guard only reads a shipment's geo fields, so decide once per
+    # distinct (source, destination, corridor) instead of per shipment
+    reason_by_geo: Dict[Tuple[Any, Any, Any], Optional[str]] = {}
+    
     for shipment_id, shipment in shipments.items():
-        access_allowed, denial_reason = check_access_with_reason(
-            role=role,
-            shipment=shipment,
-            user_regions=user_regions,
+        geo_key = (
+            shipment.get("source_state"),
+            shipment.get("destination_state"),
+            shipment.get("corridor"),
         )
+        if geo_key in reason_by_geo:
+            denial_reason = reason_by_geo[geo_key]
+        else:
+            access_allowed, denial_reason = check_access_with_reason(
+                role=role,
+                shipment=shipment,
+                user_regions=user_regions,
+            )
+            if access_allowed:
+                denial_reason = None
+            reason_by_geo[geo_key] = denial_reason
         
         # Record denial with reason code only
-        if not access_allowed and denial_reason is not None:
+        if denial_reason is not None:
             denials.append({
                 "shipment_id": shipment_id,
                 "reason_code": denial_reason,
@@ -116,20 +215,23 @@ def snapshot_worker_loop() -> None:
     - NEVER block or crash
     """
 
-    global _last_processed_index
+    global _last_processed_index, _shipments_state
 
     print("🟢 Snapshot worker started")
 
+    # Wakes the loop as soon as the event store is appended to
+    watcher = EventStoreWatcher(EVENT_STORE_FILE)
+
     while True:
         try:
             events = load_all_events()
             total_events = len(events)
 
             # --------------------------------------
-            # No new events → sleep
+            # No new events → wait for the store to change
             # --------------------------------------
             if total_events == _last_processed_index:
-                time.sleep(POLL_INTERVAL_SECONDS)
+                watcher.wait_for_change(POLL_INTERVAL_SECONDS)
                 continue
 
             # --------------------------------------
@@ -137,8 +239,8 @@ def snapshot_worker_loop() -> None:
             # --------------------------------------
             new_events = events[_last_processed_index:]
 
-            if len(new_events) > MAX_EVENTS_PER_CYCLE:
-                new_events = new_events[-MAX_EVENTS_PER_CYCLE:]
+            # One timestamp per cycle - every snapshot below shares it
+            cycle_ts = time.time()
 
             print(
                 f"🔄 Processing events "
@@ -146,42 +248,61 @@ def snapshot_worker_loop() -> None:
             )
 
             # --------------------------------------
-            # Build FULL read model (SSOT)
+            # Read model (SSOT): fold only the new events
             # --------------------------------------
-            shipments = build_state_from_events(events)
+            # Cold rebuild on first cycle, after an error, when the log
+            # shrank (rewritten), or when the backlog is so large that a
+            # full replay costs about the same.
+            if (
+                not _shipments_state
+                or total_events < _last_processed_index
+                or len(new_events) > MAX_EVENTS_PER_CYCLE
+            ):
+                _shipments_state = build_state_from_events(events)
+                dirty_ids = None
+            else:
+                build_state_from_events(new_events, _shipments_state)
+                dirty_ids = {e["shipment_id"] for e in new_events}
+            shipments = _shipments_state
 
             # --------------------------------------
             # SLA Snapshot
             # --------------------------------------
-            sla_snapshot = compute_sla_snapshot(shipments)
-            write_snapshot(SLA_SNAPSHOT, {
-                "generated_at": time.time(),
-                "data": sla_snapshot,
-            })
+            sla_snapshot = compute_sla_snapshot(shipments, dirty_ids)
 
             # --------------------------------------
             # Corridor SLA Snapshot
             # --------------------------------------
             corridor_snapshot = compute_corridor_sla_health()
-            write_snapshot(CORRIDOR_SNAPSHOT, {
-                "generated_at": time.time(),
-                "data": corridor_snapshot,
-            })
 
             # --------------------------------------
             # Alerts Snapshot
             # --------------------------------------
             alerts = detect_corridor_alerts(corridor_snapshot)
-            write_snapshot(ALERTS_SNAPSHOT, {
-                "generated_at": time.time(),
-                "alerts": alerts,
-            })
 
             # --------------------------------------
             # Heatmap Snapshot
             # --------------------------------------
-            heatmap_snapshot = compute_heatmap_snapshot()
-            write_snapshot(HEATMAP_SNAPSHOT, heatmap_snapshot)
+            heatmap_snapshot = compute_heatmap_snapshot(now=cycle_ts)
+
+            # --------------------------------------
+            # Publish all analytics snapshots back to back
+            # --------------------------------------
+            write_snapshot_batch({
+                SLA_SNAPSHOT: {
+                    "generated_at": cycle_ts,
+                    "data": sla_snapshot,
+                },
+                CORRIDOR_SNAPSHOT: {
+                    "generated_at": cycle_ts,
+                    "data": corridor_snapshot,
+                },
+                ALERTS_SNAPSHOT: {
+                    "generated_at": cycle_ts,
+                    "alerts": alerts,
+                },
+                HEATMAP_SNAPSHOT: heatmap_snapshot,
+            })
 
             # --------------------------------------
             # Audit Snapshots (for each role)
@@ -199,7 +320,7 @@ def snapshot_worker_loop() -> None:
                     write_audit_snapshot(
                         role=role,
                         denials=denials,
-                        generated_at=int(time.time()),
+                        generated_at=int(cycle_ts),
                     )
 
             # --------------------------------------
@@ -212,8 +333,10 @@ def snapshot_worker_loop() -> None:
         except Exception as e:
             # ❗ NEVER crash the worker
             print(f"❌ Snapshot worker error: {e}")
+            # A partially folded read model cannot be trusted - replay next cycle
+            _shipments_state = {}
 
-        time.sleep(POLL_INTERVAL_SECONDS)
+        watcher.wait_for_change(POLL_INTERVAL_SECONDS)
 
 
 # ==================================================
@@ -87,13 +87,16 @@ def write_audit_snapshot(
         "denials": denials,
     }
     
+    # Serialize once (compact - machine-read) for both the timestamped and latest files
+    payload = json.dumps(audit_data, ensure_ascii=False, separators=(",", ":"))
+    
     # Write timestamped snapshot
     timestamped_path = _audit_path(role, generated_at)
     tmp_path = f"{timestamped_path}.tmp"
     
     with _LOCK:
         with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(audit_data, f, ensure_ascii=False, indent=2)
+            f.write(payload)
         os.replace(tmp_path, timestamped_path)
         
         # Also write latest snapshot for easy access
@@ -101,7 +104,7 @@ def write_audit_snapshot(
         tmp_latest = f"{latest_path}.tmp"
         
         with open(tmp_latest, "w", encoding="utf-8") as f:
-            json.dump(audit_data, f, ensure_ascii=False, indent=2)
+            f.write(payload)
         os.replace(tmp_latest, latest_path)
 
 
@@ -6,10 +6,18 @@ from functools import lru_cache
 from app.storage.event_store import load_all_events
 
 
-def build_state_from_events(events: List[Dict]) -> Dict[str, Dict]:
+def build_state_from_events(
+    events: List[Dict],
+    base_state: Optional[Dict[str, Dict]] = None,
+) -> Dict[str, Dict]:
     """
     Replay all domain events and build the current shipment read model.
 
+    Pass ``base_state`` (a read model built from an earlier prefix of
+    the same log) to fold only the events appended since; it is updated
+    in place and returned. Replay is deterministic, so folding the tail
+    gives the same result as replaying the whole log.
+
     SINGLE SOURCE OF TRUTH (SSOT) for:
     - Shipment lifecycle state
     - Geo projections (source / destination / states)
@@ -18,11 +26,12 @@ def build_state_from_events(events: List[Dict]) -> Dict[str, Dict]:
 
     ⚠️ STRICT RULES:
     - No business logic
-    - No mutations outside this function
+    - No mutations outside this function, except ``base_state``,
+      which is folded into in place by design
     - Deterministic replay only
     """
 
-    shipments: Dict[str, Dict] = {}
+    shipments: Dict[str, Dict] = {} if base_state is None else base_state
 
     for event in events:
         shipment_id: str = event["shipment_id"]
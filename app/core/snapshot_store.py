@@ -33,6 +33,11 @@ def _snapshot_path(name: str) -> str:
     return os.path.join(_SNAPSHOT_DIR, f"{name}.json")
 
 
+def _dumps(data: Any) -> str:
+    # Snapshots are machine-read: compact separators, no indentation
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
 # ==================================================
 # WRITE SNAPSHOT (ATOMIC)
 # ==================================================
@@ -49,11 +54,46 @@ def write_snapshot(name: str, data: Any) -> None:
 
     with _LOCK:
         with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write(_dumps(data))
 
         os.replace(tmp_path, path)
 
 
+def write_snapshot_batch(items: Dict[str, Any]) -> None:
+    """
+    Write several snapshots as one batch.
+
+    - Thread-safe (one lock hold for the whole batch)
+    - Each file is replaced atomically (fsynced temp file + replace)
+    - All temp files are written before the first replace, so the
+      publishes land close together; lock-free readers can still see
+      a mix of old and new files between two renames
+    - One directory fsync makes all the renames durable
+    """
+    staged = []
+
+    with _LOCK:
+        for name, data in items.items():
+            path = _snapshot_path(name)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(_dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            staged.append((tmp_path, path))
+
+        for tmp_path, path in staged:
+            os.replace(tmp_path, path)
+
+        # Directory fds are POSIX-only; elsewhere replace() is all we get
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(_SNAPSHOT_DIR, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+
 # ==================================================
 # READ SNAPSHOT (SAFE)
 # ==================================================
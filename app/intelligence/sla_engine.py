@@ -2,12 +2,17 @@
 
 from typing import Dict, List
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
+@lru_cache(maxsize=65536)
 def _parse_timestamp(ts: str) -> datetime:
     """
     Parse ISO timestamp, handling both timezone-aware and naive formats.
     Converts all to UTC timezone-aware for consistent comparison.
+
+    Memoized: a shipment's creation timestamp is re-parsed every time the
+    shipment is re-predicted, and datetimes are immutable so sharing is safe.
     """
     # Remove 'Z' suffix if present and parse
     ts_clean = ts.replace('Z', '+00:00')
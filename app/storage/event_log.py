@@ -273,6 +273,19 @@ def invalidate_event_cache():
     _events_cache_mtime = None
     _shipment_index = None
 
+def get_log_version() -> Tuple[int, int]:
+    """
+    Cheap fingerprint of the event log - O(1) stat, no read.
+    
+    Changes whenever an event is appended, so callers can skip
+    derived rebuilds while the log is unchanged.
+    """
+    try:
+        stat = SHIPMENTS_LOG.stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
 def read_all_events() -> List[Dict]:
     """
     Read ALL events from log - CACHED.
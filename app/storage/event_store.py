@@ -1,9 +1,10 @@
 # app/storage/event_store.py
 
 import json
+import os
 import uuid
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 EVENT_STORE_FILE = "event_store.jsonl"
 
@@ -42,3 +43,17 @@ def load_all_events() -> List[Dict]:
         pass  # No events yet
 
     return events
+
+
+def get_store_version() -> Tuple[int, int]:
+    """
+    Cheap fingerprint of the event store - O(1) stat, no read.
+
+    Changes whenever an event is appended, so callers can skip
+    rebuilds derived from the read model while the store is unchanged.
+    """
+    try:
+        stat = os.stat(EVENT_STORE_FILE)
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
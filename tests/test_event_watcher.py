@@ -0,0 +1,50 @@
+import threading
+import time
+
+import app.async_engine.event_watcher as event_watcher
+from app.async_engine.event_watcher import EventStoreWatcher
+
+
+def _append(path, line="{}\n"):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def _stat_poll_watcher(monkeypatch, path):
+    # Force the os.stat() fallback regardless of whether watchdog is installed
+    monkeypatch.setattr(event_watcher, "Observer", None)
+    monkeypatch.setattr(event_watcher, "STAT_POLL_INTERVAL_SECONDS", 0.05)
+    return EventStoreWatcher(str(path))
+
+
+def test_idle_store_times_out(monkeypatch, tmp_path):
+    path = tmp_path / "event_store.jsonl"
+    _append(path)
+    watcher = _stat_poll_watcher(monkeypatch, path)
+
+    started = time.monotonic()
+    assert watcher.wait_for_change(0.3) is False
+    assert time.monotonic() - started >= 0.3
+
+
+def test_append_during_wait_is_reported(monkeypatch, tmp_path):
+    path = tmp_path / "event_store.jsonl"
+    _append(path)
+    watcher = _stat_poll_watcher(monkeypatch, path)
+
+    timer = threading.Timer(0.1, _append, args=(path,))
+    timer.start()
+    try:
+        assert watcher.wait_for_change(5) is True
+    finally:
+        timer.join()
+
+
+def test_append_between_waits_is_not_lost(monkeypatch, tmp_path):
+    path = tmp_path / "event_store.jsonl"
+    watcher = _stat_poll_watcher(monkeypatch, path)
+
+    # Store created and appended while the caller was busy
+    _append(path)
+    assert watcher.wait_for_change(0) is True
+    assert watcher.wait_for_change(0.1) is False
@@ -0,0 +1,61 @@
+from app.core.read_model import build_state_from_events
+
+
+def _events():
+    return [
+        # SHP-1: first seen via a lifecycle event, creation arrives later
+        {"shipment_id": "SHP-1", "event_type": "STATE_CHANGED", "new_state": "PENDING",
+         "timestamp": "2026-01-01T08:00:00"},
+        {"shipment_id": "SHP-2", "event_type": "SHIPMENT_CREATED", "new_state": "CREATED",
+         "timestamp": "2026-01-01T09:00:00",
+         "metadata": {"source": "Pune", "destination": "Mysuru",
+                      "source_geo": {"state": "Maharashtra"},
+                      "destination_geo": {"state": "Karnataka"}}},
+        {"shipment_id": "SHP-1", "event_type": "SHIPMENT_CREATED", "new_state": "CREATED",
+         "timestamp": "2026-01-01T10:00:00",
+         "metadata": {"source": "Patna", "destination": "Kochi",
+                      "source_geo": {"state": "Bihar"},
+                      "destination_geo": {"state": "Kerala"}}},
+        {"shipment_id": "SHP-2", "event_type": "METADATA_UPDATED",
+         "timestamp": "2026-01-01T11:00:00",
+         "metadata": {"updated": {"destination": "Bengaluru"}}},
+        {"shipment_id": "SHP-1", "event_type": "STATE_CHANGED", "new_state": "IN_TRANSIT",
+         "timestamp": "2026-01-01T12:00:00"},
+        {"shipment_id": "SHP-3", "event_type": "METADATA_UPDATED",
+         "timestamp": "2026-01-01T13:00:00",
+         "metadata": {"updated": {"source": "Goa"}}},
+        {"shipment_id": "SHP-2", "event_type": "STATE_CHANGED", "new_state": "DELIVERED",
+         "timestamp": "2026-01-02T09:00:00"},
+        {"shipment_id": "SHP-3", "event_type": "SHIPMENT_CREATED", "new_state": "CREATED",
+         "timestamp": "2026-01-02T10:00:00",
+         "metadata": {"source_geo": {"state": "Goa"}, "destination_geo": None}},
+    ]
+
+
+def test_fold_matches_full_replay_at_every_split():
+    events = _events()
+    full = build_state_from_events(events)
+
+    for split in range(len(events) + 1):
+        state = build_state_from_events(events[:split])
+        folded = build_state_from_events(events[split:], state)
+
+        assert folded is state
+        assert folded == full, f"fold diverged when split at {split}"
+
+
+def test_fold_in_several_steps_matches_full_replay():
+    events = _events()
+    full = build_state_from_events(events)
+
+    state = build_state_from_events([])
+    for start in range(0, len(events), 3):
+        build_state_from_events(events[start:start + 3], state)
+
+    assert state == full
+
+
+if __name__ == "__main__":
+    test_fold_matches_full_replay_at_every_split()
+    test_fold_in_several_steps_matches_full_replay()
+    print("✅ Incremental fold matches full replay")
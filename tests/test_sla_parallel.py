@@ -0,0 +1,34 @@
+import app.async_engine.snapshot_worker as snapshot_worker
+from app.async_engine.snapshot_worker import compute_sla_snapshot
+from app.core.read_model import build_state_from_events
+
+
+def _event(shipment_id, hour, state="IN_TRANSIT"):
+    return {
+        "shipment_id": shipment_id,
+        "event_type": "STATE_CHANGED",
+        "new_state": state,
+        "timestamp": f"2026-01-01T{hour:02d}:00:00",
+    }
+
+
+def _shipments():
+    events = [_event(f"SHP-{i}", i % 24) for i in range(40)]
+    events += [_event(f"SHP-{i}", 23, "DELIVERED") for i in range(0, 40, 3)]
+    return build_state_from_events(events)
+
+
+def test_pool_fan_out_matches_serial(monkeypatch):
+    shipments = _shipments()
+    serial = compute_sla_snapshot(shipments, None)
+
+    monkeypatch.setattr(snapshot_worker, "SLA_PARALLEL_MIN_SHIPMENTS", 1)
+    try:
+        parallel = compute_sla_snapshot(shipments, None)
+        assert snapshot_worker._executor is not None
+    finally:
+        snapshot_worker._shutdown_executor()
+
+    assert parallel == serial
+    assert snapshot_worker._executor is None
+
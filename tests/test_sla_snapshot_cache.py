@@ -0,0 +1,65 @@
+from app.async_engine.snapshot_worker import compute_sla_snapshot
+from app.core.read_model import build_state_from_events
+
+
+def _event(shipment_id, hour, day=1):
+    return {
+        "shipment_id": shipment_id,
+        "event_type": "STATE_CHANGED",
+        "new_state": "IN_TRANSIT",
+        "timestamp": f"2026-01-{day:02d}T{hour:02d}:00:00",
+    }
+
+
+def _cold(shipments):
+    return compute_sla_snapshot(shipments, None)
+
+
+def test_dirty_update_matches_cold_snapshot():
+    first = [_event(f"SHP-{i}", i) for i in range(5)] + [_event("SHP-0", 12)]
+    later = [_event("SHP-1", 9, day=3), _event("SHP-1", 11, day=4), _event("SHP-9", 6, day=2)]
+
+    shipments = build_state_from_events(first)
+    _cold(shipments)
+
+    build_state_from_events(later, shipments)
+    incremental = compute_sla_snapshot(shipments, {e["shipment_id"] for e in later})
+
+    assert incremental == _cold(shipments)
+    assert set(incremental) == set(shipments)
+
+
+def test_dirty_id_missing_from_read_model_is_dropped():
+    shipments = build_state_from_events([_event("SHP-A", 1), _event("SHP-B", 2)])
+    _cold(shipments)
+
+    del shipments["SHP-B"]
+    incremental = compute_sla_snapshot(shipments, {"SHP-B"})
+
+    assert "SHP-B" not in incremental
+    assert incremental == _cold(shipments)
+
+
+def test_cold_snapshot_forgets_previous_shipments():
+    _cold(build_state_from_events([_event("SHP-OLD", 1)]))
+
+    snapshot = _cold(build_state_from_events([_event("SHP-NEW", 1)]))
+
+    assert set(snapshot) == {"SHP-NEW"}
+
+
+def test_returned_snapshot_is_not_the_cache():
+    shipments = build_state_from_events([_event("SHP-A", 1)])
+    snapshot = _cold(shipments)
+
+    snapshot.pop("SHP-A")
+
+    assert "SHP-A" in compute_sla_snapshot(shipments, set())
+
+
+if __name__ == "__main__":
+    test_dirty_update_matches_cold_snapshot()
+    test_dirty_id_missing_from_read_model_is_dropped()
+    test_cold_snapshot_forgets_previous_shipments()
+    test_returned_snapshot_is_not_the_cache()
+    print("✅ Incremental SLA snapshot matches cold rebuild")